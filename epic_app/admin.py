@@ -13,6 +13,7 @@ from epic_app.models.epic_answers import (
     EvolutionAnswer,
     MultipleChoiceAnswer,
 )
+from epic_app.models.epic_jobs import EvolutionGraphJob, ImportJob
 from epic_app.models.epic_questions import (
     EvolutionQuestion,
     KeyAgencyActionsQuestion,
@@ -38,3 +39,5 @@ admin.site.register(LinkagesQuestion, LnkAdmin)
 admin.site.register(AgreementAnswer)
 admin.site.register(EvolutionAnswer)
 admin.site.register(MultipleChoiceAnswer)
+admin.site.register(EvolutionGraphJob)
+admin.site.register(ImportJob)
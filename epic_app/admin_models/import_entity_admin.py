@@ -1,10 +1,13 @@
 import abc
 
 from django import forms
-from django.contrib import admin
-from django.shortcuts import redirect, render
+from django.contrib import admin, messages
+from django.core.validators import FileExtensionValidator
+from django.forms import ValidationError
+from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import path
 
+from epic_app.background_jobs import submit_background_job
 from epic_app.importers.xlsx import (
     BaseEpicImporter,
     EpicAgencyImporter,
@@ -13,17 +16,29 @@ from epic_app.importers.xlsx import (
     KeyAgencyActionsQuestionImporter,
     NationalFrameworkQuestionImporter,
 )
+from epic_app.models.epic_jobs import ImportJob
 
 
 class XlsxImportForm(forms.Form):
     """
-    Simple form to allow importing a 'xlsx' file.
+    Simple form to allow importing a 'xlsx' (or 'csv' / 'parquet') file.
 
     Args:
         forms (forms.Form): Default Django form.
     """
 
-    xlsx_file = forms.FileField()
+    xlsx_file = forms.FileField(
+        validators=[
+            FileExtensionValidator(
+                [f_ext.lstrip(".") for f_ext in BaseEpicImporter.file_readers]
+            )
+        ],
+        help_text=f"Supported formats: {', '.join(BaseEpicImporter.file_readers)}.",
+    )
+    differential = forms.BooleanField(
+        required=False,
+        help_text="Only apply the differences with the existing entities, keeping the answers of the unchanged questions.",
+    )
 
 
 class ImportEntityAdmin(admin.ModelAdmin):
@@ -44,12 +59,13 @@ class ImportEntityAdmin(admin.ModelAdmin):
         urls = super().get_urls()
         my_urls = [
             path("import-xlsx/", self.import_xlsx),
+            path("import-xlsx/jobs/<uuid:job_id>/", self.import_job_status),
         ]
         return my_urls + urls
 
     def import_xlsx(self, request):
         """
-        Imports a csv file into the EPIC database structure.
+        Saves the uploaded file and queues its import into the EPIC database structure, redirecting right away to the page showing the import progress.
 
         Args:
             request (HTTPRequest): HTML request.
@@ -57,20 +73,71 @@ class ImportEntityAdmin(admin.ModelAdmin):
         Returns:
             HTTPRequest: HTML response.
         """
+        if request.method == "POST" and "preview" in request.POST:
+            return self.preview_xlsx(request)
         if request.method == "POST":
-            try:
-                self.get_importer().import_file(request.FILES["xlsx_file"])
-                self.message_user(request, "Your xlsx file has been imported")
-            except:
+            form = XlsxImportForm(request.POST, request.FILES)
+            if not form.is_valid():
                 self.message_user(
-                    request, "It was not possible to import the requested xlsx file."
+                    request,
+                    "It was not possible to import the requested xlsx file:\n"
+                    + "\n".join(
+                        message
+                        for field_errors in form.errors.values()
+                        for message in field_errors
+                    ),
+                    level=messages.ERROR,
                 )
-            return redirect("..")
+                return redirect("..")
+            import_job = ImportJob.create_from_upload(
+                type(self.get_importer()),
+                form.cleaned_data["xlsx_file"],
+                differential=form.cleaned_data["differential"],
+                requested_by=request.user,
+            )
+            submit_background_job(import_job.run)
+            self.message_user(request, "Your xlsx file is being imported")
+            return redirect(f"jobs/{import_job.id}/")
 
         form = XlsxImportForm()
         payload = {"form": form}
         return render(request, "admin/xlsx_form.html", payload)
 
+    def import_job_status(self, request, job_id):
+        """
+        Shows the progress of an import job and, once done, its summary or errors.
+
+        Args:
+            request (HTTPRequest): HTML request.
+            job_id (UUID): `ImportJob` id.
+
+        Returns:
+            HTTPRequest: HTML response.
+        """
+        import_job = get_object_or_404(ImportJob, id=job_id)
+        return render(request, "admin/import_job.html", {"import_job": import_job})
+
+    def preview_xlsx(self, request):
+        """
+        Shows the validation errors and the changes an import of the uploaded file would apply, without importing it.
+
+        Args:
+            request (HTTPRequest): HTML request.
+
+        Returns:
+            HTTPRequest: HTML response.
+        """
+        form = XlsxImportForm(request.POST, request.FILES)
+        payload = {"form": form}
+        if form.is_valid():
+            change_set = self.get_importer().preview_file(
+                form.cleaned_data["xlsx_file"], form.cleaned_data["differential"]
+            )
+            payload["preview_errors"] = change_set.errors
+            payload["preview_warnings"] = change_set.warnings
+            payload["preview_counts"] = change_set.get_counts()
+        return render(request, "admin/xlsx_form.html", payload)
+
     @abc.abstractmethod
     def get_importer(self) -> BaseEpicImporter:
         raise NotImplementedError("Should be implemented in concrete class.")
@@ -7,3 +7,8 @@ class EpicAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "epic_app"
     verbose_name = "An Epic App"
+
+    def ready(self) -> None:
+        from epic_app.signals import connect_data_versions
+
+        connect_data_versions()
@@ -0,0 +1,47 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.db import connection
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "BACKGROUND_JOBS_WORKERS", 2),
+                thread_name_prefix="epic_background_job",
+            )
+    return _executor
+
+
+def submit_background_job(func: Callable[..., Any], *args, **kwargs) -> Future:
+    """
+    Runs `func` in the process-wide pool of background threads, so requests can
+    return before long running work (e.g. the ERAM visuals) is done.
+    The amount of threads is defined by `settings.BACKGROUND_JOBS_WORKERS`.
+
+    Args:
+        func (Callable[..., Any]): Function to run in the background.
+
+    Returns:
+        Future: Future with the result of `func`.
+    """
+
+    def run_job() -> Any:
+        try:
+            return func(*args, **kwargs)
+        except Exception as e_info:
+            logging.exception(e_info)
+            raise
+        finally:
+            # Each thread gets its own database connection, do not leak it.
+            connection.close()
+
+    return _get_executor().submit(run_job)
@@ -0,0 +1,71 @@
+import hashlib
+from typing import Dict, List
+
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import quote_etag
+from rest_framework.request import Request
+
+from epic_app.models.epic_data_version import DataVersion, DataVersionType
+
+
+class _ConditionalResponse(Exception):
+    """
+    Raised to stop handling a request whose conditional headers already match.
+    """
+
+    def __init__(self, response: HttpResponseBase) -> None:
+        self.response = response
+
+
+class ConditionalGetMixin:
+    """
+    Adds an `ETag` header to the GET responses of a viewset, based on the
+    `DataVersion` of the data it shows and on the requesting user. Requests whose
+    `If-None-Match` header matches get a `304 Not Modified` right after the
+    permission checks, so neither the queries nor the serializers are run.
+    No `Last-Modified` is given, as its one second resolution would hide changes
+    done within the same second; the versions change on every write.
+    """
+
+    conditional_data_versions: List[DataVersionType] = [DataVersionType.DOMAIN]
+    # Actions depending on other data than the default one (e.g. user answers).
+    conditional_action_data_versions: Dict[str, List[DataVersionType]] = {}
+
+    def get_conditional_data_versions(self) -> List[DataVersionType]:
+        return self.conditional_action_data_versions.get(
+            self.action, self.conditional_data_versions
+        )
+
+    def _get_etag(self, request: Request) -> str:
+        _versions = DataVersion.get_versions(self.get_conditional_data_versions())
+        _etag_key = ":".join(
+            [str(request.user.pk), request.accepted_renderer.format]
+            + list(map(str, _versions.values()))
+        )
+        return quote_etag(hashlib.md5(_etag_key.encode()).hexdigest())
+
+    def initial(self, request: Request, *args, **kwargs) -> None:
+        super().initial(request, *args, **kwargs)
+        self._etag = None
+        if request.method not in ("GET", "HEAD"):
+            return
+        self._etag = self._get_etag(request)
+        _response = get_conditional_response(request._request, etag=self._etag)
+        if _response is not None:
+            raise _ConditionalResponse(_response)
+
+    def handle_exception(self, exc: Exception) -> HttpResponseBase:
+        if isinstance(exc, _ConditionalResponse):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(
+        self, request: Request, response: HttpResponseBase, *args, **kwargs
+    ) -> HttpResponseBase:
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, "_etag", None) and response.status_code in (200, 304):
+            response["ETag"] = self._etag
+            # Responses depend on the authenticated user.
+            patch_vary_headers(response, ("Authorization",))
+        return response
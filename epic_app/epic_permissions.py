@@ -45,6 +45,6 @@ class IsInstanceOwner(permissions.BasePermission):
 
     def has_permission(self, request: HttpRequest, view) -> bool:
         try:
-            return request.user.pk == view.get_object().user.pk
+            return request.user.pk == view.get_object().user_id
         except:
             return False
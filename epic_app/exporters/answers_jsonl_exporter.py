@@ -0,0 +1,120 @@
+import gzip
+import itertools
+import json
+from pathlib import Path
+from typing import IO, Dict, Iterator, List, Type
+
+from epic_app.models.epic_answers import Answer, MultipleChoiceAnswer
+from epic_app.utils import get_submodel_type_list
+
+
+def open_jsonl_file(jsonl_file: Path, mode: str) -> IO[str]:
+    """
+    Opens a JSON lines file as text, compressed with gzip when its extension is `.gz`.
+
+    Args:
+        jsonl_file (Path): JSON lines file.
+        mode (str): Either "r" (read) or "w" (write).
+
+    Returns:
+        IO[str]: Text stream of the file.
+    """
+    if jsonl_file.suffix == ".gz":
+        return gzip.open(jsonl_file, f"{mode}t", encoding="utf-8")
+    return jsonl_file.open(mode, encoding="utf-8")
+
+
+def get_answer_data_fields(answer_type: Type[Answer]) -> List[str]:
+    """
+    Gets the names of the fields containing the data of an `Answer` subtype.
+    """
+    return [
+        field.name
+        for field in answer_type._meta.local_concrete_fields
+        if not field.primary_key
+    ]
+
+
+class AnswersJsonlExporter:
+    """
+    Exports all the answers, of every `Answer` subtype, as JSON lines so they can be moved between EPIC instances. Each line references its user, question and selected programs by their natural keys (username, program and question title, program names) instead of their ids, and the answers are read in chunks so they are never loaded in memory at once.
+    """
+
+    def __init__(self, chunk_size: int = 2000) -> None:
+        self.chunk_size = chunk_size
+
+    def _get_selected_programs(self, answer_ids: List[int]) -> Dict[int, List[str]]:
+        selected_programs = {}
+        for answer_id, program_name in (
+            MultipleChoiceAnswer.selected_programs.through.objects.filter(
+                multiplechoiceanswer_id__in=answer_ids
+            )
+            .order_by("program_id")
+            .values_list("multiplechoiceanswer_id", "program__name")
+        ):
+            selected_programs.setdefault(answer_id, []).append(program_name)
+        return selected_programs
+
+    def get_answer_rows(self, answer_type: Type[Answer]) -> Iterator[dict]:
+        """
+        Lazily gets the answers of the given subtype as plain (JSON) data.
+
+        Args:
+            answer_type (Type[Answer]): `Answer` subtype to export.
+
+        Yields:
+            Iterator[dict]: Data of each answer.
+        """
+        _fields = get_answer_data_fields(answer_type)
+        _answer_values = (
+            answer_type.objects.order_by("pk")
+            .values_list(
+                "pk",
+                "user__username",
+                "question__program__name",
+                "question__title",
+                *_fields,
+            )
+            .iterator(chunk_size=self.chunk_size)
+        )
+        while True:
+            _chunk = list(itertools.islice(_answer_values, self.chunk_size))
+            if not _chunk:
+                return
+            selected_programs = {}
+            if answer_type == MultipleChoiceAnswer:
+                selected_programs = self._get_selected_programs(
+                    [a_values[0] for a_values in _chunk]
+                )
+            for answer_id, username, program, question, *values in _chunk:
+                answer_row = dict(
+                    type=answer_type.__name__,
+                    user=username,
+                    program=program,
+                    question=question,
+                    **dict(zip(_fields, values)),
+                )
+                if answer_type == MultipleChoiceAnswer:
+                    answer_row["selected_programs"] = selected_programs.get(
+                        answer_id, []
+                    )
+                yield answer_row
+
+    def export(self, output_file: Path) -> int:
+        """
+        Writes all the answers into the given JSON lines file (gzipped when its extension is `.gz`).
+
+        Args:
+            output_file (Path): File to write.
+
+        Returns:
+            int: Number of exported answers.
+        """
+        n_answers = 0
+        with open_jsonl_file(output_file, "w") as jsonl_stream:
+            for answer_type in get_submodel_type_list(Answer):
+                for answer_row in self.get_answer_rows(answer_type):
+                    jsonl_stream.write(json.dumps(answer_row, ensure_ascii=False))
+                    jsonl_stream.write("\n")
+                    n_answers += 1
+        return n_answers
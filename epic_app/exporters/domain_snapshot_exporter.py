@@ -0,0 +1,138 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+from typing import List
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from epic_app.models.epic_data_version import DataVersion, DataVersionType
+from epic_app.models.epic_questions import Question
+from epic_app.models.models import Agency, Area, Group, Program, ProgramReference
+from epic_app.utils import get_submodel_type_list
+
+
+class DomainSnapshotFile:
+    """
+    Compact, versioned snapshot of the whole EPIC domain (areas, groups, programs,
+    agencies and questions) stored as gzipped JSON within the media root, so clients
+    can bootstrap with a single static file instead of the nested domain endpoints.
+    Its version changes whenever the domain `DataVersion` does.
+    """
+
+    _media_dir = "domain_snapshots"
+    _suffix = ".json.gz"
+
+    def __init__(self, version: str) -> None:
+        self.version = version
+
+    @classmethod
+    def get_current(cls) -> "DomainSnapshotFile":
+        """
+        Gets the snapshot matching the current domain, which might not be exported yet.
+
+        Returns:
+            DomainSnapshotFile: Snapshot of the current domain version.
+        """
+        _domain_version = DataVersion.get_versions([DataVersionType.DOMAIN])
+        _version_key = str(_domain_version[DataVersionType.DOMAIN.value])
+        return cls(hashlib.sha1(_version_key.encode()).hexdigest()[:16])
+
+    @classmethod
+    def get_snapshots_dir(cls) -> Path:
+        return Path(settings.MEDIA_ROOT) / cls._media_dir
+
+    @property
+    def path(self) -> Path:
+        return self.get_snapshots_dir() / f"domain_{self.version}{self._suffix}"
+
+    def _get_questions(self) -> List[dict]:
+        questions = []
+        for q_type in get_submodel_type_list(Question):
+            _fields = [
+                f.attname for f in q_type._meta.concrete_fields if not f.primary_key
+            ]
+            questions.extend(
+                dict(id=q_values.pop("pk"), type=q_type.__name__, **q_values)
+                for q_values in q_type.objects.values("pk", *_fields)
+            )
+        return sorted(questions, key=lambda q_values: q_values["id"])
+
+    def _get_programs(self) -> List[dict]:
+        program_agencies = defaultdict(list)
+        for program_id, agency_id in Program.agencies.through.objects.values_list(
+            "program_id", "agency_id"
+        ):
+            program_agencies[program_id].append(agency_id)
+        program_references = defaultdict(list)
+        for reference in ProgramReference.objects.values(
+            "program_id", "description", "link"
+        ):
+            program_references[reference.pop("program_id")].append(reference)
+        return [
+            dict(
+                **p_values,
+                agencies=sorted(program_agencies[p_values["id"]]),
+                references=program_references[p_values["id"]],
+            )
+            for p_values in Program.objects.order_by("id").values(
+                "id", "name", "description", "group_id"
+            )
+        ]
+
+    def get_content(self) -> dict:
+        """
+        Gets the whole domain as plain data, with one query per table.
+
+        Returns:
+            dict: Domain content of the snapshot.
+        """
+        return dict(
+            version=self.version,
+            areas=list(Area.objects.order_by("id").values("id", "name")),
+            groups=list(Group.objects.order_by("id").values("id", "name", "area_id")),
+            agencies=list(Agency.objects.order_by("id").values("id", "name")),
+            programs=self._get_programs(),
+            questions=self._get_questions(),
+        )
+
+    def export(self) -> Path:
+        """
+        Writes the gzipped snapshot, replacing the snapshots of previous versions.
+
+        Returns:
+            Path: Location of the exported snapshot.
+        """
+        _snapshots_dir = self.get_snapshots_dir()
+        _snapshots_dir.mkdir(parents=True, exist_ok=True)
+        _content = json.dumps(
+            self.get_content(), cls=DjangoJSONEncoder, separators=(",", ":")
+        )
+        # Write to a temporary file first so a snapshot is never served half written.
+        _fd, _tmp_file = tempfile.mkstemp(dir=_snapshots_dir, suffix=".tmp")
+        with os.fdopen(_fd, "wb") as _tmp_stream:
+            _tmp_stream.write(gzip.compress(_content.encode("utf-8"), mtime=0))
+        os.replace(_tmp_file, self.path)
+        for _old_snapshot in _snapshots_dir.glob(f"*{self._suffix}"):
+            if _old_snapshot != self.path:
+                _old_snapshot.unlink(missing_ok=True)
+        return self.path
+
+    def get_or_export(self) -> Path:
+        if not self.path.is_file():
+            return self.export()
+        return self.path
+
+
+def export_domain_snapshot() -> Path:
+    """
+    Exports the snapshot of the current domain, meant to be run after each import.
+
+    Returns:
+        Path: Location of the exported snapshot.
+    """
+    return DomainSnapshotFile.get_current().export()
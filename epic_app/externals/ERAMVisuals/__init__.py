@@ -1,3 +1,12 @@
 from pathlib import Path
 
 eram_visuals_script = Path(__file__).parent / "eram_visuals.R"
+# R packages loaded by `eram_visuals.R`, installed with `manage.py install_eram_packages`.
+eram_visuals_r_packages = (
+    "scales",
+    "ggplot2",
+    "dplyr",
+    "readr",
+    "stringr",
+    "RColorBrewer",
+)
@@ -0,0 +1,242 @@
+import atexit
+import logging
+import queue
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import IO, List, Optional
+
+from django.conf import settings
+
+from epic_app.externals.ERAMVisuals import eram_visuals_script
+from epic_app.externals.ERAMVisuals.eram_visuals_wrapper import EramVisualsRunner
+from epic_app.externals.external_command import ExternalCommandTimeout, get_job_logger
+from epic_app.externals.external_wrapper_base import ExternalRunner
+
+
+class EramVisualsWorkerDied(Exception):
+    """
+    Raised when the `Rscript` process of a worker is no longer available.
+    """
+
+    pass
+
+
+class EramVisualsWorker:
+    """
+    Long-lived `Rscript` process running `eram_visuals.R` in worker mode.
+    The R packages are loaded once at start-up, afterwards each render job only
+    costs the plotting time.
+    """
+
+    _ready_token = "ERAM_READY"
+    _done_token = "ERAM_DONE"
+    _failed_token = "ERAM_FAILED"
+
+    def __init__(self, command: List[str], timeout: float = 120) -> None:
+        self._command = command
+        self._timeout = timeout
+        self._process: Optional[subprocess.Popen] = None
+        self._lines: Optional[queue.Queue] = None
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process else None
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        """
+        Starts the `Rscript` process and waits until it has loaded its packages.
+
+        Raises:
+            ExternalCommandTimeout: When the process is not ready within the timeout.
+        """
+        self.stop()
+        logging.info(f"Starting ERAM visuals worker: {self._command}")
+        self._process = subprocess.Popen(
+            self._command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        # Reading happens on a separate thread so we can stop waiting for it.
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=self._pipe_lines,
+            args=(self._process.stdout, self._lines),
+            daemon=True,
+        ).start()
+        self._read_until_token(logging.getLogger(__name__))
+
+    def stop(self) -> None:
+        if not self._process:
+            return
+        if self._process.poll() is None:
+            self._process.kill()
+        self._process.wait()
+        self._process = None
+
+    @staticmethod
+    def _pipe_lines(stdout: IO[str], lines: queue.Queue) -> None:
+        for line in stdout:
+            lines.put(line)
+        # End of stream, the process is gone.
+        lines.put(None)
+
+    def _read_until_token(self, logger: logging.Logger) -> str:
+        # R (and its packages) might print their own messages on stdout,
+        # so we skip (and log) every line that is not part of our protocol.
+        _deadline = time.monotonic() + self._timeout
+        while True:
+            try:
+                line = self._lines.get(timeout=max(_deadline - time.monotonic(), 0))
+            except queue.Empty:
+                # A hung process would otherwise pin this worker forever.
+                self.stop()
+                raise ExternalCommandTimeout(
+                    f"ERAM visuals worker did not answer within {self._timeout} seconds."
+                )
+            if line is None:
+                raise EramVisualsWorkerDied(
+                    f"ERAM visuals worker exited with code {self._process.wait()}"
+                )
+            line = line.strip()
+            if line.startswith(
+                (self._ready_token, self._done_token, self._failed_token)
+            ):
+                return line
+            logger.info(line)
+
+    def render(
+        self,
+        input_file: Path,
+        output_dir: Path,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        """
+        Renders the ERAM visuals of `input_file` into `output_dir`.
+
+        Args:
+            input_file (Path): Csv file with the evolution summary.
+            output_dir (Path): Directory where the png and pdf will be written.
+            logger (Optional[logging.Logger], optional): Logger for the job output.
+
+        Raises:
+            EramVisualsWorkerDied: When the process is (or became) unavailable.
+            ExternalCommandTimeout: When the job did not finish within the timeout.
+            ValueError: When the R script could not render the given data.
+        """
+        if not self.is_alive():
+            raise EramVisualsWorkerDied("ERAM visuals worker is not running.")
+        try:
+            self._process.stdin.write(
+                f"{Path(input_file).as_posix()}\t{Path(output_dir).as_posix()}\n"
+            )
+            self._process.stdin.flush()
+        except (BrokenPipeError, OSError) as e_info:
+            raise EramVisualsWorkerDied(str(e_info))
+        _result = self._read_until_token(logger or logging.getLogger(__name__))
+        if _result.startswith(self._failed_token):
+            raise ValueError(_result[len(self._failed_token) :].strip())
+
+
+class EramVisualsWorkerPool:
+    """
+    Pool of warm `EramVisualsWorker`. Workers are started lazily, reused between
+    jobs and restarted whenever their process has died.
+    """
+
+    def __init__(self, command: List[str], size: int, timeout: float = 120) -> None:
+        self._command = command
+        self._idle_workers: queue.Queue = queue.Queue()
+        for _ in range(max(size, 1)):
+            self._idle_workers.put(EramVisualsWorker(command, timeout))
+
+    def render(
+        self,
+        input_file: Path,
+        output_dir: Path,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        _worker: EramVisualsWorker = self._idle_workers.get()
+        try:
+            try:
+                if not _worker.is_alive():
+                    _worker.start()
+                _worker.render(input_file, output_dir, logger)
+            except EramVisualsWorkerDied as e_info:
+                # Give it one more try with a fresh process.
+                logging.warning(f"Restarting ERAM visuals worker: {e_info}")
+                _worker.start()
+                _worker.render(input_file, output_dir, logger)
+        except ValueError:
+            # The job data could not be rendered, the worker itself is fine.
+            raise
+        except Exception:
+            # Reset the worker so it gets started again on its next job.
+            _worker.stop()
+            raise
+        finally:
+            # Always give the worker back, otherwise the next job waits for it forever.
+            self._idle_workers.put(_worker)
+
+    def shutdown(self) -> None:
+        while not self._idle_workers.empty():
+            self._idle_workers.get().stop()
+
+
+_pool: Optional[EramVisualsWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def _get_worker_command() -> List[str]:
+    try:
+        _rscript = EramVisualsRunner().get_rscript().as_posix()
+    except Exception as e_info:
+        logging.error(e_info)
+        _rscript = "Rscript"
+    return [_rscript, eram_visuals_script.as_posix(), "--worker"]
+
+
+def get_eram_visuals_worker_pool() -> EramVisualsWorkerPool:
+    """
+    Gets (or creates) the process-wide pool of ERAM visuals workers.
+    The amount of workers is defined by `settings.ERAM_VISUALS_WORKERS` and their
+    timeout by `settings.ERAM_VISUALS_TIMEOUT`.
+
+    Returns:
+        EramVisualsWorkerPool: Shared worker pool.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = EramVisualsWorkerPool(
+                _get_worker_command(),
+                getattr(settings, "ERAM_VISUALS_WORKERS", 2),
+                getattr(settings, "ERAM_VISUALS_TIMEOUT", 120),
+            )
+            atexit.register(_pool.shutdown)
+    return _pool
+
+
+class EramVisualsPoolRunner(ExternalRunner):
+    """
+    `ExternalRunner` rendering the ERAM visuals through the shared pool of warm
+    R workers instead of starting a new `Rscript` for each request.
+    """
+
+    def _get_pool(self) -> EramVisualsWorkerPool:
+        return get_eram_visuals_worker_pool()
+
+    def run(self, *args, **kwargs) -> None:
+        assert eram_visuals_script.exists()
+        _output_dir = Path(kwargs.get("output_dir", eram_visuals_script.parent))
+        with get_job_logger(__name__, _output_dir / "eram.log") as _logger:
+            self._get_pool().render(
+                input_file=kwargs["input_file"], output_dir=_output_dir, logger=_logger
+            )
@@ -0,0 +1,296 @@
+import csv
+import math
+import textwrap
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from reportlab.graphics import renderPDF, renderPM
+from reportlab.graphics.shapes import Drawing, Group, String, Wedge
+from reportlab.lib import colors
+from reportlab.lib.units import inch
+
+from epic_app.externals.ERAMVisuals.eram_visuals_wrapper import EramVisualsOutput
+from epic_app.externals.external_wrapper_base import ExternalRunner
+
+
+class _RadialBar:
+    group: str
+    individual: str
+    value: Optional[float]
+
+    def __init__(self, group: str, individual: str, value: Optional[float]) -> None:
+        self.group = group
+        self.individual = individual
+        self.value = value
+
+
+class EramVisualsReportlabRunner(ExternalRunner):
+    """
+    Pure python `ExternalRunner` drawing the same radial bar plot as `eram_visuals.R`
+    with ReportLab graphics, so no R installation is required.
+    """
+
+    # Same defaults as `ERAMRadialPlot` in `eram_visuals.R`.
+    empty_bar = 2
+    ymin = -60
+    ymax = 140
+    group_levels = ["P", "I", "C", "R", "E"]
+    # RColorBrewer "Set2" palette, interpolated like `colorRampPalette` in R.
+    palette_colors = [
+        "#66C2A5",
+        "#FC8D62",
+        "#8DA0CB",
+        "#E78AC3",
+        "#A6D854",
+        "#FFD92F",
+        "#E5C494",
+        "#B3B3B3",
+    ]
+    # Colour of the groups not in `group_levels` (`na.value` of ggplot2 scales).
+    na_color = "#7F7F7F"
+    # Width at which the labels of the bars with and without value are wrapped.
+    label_width = 20
+    zero_label_width = 30
+    drawing_size = 8 * inch
+    png_dpi = 150
+
+    def _read_csv_rows(self, input_file: Path) -> List[Dict[str, str]]:
+        with Path(input_file).open(newline="", encoding="utf-8-sig") as csv_file:
+            _reader = csv.reader(csv_file, skipinitialspace=True)
+            _headers = [h.strip() for h in next(_reader)]
+            return [
+                dict(zip(_headers, map(str.strip, _row))) for _row in _reader if _row
+            ]
+
+    def _get_radial_bars(self, csv_rows: List[Dict[str, str]]) -> List[_RadialBar]:
+        """
+        Orders the rows per group and adds the 'empty bars' at the end of each group.
+        Values are rescaled from the [0, 4] range into [0, 80], zero values are kept as
+        empty bars with a faded label.
+        """
+        _levels = list(self.group_levels)
+        _levels.extend(
+            sorted({r["group"] for r in csv_rows if r["group"] not in _levels})
+        )
+        _bars = []
+        for _level in _levels:
+            _group_rows = [r for r in csv_rows if r["group"] == _level]
+            if not _group_rows and _level in self.group_levels:
+                # R keeps all factor levels, even the empty ones.
+                _bars.extend(
+                    _RadialBar(_level, "", None) for _ in range(self.empty_bar)
+                )
+                continue
+            for _row in _group_rows:
+                _value = max(float(_row["value"] or 0), 0)
+                _bars.append(_RadialBar(_level, _row["individual"], _value * 20))
+            _bars.extend(_RadialBar(_level, "", None) for _ in range(self.empty_bar))
+        return _bars
+
+    @classmethod
+    def get_ramp_colors(cls, n_colors: int) -> List[str]:
+        """
+        Gets `n_colors` evenly spaced along the `palette_colors` ramp, as
+        `colorRampPalette(palette_colors)(n_colors)` does in R (linear rgb interpolation).
+
+        Args:
+            n_colors (int): Amount of colors to get.
+
+        Returns:
+            List[str]: Hex colors.
+        """
+        _palette = [colors.HexColor(_color) for _color in cls.palette_colors]
+        _n_segments = len(_palette) - 1
+        ramp_colors = []
+        for n in range(n_colors):
+            _position = n / (n_colors - 1) * _n_segments if n_colors > 1 else 0
+            _segment = min(int(_position), _n_segments - 1)
+            _fraction = _position - _segment
+            _from, _to = _palette[_segment], _palette[_segment + 1]
+            _rgb = [
+                int(_c_from + (_c_to - _c_from) * _fraction + 0.5)
+                for _c_from, _c_to in zip(_from.bitmap_rgb(), _to.bitmap_rgb())
+            ]
+            ramp_colors.append("#{:02X}{:02X}{:02X}".format(*_rgb))
+        return ramp_colors
+
+    @staticmethod
+    def _get_cos(degrees: float) -> float:
+        return math.cos(math.radians(degrees))
+
+    @staticmethod
+    def _get_sin(degrees: float) -> float:
+        return math.sin(math.radians(degrees))
+
+    def _get_radius(self, y_value: float) -> float:
+        return (y_value - self.ymin) / (self.ymax - self.ymin) * self.drawing_size / 2
+
+    def _get_angle(self, bar_position: float, n_bars: int) -> float:
+        # Position 1 is at twelve o'clock, positions grow clockwise.
+        return 90 - 360 * (bar_position - 0.5) / n_bars
+
+    def _get_label(
+        self, text: str, bar_position: int, n_bars: int, y: float, width: int
+    ) -> Group:
+        _angle = self._get_angle(bar_position, n_bars)
+        _anchor = "start"
+        _text_angle = _angle
+        if _angle < -90:
+            _text_angle = _angle + 180
+            _anchor = "end"
+        _label = Group()
+        for n_line, _text_line in enumerate(textwrap.wrap(text, width)):
+            _label.add(
+                String(
+                    0,
+                    -n_line * 5,
+                    _text_line,
+                    fontSize=5.5,
+                    fontName="Helvetica",
+                    textAnchor=_anchor,
+                    fillColor=colors.black,
+                )
+            )
+        _center = self.drawing_size / 2
+        _radius = self._get_radius(y)
+        _label.translate(
+            _center + _radius * self._get_cos(_angle),
+            _center + _radius * self._get_sin(_angle),
+        )
+        _label.rotate(_text_angle)
+        return _label
+
+    def _get_drawing(self, bars: List[_RadialBar]) -> Drawing:
+        _drawing = Drawing(self.drawing_size, self.drawing_size)
+        _center = self.drawing_size / 2
+        _n_bars = len(bars)
+        _bar_width = 0.9 * 360 / _n_bars
+        _group_colors = dict(
+            zip(self.group_levels, self.get_ramp_colors(len(self.group_levels)))
+        )
+        _level_colors = {
+            _level: colors.HexColor(_group_colors.get(_level, self.na_color))
+            for _level in dict.fromkeys(b.group for b in bars)
+        }
+
+        def wedge(position: float, width: float, y_from: float, y_to: float, **kwargs):
+            _angle = self._get_angle(position, _n_bars)
+            return Wedge(
+                _center,
+                _center,
+                self._get_radius(y_to),
+                _angle - width / 2,
+                _angle + width / 2,
+                radius1=self._get_radius(y_from),
+                **kwargs,
+            )
+
+        # Bars and their labels.
+        for position, _bar in enumerate(bars, start=1):
+            if _bar.value is None:
+                continue
+            if _bar.value > 0:
+                _drawing.add(
+                    wedge(
+                        position,
+                        _bar_width,
+                        0,
+                        _bar.value,
+                        fillColor=_level_colors[_bar.group],
+                        strokeColor=None,
+                    )
+                )
+                _label = self._get_label(
+                    _bar.individual,
+                    position,
+                    _n_bars,
+                    _bar.value + 10,
+                    self.label_width,
+                )
+            else:
+                _label = self._get_label(
+                    _bar.individual, position, _n_bars, 0, self.zero_label_width
+                )
+                for _string in _label.contents:
+                    _string.fillColor = colors.Color(0, 0, 0, alpha=0.2)
+            _drawing.add(_label)
+
+        # Grid lines within the 'empty bars' gap after each group and the y-axis values.
+        _grey = colors.Color(0.5, 0.5, 0.5)
+        _gap_positions = [
+            position
+            for position, _bar in enumerate(bars, start=1)
+            if _bar.value is None
+        ]
+        for _grid_y in (0, 20, 40, 60, 80):
+            for position in _gap_positions:
+                _drawing.add(
+                    wedge(
+                        position,
+                        360 / _n_bars,
+                        _grid_y - 0.3,
+                        _grid_y + 0.3,
+                        fillColor=_grey,
+                        strokeColor=None,
+                    )
+                )
+            _label_angle = self._get_angle(_n_bars, _n_bars)
+            _label_radius = self._get_radius(_grid_y)
+            _drawing.add(
+                String(
+                    _center + _label_radius * self._get_cos(_label_angle),
+                    _center + _label_radius * self._get_sin(_label_angle),
+                    str(_grid_y // 20),
+                    fontSize=14,
+                    fontName="Helvetica-Bold",
+                    textAnchor="end",
+                    fillColor=_grey,
+                )
+            )
+
+        # Group base lines and titles.
+        for _level in _level_colors.keys():
+            _positions = [
+                position
+                for position, _bar in enumerate(bars, start=1)
+                if _bar.group == _level and _bar.value is not None
+            ]
+            if not _positions:
+                continue
+            _start, _end = min(_positions), max(_positions)
+            _span = (_end - _start) * 360 / _n_bars
+            _drawing.add(
+                wedge(
+                    (_start + _end) / 2,
+                    max(_span, 1),
+                    -5.8,
+                    -4.2,
+                    fillColor=colors.black,
+                    strokeColor=None,
+                )
+            )
+            _title_angle = self._get_angle((_start + _end) / 2, _n_bars)
+            _title_radius = self._get_radius(-20)
+            _drawing.add(
+                String(
+                    _center + _title_radius * self._get_cos(_title_angle),
+                    _center + _title_radius * self._get_sin(_title_angle) - 6,
+                    _level,
+                    fontSize=17,
+                    fontName="Helvetica-Bold",
+                    textAnchor="middle",
+                    fillColor=colors.black,
+                )
+            )
+        return _drawing
+
+    def run(self, *args, **kwargs) -> None:
+        _output = EramVisualsOutput(kwargs["output_dir"])
+        _csv_rows = self._read_csv_rows(kwargs["input_file"])
+        if not _csv_rows:
+            raise ValueError("No data available to generate the ERAM visuals.")
+        _drawing = self._get_drawing(self._get_radial_bars(_csv_rows))
+        renderPDF.drawToFile(_drawing, str(_output.pdf_output))
+        renderPM.drawToFile(
+            _drawing, str(_output.png_output), fmt="PNG", dpi=self.png_dpi
+        )
@@ -1,12 +1,14 @@
 import logging
-import platform
-import subprocess
-from abc import abstractmethod
+import shutil
 from os import environ
 from pathlib import Path
 from typing import List, Optional, Type
 
-from epic_app.externals.ERAMVisuals import eram_visuals_script
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from epic_app.externals.ERAMVisuals import eram_visuals_r_packages, eram_visuals_script
+from epic_app.externals.external_command import get_job_logger, run_external_command
 from epic_app.externals.external_wrapper_base import (
     ExternalRunner,
     ExternalRunnerOutput,
@@ -27,16 +29,15 @@ class EramVisualsOutput:
 
 
 class EramVisualsRunner(ExternalRunner):
-    def _set_logger(self, output_dir: Path) -> None:
-        _log_file = output_dir / "eram.log"
-        _log_file.unlink(missing_ok=True)
-        _log_file.touch()
-        _logger = logging.getLogger("")
-        _logger.setLevel(logging.INFO)
-        self._file_handler = logging.FileHandler(filename=_log_file, mode="w")
-        self._file_handler.setLevel(logging.INFO)
-        _logger.addHandler(self._file_handler)
-        logging.info("Initialized")
+    """
+    `ExternalRunner` starting one `Rscript` process per execution. The process is
+    invoked without a shell and killed after `settings.ERAM_VISUALS_TIMEOUT` seconds.
+    """
+
+    _log_file_name = "eram.log"
+
+    def _get_timeout(self) -> float:
+        return getattr(settings, "ERAM_VISUALS_TIMEOUT", 120)
 
     def _get_platform_runner(self) -> Path:
         # NOTE: Requires installing R in your system and defining a system variable
@@ -51,53 +52,73 @@ class EramVisualsRunner(ExternalRunner):
             raise FileNotFoundError(f"No RScript executable found at {_rscript_path}")
         return _rscript_path
 
+    def _get_fallback_runner(self) -> Path:
+        # Just give it a try in case it was not found a sys environment variable.
+        _rscript_path = shutil.which("Rscript")
+        if not _rscript_path:
+            raise FileNotFoundError("No Rscript executable found in the system PATH.")
+        return Path(_rscript_path)
+
+    def get_rscript(self) -> Path:
+        """
+        Gets the `Rscript` executable defined by the `RSCRIPT` environment variable,
+        otherwise the one available in the system PATH.
+
+        Returns:
+            Path: Location of the `Rscript` executable.
+        """
+        try:
+            return self._get_platform_runner()
+        except Exception as e_info:
+            logging.error(e_info)
+            return self._get_fallback_runner()
+
     def _get_command_values(self, dict_values: dict) -> List[Path]:
         _rcommand = [eram_visuals_script]
         _rcommand.extend(dict_values.values())
         return _rcommand
 
     def run(self, *args, **kwargs) -> None:
-        previous_exception = None
         assert eram_visuals_script.exists()
-        self._set_logger(kwargs.get("output_dir", eram_visuals_script.parent))
-        _command = ""
-        try:
-            _command = self._get_command(kwargs)
-        except Exception as previous_exception:
-            logging.error(previous_exception)
-            _command = self._get_fallback_command(kwargs)
-        if "windows" not in platform.platform().lower():
-            _command = " ".join(_command)
-        logging.info(_command)
-        _return_call = subprocess.call(_command, shell=True)
-        if _return_call != 0:
-            if previous_exception:
-                raise previous_exception
-            raise ValueError(f"Execution failed with code {_return_call}")
-
-    def _get_command(self, command_kwargs: List[Path]) -> str:
-        _command_args = list(
-            map(lambda x: x.as_posix(), self._get_command_values(command_kwargs))
+        _input_file = Path(kwargs["input_file"])
+        if not _input_file.is_file():
+            raise FileNotFoundError(f"No input file found at {_input_file}")
+        _output_dir = Path(kwargs.get("output_dir", eram_visuals_script.parent))
+        with get_job_logger(__name__, _output_dir / self._log_file_name) as _logger:
+            try:
+                _command = self._get_command(kwargs)
+            except Exception as platform_exception:
+                _logger.error(platform_exception)
+                try:
+                    _command = self._get_fallback_command(kwargs)
+                except FileNotFoundError:
+                    # The fallback is not available either, report the original cause.
+                    raise platform_exception
+            _result = run_external_command(
+                _command, timeout=self._get_timeout(), logger=_logger
+            )
+        if not _result.succeeded:
+            raise ValueError(f"Execution failed with code {_result.return_code}")
+
+    def _get_command_args(self, command_kwargs: dict) -> List[str]:
+        return list(
+            map(lambda x: Path(x).as_posix(), self._get_command_values(command_kwargs))
         )
+
+    def _get_command(self, command_kwargs: dict) -> List[str]:
         _command = [self._get_platform_runner().as_posix(), "--verbose"]
-        _command.extend(_command_args)
-        logging.info(f"Platform runner found, args: {_command}")
+        _command.extend(self._get_command_args(command_kwargs))
         return _command
 
-    def _get_fallback_command(self, command_kwargs: List[Path]) -> str:
-        # Just give it a try in case it was not found a sys environment variable.
-        _command_args = list(
-            map(lambda x: x.as_posix(), self._get_command_values(command_kwargs))
-        )
-        _command = ["Rscript", "--verbose"]
-        _command.extend(_command_args)
-        logging.info(f"Fallback run with {_command}")
+    def _get_fallback_command(self, command_kwargs: dict) -> List[str]:
+        _command = [self._get_fallback_runner().as_posix(), "--verbose"]
+        _command.extend(self._get_command_args(command_kwargs))
         return _command
 
 
 class EramVisualsWrapper(ExternalWrapperBase):
 
-    _required_packages = ("scales", "ggplot2", "dplyr", "readr", "stringr")
+    _required_packages = eram_visuals_r_packages
     _status: ExternalWrapperStatus = None
     _output: EramVisualsOutput = None
     _runner: ExternalRunner = None
@@ -171,3 +192,17 @@ class EramVisualsWrapper(ExternalWrapperBase):
             self.finalize()
         except Exception as e_info:
             self.finalize_with_error(str(e_info))
+
+
+def get_eram_visuals_runner() -> Type[ExternalRunner]:
+    """
+    Gets the `ExternalRunner` type configured in `settings.ERAM_VISUALS_RUNNER`.
+    Defaults to the `EramVisualsRunner` (one `Rscript` process per execution).
+
+    Returns:
+        Type[ExternalRunner]: Runner type to provide to the `EramVisualsWrapper`.
+    """
+    _runner_path = getattr(settings, "ERAM_VISUALS_RUNNER", None)
+    if not _runner_path:
+        return EramVisualsRunner
+    return import_string(_runner_path)
@@ -1 +1,4 @@
-from .ERAMVisuals.eram_visuals_wrapper import EramVisualsWrapper
+from .ERAMVisuals.eram_visuals_wrapper import (
+    EramVisualsWrapper,
+    get_eram_visuals_runner,
+)
@@ -0,0 +1,110 @@
+import logging
+import subprocess
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Union
+
+
+class ExternalCommandTimeout(Exception):
+    """
+    Raised when an external command does not finish within its time limit.
+    """
+
+    pass
+
+
+class ExternalCommandResult:
+    return_code: int
+    stdout: str
+    stderr: str
+
+    def __init__(self, return_code: int, stdout: str, stderr: str) -> None:
+        self.return_code = return_code
+        self.stdout = stdout
+        self.stderr = stderr
+
+    @property
+    def succeeded(self) -> bool:
+        return self.return_code == 0
+
+
+@contextmanager
+def get_job_logger(
+    name: str, log_file: Optional[Path] = None
+) -> Iterator[logging.Logger]:
+    """
+    Creates a logger scoped to a single job. Its records are written to `log_file`
+    (when given) and propagated to the `name` logger. The file handler is closed
+    once the job is done, so no handlers pile up on shared loggers.
+
+    Args:
+        name (str): Name of the (shared) logger the job records propagate to.
+        log_file (Optional[Path], optional): File for this job's records.
+
+    Yields:
+        Iterator[logging.Logger]: Logger to use during the job.
+    """
+    # Not registered in the logging manager so it is discarded after the job.
+    _logger = logging.Logger(name, level=logging.INFO)
+    _logger.parent = logging.getLogger(name)
+    _file_handler = None
+    if log_file:
+        _file_handler = logging.FileHandler(filename=log_file, mode="w")
+        _file_handler.setLevel(logging.INFO)
+        _logger.addHandler(_file_handler)
+    try:
+        yield _logger
+    finally:
+        if _file_handler:
+            _logger.removeHandler(_file_handler)
+            _file_handler.close()
+
+
+def _as_text(output: Union[str, bytes, None]) -> str:
+    # `TimeoutExpired` returns bytes even when running in text mode.
+    if isinstance(output, bytes):
+        return output.decode(errors="replace")
+    return output or ""
+
+
+def _log_output(logger: logging.Logger, stdout: str, stderr: str) -> None:
+    if stdout.strip():
+        logger.info(f"stdout:\n{stdout.strip()}")
+    if stderr.strip():
+        logger.info(f"stderr:\n{stderr.strip()}")
+
+
+def run_external_command(
+    command: List[str], timeout: float, logger: logging.Logger
+) -> ExternalCommandResult:
+    """
+    Runs `command` as an argument list (no shell involved) capturing its output.
+    The process is killed when it exceeds the given `timeout`.
+
+    Args:
+        command (List[str]): Executable followed by its arguments.
+        timeout (float): Maximum amount of seconds the process can run.
+        logger (logging.Logger): Logger where the command and its output are written.
+
+    Raises:
+        ExternalCommandTimeout: When the process did not finish within `timeout`.
+
+    Returns:
+        ExternalCommandResult: Return code and captured output of the process.
+    """
+    logger.info(f"Running command: {command}")
+    try:
+        _process = subprocess.run(
+            command, capture_output=True, text=True, timeout=timeout
+        )
+    except subprocess.TimeoutExpired as e_info:
+        _log_output(logger, _as_text(e_info.stdout), _as_text(e_info.stderr))
+        _message = f"Command did not finish within {timeout} seconds."
+        logger.error(_message)
+        raise ExternalCommandTimeout(_message)
+    _result = ExternalCommandResult(
+        _process.returncode, _as_text(_process.stdout), _as_text(_process.stderr)
+    )
+    _log_output(logger, _result.stdout, _result.stderr)
+    logger.info(f"Command finished with code {_result.return_code}")
+    return _result
@@ -0,0 +1,195 @@
+import itertools
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from django.db import transaction
+from django.forms import ValidationError
+
+from epic_app.exporters.answers_jsonl_exporter import (
+    get_answer_data_fields,
+    open_jsonl_file,
+)
+from epic_app.models.epic_answers import Answer, MultipleChoiceAnswer
+from epic_app.models.epic_data_version import DataVersion, DataVersionType
+from epic_app.models.epic_user import EpicUser
+from epic_app.models.models import Program
+from epic_app.utils import bulk_create_submodels, get_submodel_type_list
+
+# Answer type, user id, question id, answer fields and selected program ids.
+AnswerRow = Tuple[Type[Answer], int, int, Dict[str, Any], Optional[List[int]]]
+
+
+class AnswersJsonlImporter:
+    """
+    Imports the answers exported with `AnswersJsonlExporter`, resolving their natural keys (username, program and question title, program names) with in-memory indexes. The answers are upserted chunk by chunk with bulk queries, all within a single transaction, so either all the answers get imported or none.
+    """
+
+    def __init__(self, chunk_size: int = 2000) -> None:
+        self.chunk_size = chunk_size
+
+    def _load_indexes(self):
+        self._user_ids: Dict[str, int] = dict(
+            EpicUser.objects.values_list("username", "pk")
+        )
+        self._program_ids: Dict[str, int] = {
+            p_name.casefold(): p_id
+            for p_name, p_id in Program.objects.values_list("name", "pk")
+        }
+        self._questions: Dict[Tuple[str, str], Tuple[int, Type[Answer]]] = {}
+        for answer_type in get_submodel_type_list(Answer):
+            for question_type in answer_type._get_supported_questions():
+                self._questions.update(
+                    ((p_name.casefold(), q_title), (q_id, answer_type))
+                    for q_id, p_name, q_title in question_type.objects.values_list(
+                        "pk", "program__name", "title"
+                    )
+                )
+
+    def _get_answer_row(self, answer_data: Any) -> AnswerRow:
+        if not isinstance(answer_data, dict):
+            raise ValidationError("Expected a JSON object.")
+        user_id = self._user_ids.get(answer_data.get("user"), None)
+        if not user_id:
+            raise ValidationError(f"User: '{answer_data.get('user')}' does not exist.")
+        question_id, answer_type = self._questions.get(
+            (str(answer_data.get("program")).casefold(), answer_data.get("question")),
+            (None, None),
+        )
+        if not question_id:
+            raise ValidationError(
+                f"Question: '{answer_data.get('question')}', Program: '{answer_data.get('program')}' does not exist."
+            )
+        if answer_data.get("type", answer_type.__name__) != answer_type.__name__:
+            raise ValidationError(
+                f"Answer type: '{answer_data['type']}' does not match the question, expected '{answer_type.__name__}'."
+            )
+        answer_fields = {
+            field_name: answer_type._meta.get_field(field_name).clean(
+                answer_data[field_name], None
+            )
+            for field_name in get_answer_data_fields(answer_type)
+            if field_name in answer_data
+        }
+        selected_programs = None
+        if answer_type == MultipleChoiceAnswer and "selected_programs" in answer_data:
+            _program_names = answer_data["selected_programs"]
+            if not isinstance(_program_names, list):
+                raise ValidationError("Selected programs should be a list.")
+            selected_programs = [
+                self._program_ids.get(str(p_name).casefold(), None)
+                for p_name in _program_names
+            ]
+            if None in selected_programs:
+                raise ValidationError(
+                    f"Selected programs: {_program_names} contain unknown programs."
+                )
+            selected_programs = list(dict.fromkeys(selected_programs))
+        return answer_type, user_id, question_id, answer_fields, selected_programs
+
+    def _upsert_answers(self, answer_rows: List[AnswerRow]):
+        """
+        Upserts the given answers with bulk queries per `Answer` subtype, as `bulk_create` cannot upsert multi-table inherited models.
+        """
+        rows_by_type: Dict[Type[Answer], Dict[Tuple[int, int], AnswerRow]] = {}
+        for answer_row in answer_rows:
+            answer_type, user_id, question_id, _, _ = answer_row
+            # The last answer of a user to a question prevails.
+            rows_by_type.setdefault(answer_type, {})[
+                (user_id, question_id)
+            ] = answer_row
+
+        selected_programs: Dict[int, List[int]] = {}
+        for answer_type, type_rows in rows_by_type.items():
+            existing_answers = {
+                (c_answer.user_id, c_answer.question_id): c_answer
+                for c_answer in answer_type.objects.filter(
+                    user_id__in={user_id for user_id, _ in type_rows},
+                    question_id__in={question_id for _, question_id in type_rows},
+                )
+            }
+            to_update, to_create = [], []
+            for answer_key, answer_row in type_rows.items():
+                _, user_id, question_id, answer_fields, _ = answer_row
+                c_answer = existing_answers.get(answer_key, None)
+                if c_answer:
+                    to_update.append(c_answer)
+                else:
+                    c_answer = answer_type(user_id=user_id, question_id=question_id)
+                    to_create.append(c_answer)
+                for field_name, value in answer_fields.items():
+                    setattr(c_answer, field_name, value)
+            _update_fields = get_answer_data_fields(answer_type)
+            if to_update and _update_fields:
+                answer_type.objects.bulk_update(to_update, _update_fields)
+            bulk_create_submodels(answer_type, to_create)
+            _answer_ids = {
+                (c_answer.user_id, c_answer.question_id): c_answer.pk
+                for c_answer in to_update + to_create
+            }
+            selected_programs.update(
+                (_answer_ids[answer_key], answer_row[-1])
+                for answer_key, answer_row in type_rows.items()
+                if answer_row[-1] is not None
+            )
+
+        if selected_programs:
+            _through = MultipleChoiceAnswer.selected_programs.through
+            _through.objects.filter(
+                multiplechoiceanswer_id__in=selected_programs.keys()
+            ).delete()
+            _through.objects.bulk_create(
+                [
+                    _through(multiplechoiceanswer_id=answer_id, program_id=program_id)
+                    for answer_id, program_ids in selected_programs.items()
+                    for program_id in program_ids
+                ]
+            )
+
+    def import_file(self, input_file: Path) -> int:
+        """
+        Imports all the answers of the given JSON lines file (gzipped when its extension is `.gz`), creating or updating the answer of each user to each question.
+
+        Args:
+            input_file (Path): File containing the exported answers.
+
+        Raises:
+            ValidationError: When the file contains invalid lines, nothing gets imported.
+
+        Returns:
+            int: Number of imported lines.
+        """
+        self._load_indexes()
+        errors_found: List[str] = []
+        n_answers = 0
+        with transaction.atomic(), open_jsonl_file(input_file, "r") as jsonl_stream:
+            _lines = enumerate(jsonl_stream, start=1)
+            while True:
+                _chunk = list(itertools.islice(_lines, self.chunk_size))
+                if not _chunk:
+                    break
+                answer_rows = []
+                for n_line, jsonl_line in _chunk:
+                    if not jsonl_line.strip():
+                        continue
+                    try:
+                        answer_data = json.loads(jsonl_line)
+                    except ValueError:
+                        errors_found.append(f"  - Line {n_line}. Invalid JSON.")
+                        continue
+                    try:
+                        answer_rows.append(self._get_answer_row(answer_data))
+                    except ValidationError as err_info:
+                        errors_found.extend(
+                            f"  - Line {n_line}. {message}"
+                            for message in err_info.messages
+                        )
+                # Keep validating the remaining lines to report all the errors at once.
+                if not errors_found:
+                    self._upsert_answers(answer_rows)
+                n_answers += len(answer_rows)
+            if errors_found:
+                raise ValidationError(errors_found)
+            # Bulk queries do not send the signals updating the answers version.
+            DataVersion.bump(DataVersionType.ANSWERS)
+        return n_answers
@@ -1,11 +1,14 @@
-import csv
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Iterable, List, Tuple, Union
 
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.forms import ValidationError
 
-from epic_app.importers.xlsx.base_importer import BaseEpicImporter
+from epic_app.importers.xlsx.base_importer import (
+    BaseEpicImporter,
+    EpicImportChangeSet,
+    EpicProgramIndex,
+)
 from epic_app.models.models import Agency, Program
 
 
@@ -23,39 +26,111 @@ class EpicAgencyImporter(BaseEpicImporter):
 
     def _validate(
         self,
-        xlsx_line_objects: List[XlsxLineObject],
-    ) -> List[str]:
-        errors_found = []
+        xlsx_line_objects: Iterable[XlsxLineObject],
+        program_index: EpicProgramIndex,
+    ) -> Tuple[List[XlsxLineObject], List[str]]:
+        validated_lines, errors_found = [], []
         n_line_addition = 2  # Excluded header + start enumerate is 0.
         for n_line, xlsx_line in enumerate(xlsx_line_objects):
-            if not Program.objects.filter(name__iexact=xlsx_line.program).exists():
+            validated_lines.append(xlsx_line)
+            if not program_index.get(xlsx_line.program):
                 error_line = n_line + n_line_addition
                 errors_found.append(
                     f"  - Line {error_line}. Program: '{xlsx_line.program}' does not exist."
                 )
-        return errors_found
+        return validated_lines, errors_found
 
-    def _import_agencies(self, agencies_dictionary: Dict[str, List[XlsxLineObject]]):
-        # Remove all previous agency objects.
+    EpicAgencyEntities = List[Tuple[Agency, List[Program]]]
+
+    def _get_import_entities(
+        self, line_objects: Iterable[XlsxLineObject]
+    ) -> EpicAgencyEntities:
+        """
+        Gets the (unsaved) agencies of the lines together with their existing programs.
+
+        Args:
+            line_objects (Iterable[XlsxLineObject]): Lines of the file to import.
+
+        Raises:
+            ValidationError: When a line refers to a non existing program.
+
+        Returns:
+            EpicAgencyEntities: Agencies to import with their related programs.
+        """
+        program_index = EpicProgramIndex()
+        validated_lines, errors_found = self._validate(line_objects, program_index)
+        if any(errors_found):
+            raise ValidationError(errors_found)
+        return [
+            (
+                Agency(name=agency_name),
+                [program_index.get(csvobj.program) for csvobj in agency_csvobj],
+            )
+            for agency_name, agency_csvobj in self.group_entity(
+                "agency", validated_lines
+            ).items()
+        ]
+
+    def _replace_entities(self, import_entities: EpicAgencyEntities):
+        # Removing the agencies also removes their relationships to programs.
         Agency.objects.all().delete()
-        for agency_name, agency_csvobj in agencies_dictionary.items():
-            c_agency = Agency(name=agency_name)
-            c_agency.save()
-            for csvobj in agency_csvobj:
-                existing_program: Program = Program.get_program_by_name(csvobj.program)
-                existing_program.agencies.add(c_agency)
-
-    def import_file(self, input_file: Union[InMemoryUploadedFile, Path]):
+        Agency.objects.bulk_create([c_agency for c_agency, _ in import_entities])
+        _program_agencies = Program.agencies.through
+        _program_agency_ids = {
+            (c_program.pk, c_agency.pk)
+            for c_agency, c_programs in import_entities
+            for c_program in c_programs
+        }
+        _program_agencies.objects.bulk_create(
+            [
+                _program_agencies(program_id=program_id, agency_id=agency_id)
+                for program_id, agency_id in _program_agency_ids
+            ]
+        )
+
+    def _update_entities(
+        self, import_entities: EpicAgencyEntities, change_set: EpicImportChangeSet
+    ):
+        saved_agencies = change_set.upsert(
+            Agency,
+            {c_agency.name: c_agency for c_agency in Agency.objects.all()},
+            {c_agency.name: c_agency for c_agency, _ in import_entities},
+            fields=[],
+        )
+        _program_agencies = Program.agencies.through
+        imported_program_agencies = {
+            (c_program.pk, c_agency.name): _program_agencies(
+                program=c_program, agency=saved_agencies[c_agency.name]
+            )
+            for c_agency, c_programs in import_entities
+            for c_program in c_programs
+        }
+        change_set.upsert(
+            _program_agencies,
+            {
+                (
+                    c_program_agency.program_id,
+                    c_program_agency.agency.name,
+                ): c_program_agency
+                for c_program_agency in _program_agencies.objects.select_related(
+                    "program", "agency"
+                )
+            },
+            imported_program_agencies,
+            fields=[],
+            describe=lambda c_program_agency: f"{c_program_agency.agency} - {c_program_agency.program}",
+        )
+
+    def import_file(
+        self, input_file: Union[InMemoryUploadedFile, Path]
+    ) -> EpicImportChangeSet:
         """
         Imports saved Agencies into the database and adds the relationships to existent Programs.
 
         Args:
             input_file (Union[InMemoryUploadedFile, Path]): File containing EPIC Agencies.
+
+        Returns:
+            EpicImportChangeSet: Applied changes.
         """
-        Agency.objects.all().delete()
-        line_objects = self._get_xlsx_line_objects(input_file)
-        _headers = line_objects.pop(0)
-        errors_found = self._validate(line_objects)
-        if any(errors_found):
-            raise ValidationError(errors_found)
-        self._import_agencies(self.group_entity("agency", line_objects))
+        return super().import_file(input_file)
@@ -1,12 +1,215 @@
+import codecs
+import csv
 import io
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Protocol, Tuple, Union, runtime_checkable
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    Union,
+    runtime_checkable,
+)
 
 import openpyxl
 from django.core.files.uploadedfile import InMemoryUploadedFile
-from openpyxl.cell import Cell
+from django.db import models, transaction
+from django.forms import ValidationError
 
+from epic_app.models.epic_answers import Answer
+from epic_app.models.epic_data_version import DataVersion, DataVersionType
 from epic_app.models.models import Program
+from epic_app.utils import bulk_create_submodels
+
+
+class EpicProgramIndex:
+    """
+    In-memory index of all the existing `Program`, loaded with a single query, to resolve (case insensitive) the programs referenced by each imported row.
+    """
+
+    def __init__(self) -> None:
+        self._by_name: Dict[str, Program] = {}
+        self._by_group_name: Dict[Tuple[str, str], Program] = {}
+        for program in Program.objects.select_related("group"):
+            _name = program.name.casefold()
+            self._by_name[_name] = program
+            self._by_group_name[(program.group.name.casefold(), _name)] = program
+
+    def get(self, program: str, group: Optional[str] = None) -> Optional[Program]:
+        """
+        Gets the `Program` matching the given name and, when provided, group name.
+
+        Args:
+            program (str): Program name.
+            group (Optional[str], optional): Group name. Defaults to None.
+
+        Returns:
+            Optional[Program]: Found program.
+        """
+        if group is None:
+            return self._by_name.get(program.casefold(), None)
+        return self._by_group_name.get((group.casefold(), program.casefold()), None)
+
+
+class EpicImportChangeSet:
+    """
+    Applies the differences between the existing and the imported entities, matched by their natural key, so only the changed rows get inserted, updated or deleted. The applied changes are kept so they can be reported.
+    On a `dry_run` the differences are only computed, which allows previewing an import without writing anything.
+    On `replace` every existing entity is reported as deleted and every imported one as created, as a (non differential) import replaces them all. Those changes are not written here but by the importer itself.
+    """
+
+    def __init__(self, dry_run: bool = False, replace: bool = False) -> None:
+        self.dry_run = dry_run
+        self.replace = replace
+        self.changes: Dict[str, Dict[str, List[str]]] = {}
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self._stale_entities: List[Tuple[Type[models.Model], List[int]]] = []
+
+    @staticmethod
+    def get_by_key(
+        entities: Iterable[models.Model],
+        natural_key: Callable[[models.Model], Hashable],
+    ) -> Dict[Hashable, models.Model]:
+        """
+        Indexes the given entities by their natural key.
+
+        Args:
+            entities (Iterable[models.Model]): Entities to index.
+            natural_key (Callable[[models.Model], Hashable]): Gets the natural key of an entity.
+
+        Raises:
+            ValidationError: When two entities share the same natural key.
+
+        Returns:
+            Dict[Hashable, models.Model]: Entities by natural key.
+        """
+        by_key = {}
+        for entity in entities:
+            _key = natural_key(entity)
+            if _key in by_key:
+                raise ValidationError(
+                    f"There's already a {type(entity).__name__} like: {entity}."
+                )
+            by_key[_key] = entity
+        return by_key
+
+    def _add_changes(
+        self,
+        entity_type: Type[models.Model],
+        change: str,
+        entities: List[models.Model],
+        describe: Callable[[models.Model], str],
+    ):
+        if entities:
+            self.changes.setdefault(entity_type.__name__, {})[change] = [
+                describe(entity) for entity in entities
+            ]
+
+    def upsert(
+        self,
+        entity_type: Type[models.Model],
+        existing: Dict[Hashable, models.Model],
+        imported: Dict[Hashable, models.Model],
+        fields: List[str],
+        describe: Callable[[models.Model], str] = str,
+    ) -> Dict[Hashable, models.Model]:
+        """
+        Inserts the imported entities whose natural key does not exist yet and updates the given `fields` of the existing ones when they differ. The existing entities no longer imported are only removed on `delete_stale`, so their children can be moved to other parents first.
+
+        Args:
+            entity_type (Type[models.Model]): Type of the entities to import.
+            existing (Dict[Hashable, models.Model]): Existing entities by natural key.
+            imported (Dict[Hashable, models.Model]): Unsaved imported entities by natural key.
+            fields (List[str]): Fields to update on the existing entities.
+            describe (Callable[[models.Model], str], optional): Gets how to report an entity. Defaults to str.
+
+        Returns:
+            Dict[Hashable, models.Model]: Saved entities by natural key.
+        """
+        if self.replace:
+            self._add_changes(entity_type, "created", list(imported.values()), describe)
+            self._add_changes(entity_type, "deleted", list(existing.values()), describe)
+            return dict(imported)
+
+        created, updated, saved = [], [], {}
+        _attnames = [entity_type._meta.get_field(field).attname for field in fields]
+        for key, imported_entity in imported.items():
+            existing_entity = existing.get(key, None)
+            if existing_entity is None:
+                created.append(imported_entity)
+                saved[key] = imported_entity
+                continue
+            _changed = False
+            for _attname in _attnames:
+                _value = getattr(imported_entity, _attname)
+                if getattr(existing_entity, _attname) != _value:
+                    setattr(existing_entity, _attname, _value)
+                    _changed = True
+            if _changed:
+                updated.append(existing_entity)
+            saved[key] = existing_entity
+        stale = [entity for key, entity in existing.items() if key not in imported]
+        self._add_changes(entity_type, "created", created, describe)
+        self._add_changes(entity_type, "updated", updated, describe)
+        self._add_changes(entity_type, "deleted", stale, describe)
+        if self.dry_run:
+            return saved
+
+        if entity_type._meta.parents:
+            bulk_create_submodels(entity_type, created)
+        else:
+            entity_type.objects.bulk_create(created)
+        # Inherited fields are stored in (and thus updated through) their own table.
+        _fields_by_type: Dict[Type[models.Model], List[str]] = {}
+        for field in fields:
+            _field_type = entity_type._meta.get_field(field).model
+            _fields_by_type.setdefault(_field_type, []).append(field)
+        if updated:
+            for _field_type, _type_fields in _fields_by_type.items():
+                _field_type._base_manager.bulk_update(updated, _type_fields)
+        self._stale_entities.append((entity_type, [entity.pk for entity in stale]))
+        return saved
+
+    def delete_stale(self):
+        """
+        Deletes the existing entities which were not imported, children first.
+        """
+        for entity_type, stale_ids in reversed(self._stale_entities):
+            if stale_ids:
+                entity_type.objects.filter(pk__in=stale_ids).delete()
+        self._stale_entities = []
+
+    def get_counts(self) -> Dict[str, Dict[str, int]]:
+        """
+        Gets how many entities were (or would be, on a dry run) created, updated and deleted per entity type.
+
+        Returns:
+            Dict[str, Dict[str, int]]: Number of changes per entity type and change.
+        """
+        return {
+            entity_name: {
+                change: len(entity_changes.get(change, []))
+                for change in ("created", "updated", "deleted")
+            }
+            for entity_name, entity_changes in self.changes.items()
+        }
+
+    def __str__(self) -> str:
+        if not self.changes:
+            return "No changes."
+        return "\n".join(
+            f"{entity_name}: "
+            + ", ".join(f"{count} {change}" for change, count in entity_counts.items())
+            for entity_name, entity_counts in self.get_counts().items()
+        )
 
 
 @runtime_checkable
@@ -19,11 +222,18 @@ class ProtocolEpicImporter(Protocol):
 
 
 class BaseEpicImporter:
+    def __init__(self, differential: bool = False) -> None:
+        """
+        Args:
+            differential (bool, optional): Whether to only apply the differences with the existing entities (matched by natural key) instead of replacing them all, so related answers are kept. Defaults to False.
+        """
+        self.differential = differential
+
     class XlsxLineObject:
         @staticmethod
-        def get_valid_cell(xlsx_row: List[Cell], cell_pos: int) -> str:
+        def get_valid_cell(xlsx_row: Tuple[Any, ...], cell_pos: int) -> str:
             try:
-                return xlsx_row[cell_pos].value.strip()
+                return xlsx_row[cell_pos].strip()
             except:
                 return ""
 
@@ -31,37 +241,246 @@ class BaseEpicImporter:
         def from_xlsx_row(cls, xlsx_row: Any):
             raise NotImplementedError("Implement in concrete class.")
 
-    def _get_xlsx_line_objects(
+    @staticmethod
+    def _read_xlsx_rows(
+        input_file: Union[InMemoryUploadedFile, Path]
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Streams the rows of the active sheet in read-only mode as plain cell values, so neither the whole sheet nor its `Cell` objects are kept in memory.
+        """
+        loaded_workbook: openpyxl.Workbook = openpyxl.load_workbook(
+            input_file, read_only=True
+        )
+        try:
+            yield from loaded_workbook.active.iter_rows(values_only=True)
+        finally:
+            loaded_workbook.close()
+
+    @staticmethod
+    def _read_csv_rows(
+        input_file: Union[InMemoryUploadedFile, Path]
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Streams the rows of an (utf-8) csv file.
+        """
+        if isinstance(input_file, Path):
+            with input_file.open(newline="", encoding="utf-8-sig") as csv_stream:
+                yield from map(tuple, csv.reader(csv_stream))
+        else:
+            input_file.seek(0)
+            yield from map(
+                tuple, csv.reader(codecs.iterdecode(input_file, "utf-8-sig"))
+            )
+
+    @staticmethod
+    def _read_parquet_rows(
+        input_file: Union[InMemoryUploadedFile, Path]
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Streams the rows of a parquet file batch by batch, preceded by its column names. Requires the optional `pyarrow` package.
+        """
+        try:
+            import pyarrow.parquet
+        except ImportError:
+            raise ValidationError(
+                "Importing parquet files requires the 'pyarrow' package."
+            )
+        if isinstance(input_file, Path):
+            input_file = str(input_file)
+        parquet_file = pyarrow.parquet.ParquetFile(input_file)
+        yield tuple(parquet_file.schema_arrow.names)
+        for record_batch in parquet_file.iter_batches():
+            yield from zip(*(column.to_pylist() for column in record_batch.columns))
+
+    # Readers of the rows of each supported file format, by file extension.
+    file_readers: Dict[
+        str,
+        Callable[[Union[InMemoryUploadedFile, Path]], Iterator[Tuple[Any, ...]]],
+    ] = {
+        ".xlsx": _read_xlsx_rows.__func__,
+        ".csv": _read_csv_rows.__func__,
+        ".parquet": _read_parquet_rows.__func__,
+    }
+
+    @classmethod
+    def get_file_reader(
+        cls, input_file: Union[InMemoryUploadedFile, Path]
+    ) -> Callable[[Union[InMemoryUploadedFile, Path]], Iterator[Tuple[Any, ...]]]:
+        """
+        Gets the reader of the given file based on its extension.
+
+        Args:
+            input_file (Union[InMemoryUploadedFile, Path]): File to read.
+
+        Raises:
+            ValidationError: When the file format is not supported.
+
+        Returns:
+            Callable[[Union[InMemoryUploadedFile, Path]], Iterator[Tuple[Any, ...]]]: Reader of the file rows.
+        """
+        _suffix = Path(str(getattr(input_file, "name", input_file))).suffix.lower()
+        if _suffix not in cls.file_readers:
+            raise ValidationError(
+                f"Unsupported file format '{_suffix}', expected one of: {', '.join(cls.file_readers)}."
+            )
+        return cls.file_readers[_suffix]
+
+    def iter_lines(
+        self, input_file: Union[InMemoryUploadedFile, Path]
+    ) -> Iterator[XlsxLineObject]:
+        """
+        Lazily gets the file lines (headers excluded) into our custom `XlsxLineObject`.
+        The rows are streamed by the reader matching the file extension (see `file_readers`), so the whole file is never kept in memory.
+
+        Args:
+            input_file (Union[InMemoryUploadedFile, Path]): File to parse.
+
+        Yields:
+            Iterator[XlsxLineObject]: Parsed objects, one per valid row.
+        """
+        _valid_rows = (
+            row
+            for row in self.get_file_reader(input_file)(input_file)
+            if row and row[0]
+        )
+        # Skip the first line as it's the columns names.
+        next(_valid_rows, None)
+        yield from map(self.XlsxLineObject.from_xlsx_row, _valid_rows)
+
+    def read_lines(
         self, input_file: Union[InMemoryUploadedFile, Path]
     ) -> List[XlsxLineObject]:
         """
-        Gets all the Xlsx lines into our custom `XlsxLineObject`.
+        Reads all the lines of the given file. As it does not require the database it can run in a separate process, while the lines get imported later on with `import_lines`.
 
         Args:
             input_file (Union[InMemoryUploadedFile, Path]): File to parse.
 
         Returns:
-            List[XlsxLineObject]: Resulting list of parsed objects.
+            List[XlsxLineObject]: Parsed objects, one per valid row.
         """
-        loaded_workbook: openpyxl.Workbook = openpyxl.load_workbook(input_file)
-        loaded_sheet = loaded_workbook.active
+        return list(self.iter_lines(input_file))
 
-        def _get_valid_rows():
-            for row in loaded_sheet.rows:
-                if row[0].value:
-                    yield row
+    def _get_import_entities(self, line_objects: Iterable[XlsxLineObject]) -> Any:
+        """
+        Validates all the given lines and maps them into (unsaved) entities, without writing anything into the database.
 
-        return list(map(self.XlsxLineObject.from_xlsx_row, _get_valid_rows()))
+        Args:
+            line_objects (Iterable[XlsxLineObject]): Lines of the file to import.
 
-    def import_file(self, input_file: Union[InMemoryUploadedFile, Path]):
+        Raises:
+            ValidationError: When the file contains invalid lines.
+
+        Returns:
+            Any: Entities ready to be saved.
         """
-        Imports an xlsx file saved in memory or as a path into the EPIC domain data.
+        raise NotImplementedError("Implement in concrete class.")
+
+    def _replace_entities(self, import_entities: Any):
+        """
+        Replaces the previously imported entities with the given ones.
 
         Args:
-            input_file (Union[InMemoryUploadedFile, Path]): File containing EPIC data.
+            import_entities (Any): Entities returned by `_get_import_entities`.
+        """
+        raise NotImplementedError("Implement in concrete class.")
+
+    def _update_entities(self, import_entities: Any, change_set: EpicImportChangeSet):
+        """
+        Updates the previously imported entities with the differences of the given ones.
+
+        Args:
+            import_entities (Any): Entities returned by `_get_import_entities`.
+            change_set (EpicImportChangeSet): Change set applying the differences.
         """
         raise NotImplementedError("Implement in concrete class.")
 
+    def _get_replaced_answers(self) -> models.QuerySet:
+        """
+        Gets the answers (cascade) deleted when replacing the previously imported entities.
+
+        Returns:
+            models.QuerySet: Answers removed by `_replace_entities`.
+        """
+        return Answer.objects.none()
+
+    def preview_file(
+        self,
+        input_file: Union[InMemoryUploadedFile, Path],
+        differential: Optional[bool] = None,
+    ) -> EpicImportChangeSet:
+        """
+        Dry runs the import of the given file: it gets parsed and validated, and its differences with the existing entities are computed with in-memory indexes, without writing anything into the database.
+
+        Args:
+            input_file (Union[InMemoryUploadedFile, Path]): File containing EPIC data.
+            differential (Optional[bool], optional): Whether to preview a differential import instead of replacing all the entities. Defaults to the importer's `differential`.
+
+        Returns:
+            EpicImportChangeSet: Changes the import would apply, or the validation errors found.
+        """
+        if differential is None:
+            differential = self.differential
+        change_set = EpicImportChangeSet(dry_run=True, replace=not differential)
+        try:
+            _import_entities = self._get_import_entities(self.iter_lines(input_file))
+            self._update_entities(_import_entities, change_set)
+        except ValidationError as err_info:
+            change_set.errors = err_info.messages
+            return change_set
+        if not differential:
+            _n_answers = self._get_replaced_answers().count()
+            if _n_answers:
+                change_set.warnings.append(
+                    f"Replacing all the entities will also remove {_n_answers} answers, import it as differential to keep them."
+                )
+        return change_set
+
+    def import_lines(
+        self, line_objects: Iterable[XlsxLineObject]
+    ) -> EpicImportChangeSet:
+        """
+        Imports the given lines into the EPIC domain data.
+        All lines are validated before touching the database, and the previous data is only replaced (or updated, when `differential`) within a single (short) transaction. Therefore invalid lines leave the database untouched, and readers keep seeing the previous data until the new one is committed.
+
+        Args:
+            line_objects (Iterable[XlsxLineObject]): Lines of the file to import.
+
+        Raises:
+            ValidationError: When the file contains invalid lines.
+
+        Returns:
+            EpicImportChangeSet: Applied changes.
+        """
+        _import_entities = self._get_import_entities(line_objects)
+        change_set = EpicImportChangeSet(replace=not self.differential)
+        with transaction.atomic():
+            self._update_entities(_import_entities, change_set)
+            if self.differential:
+                change_set.delete_stale()
+            else:
+                self._replace_entities(_import_entities)
+            # Bulk operations do not send the signals updating the domain version.
+            DataVersion.bump(DataVersionType.DOMAIN)
+        return change_set
+
+    def import_file(
+        self, input_file: Union[InMemoryUploadedFile, Path]
+    ) -> EpicImportChangeSet:
+        """
+        Imports a file (xlsx, csv or parquet) saved in memory or as a path into the EPIC domain data, see `import_lines`.
+
+        Args:
+            input_file (Union[InMemoryUploadedFile, Path]): File containing EPIC data.
+
+        Raises:
+            ValidationError: When the file contains invalid lines.
+
+        Returns:
+            EpicImportChangeSet: Applied changes.
+        """
+        return self.import_lines(self.iter_lines(input_file))
+
     def tuple_to_dict(
         self, tup_lines: List[Tuple[str, List[Any]]]
     ) -> Dict[str, List[Any]]:
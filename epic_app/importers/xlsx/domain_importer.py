@@ -1,12 +1,10 @@
-import csv
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-from venv import create
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from django.core.files.uploadedfile import InMemoryUploadedFile
-from openpyxl import Workbook
+from django.db import models
+from django.forms import ValidationError
 
-from epic_app.importers.xlsx.base_importer import BaseEpicImporter
+from epic_app.importers.xlsx.base_importer import BaseEpicImporter, EpicImportChangeSet
+from epic_app.models.epic_answers import Answer
 from epic_app.models.models import Area, Group, Program, ProgramReference
 
 
@@ -38,7 +36,7 @@ class EpicDomainImporter(BaseEpicImporter):
             new_obj.reference_link = cls.get_valid_cell(xlsx_row, 5)
             return new_obj
 
-        def _to_program_reference_list(self, to_program: Program) -> None:
+        def to_program_references(self, to_program: Program) -> List[ProgramReference]:
             def get_clean_ref(ref_value: str) -> str:
                 return ref_value.replace("•\t", "")
 
@@ -49,37 +47,142 @@ class EpicDomainImporter(BaseEpicImporter):
 
             _references = get_as_list(self.reference)
             _links = get_as_list(self.reference_link)
-            for p_reflink in zip(_references, _links):
-                _p_ref = ProgramReference(
+            return [
+                ProgramReference(
                     description=p_reflink[0], link=p_reflink[1], program=to_program
                 )
-                _p_ref.save()
+                for p_reflink in zip(_references, _links)
+            ]
 
-        def to_epic_program(self) -> None:
-            epic_area, _ = Area.objects.get_or_create(name=self.area.strip())
-            epic_group, _ = Group.objects.get_or_create(
-                name=self.group.strip(), area=epic_area
+    EpicDomainEntities = Tuple[
+        List[Area], List[Group], List[Program], List[ProgramReference]
+    ]
+
+    def _get_import_entities(
+        self, line_objects: Iterable[XlsxLineObject]
+    ) -> EpicDomainEntities:
+        """
+        Collects all the (unsaved) entities of the given lines, so they can be inserted table by table regardless of the number of rows.
+
+        Args:
+            line_objects (Iterable[XlsxLineObject]): Lines of the file to import.
+
+        Raises:
+            ValidationError: When lines contain the same (case insensitive) program.
+
+        Returns:
+            EpicDomainEntities: Areas, groups, programs and program references to import.
+        """
+        areas: Dict[str, Area] = {}
+        groups: Dict[Tuple[str, str], Group] = {}
+        programs: Dict[str, Program] = {}
+        references: List[ProgramReference] = []
+        errors_found: List[str] = []
+        n_line_addition = 2  # Excluded header + start enumerate is 0.
+        for n_line, line_object in enumerate(line_objects):
+            epic_area = areas.setdefault(line_object.area, Area(name=line_object.area))
+            epic_group = groups.setdefault(
+                (line_object.area, line_object.group),
+                Group(name=line_object.group, area=epic_area),
             )
-            _created_program = Program(
-                name=self.program.strip(),
-                description=self.description.strip(),
+            existing_program = programs.get(line_object.program.casefold(), None)
+            if existing_program:
+                errors_found.append(
+                    f"  - Line {n_line + n_line_addition}. There's already a Program with the name: {existing_program.name}."
+                )
+                continue
+            epic_program = Program(
+                name=line_object.program,
+                description=line_object.description,
                 group=epic_group,
             )
-            _created_program.save()
-            self._to_program_reference_list(_created_program)
+            programs[line_object.program.casefold()] = epic_program
+            references.extend(line_object.to_program_references(epic_program))
+        if any(errors_found):
+            raise ValidationError(errors_found)
+        return (
+            list(areas.values()),
+            list(groups.values()),
+            list(programs.values()),
+            references,
+        )
 
-    def _cleanup_epic_domain(self):
-        """
-        Dumps the database for the entities to import.
-        """
+    def _replace_entities(self, import_entities: EpicDomainEntities):
+        areas, groups, programs, references = import_entities
         Area.objects.all().delete()
         Group.objects.all().delete()
         Program.objects.all().delete()
+        # Foreign keys get resolved from the ids returned by the previous inserts.
+        Area.objects.bulk_create(areas)
+        Group.objects.bulk_create(groups)
+        Program.objects.bulk_create(programs)
+        ProgramReference.objects.bulk_create(references)
+
+    def _get_replaced_answers(self) -> models.QuerySet:
+        # All questions belong to a program, so removing the programs removes all answers.
+        return Answer.objects.all()
+
+    def _update_entities(
+        self, import_entities: EpicDomainEntities, change_set: EpicImportChangeSet
+    ):
+        areas, groups, programs, references = import_entities
+        saved_areas = change_set.upsert(
+            Area,
+            {c_area.name: c_area for c_area in Area.objects.all()},
+            {c_area.name: c_area for c_area in areas},
+            fields=[],
+        )
+
+        def group_key(c_group: Group) -> Tuple[str, str]:
+            return (c_group.area.name, c_group.name)
+
+        imported_groups = {group_key(c_group): c_group for c_group in groups}
+        for c_group in groups:
+            c_group.area = saved_areas[c_group.area.name]
+        saved_groups = change_set.upsert(
+            Group,
+            {
+                group_key(c_group): c_group
+                for c_group in Group.objects.select_related("area")
+            },
+            imported_groups,
+            fields=[],
+        )
+
+        # Programs keep their questions (and answers) even when moved to a new group.
+        imported_programs = {
+            c_program.name.casefold(): c_program for c_program in programs
+        }
+        for c_program in programs:
+            c_program.group = saved_groups[group_key(c_program.group)]
+        saved_programs = change_set.upsert(
+            Program,
+            {
+                c_program.name.casefold(): c_program
+                for c_program in Program.objects.all()
+            },
+            imported_programs,
+            fields=["name", "description", "group"],
+        )
+
+        def reference_key(c_reference: ProgramReference) -> Tuple[str, str, str]:
+            return (
+                c_reference.program.name.casefold(),
+                c_reference.description,
+                c_reference.link,
+            )
 
-    def import_file(self, input_file: Union[InMemoryUploadedFile, Path]):
-        self._cleanup_epic_domain()
-        line_objects: List[self.XlsxLineObject] = self._get_xlsx_line_objects(
-            input_file
+        imported_references = {
+            reference_key(c_reference): c_reference for c_reference in references
+        }
+        for c_reference in references:
+            c_reference.program = saved_programs[c_reference.program.name.casefold()]
+        change_set.upsert(
+            ProgramReference,
+            {
+                reference_key(c_reference): c_reference
+                for c_reference in ProgramReference.objects.select_related("program")
+            },
+            imported_references,
+            fields=[],
         )
-        _headers = line_objects.pop(0)
-        list(map(lambda x: x.to_epic_program(), line_objects))
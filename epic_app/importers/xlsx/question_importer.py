@@ -1,19 +1,47 @@
-import csv
 from pathlib import Path
-from typing import List, Type, Union
+from typing import Any, Iterable, List, Tuple, Type, Union
 
 from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.db import models
 from django.forms import ValidationError
-from openpyxl.cell import Cell
 
-from epic_app.importers.xlsx.base_importer import BaseEpicImporter
+from epic_app.importers.xlsx.base_importer import (
+    BaseEpicImporter,
+    EpicImportChangeSet,
+    EpicProgramIndex,
+)
+from epic_app.models.epic_answers import Answer
 from epic_app.models.epic_questions import (
     EvolutionQuestion,
     KeyAgencyActionsQuestion,
     NationalFrameworkQuestion,
     Question,
 )
-from epic_app.models.models import Program
+from epic_app.utils import bulk_create_submodels
+
+
+def _update_questions(
+    question_type: Type[Question],
+    questions: List[Question],
+    fields: List[str],
+    change_set: EpicImportChangeSet,
+):
+    """
+    Updates the questions of the given type matching them by program and title, so the answers of the unchanged questions are kept.
+    """
+
+    def question_key(c_question: Question) -> Tuple[int, str]:
+        return (c_question.program_id, c_question.title)
+
+    change_set.upsert(
+        question_type,
+        {
+            question_key(c_question): c_question
+            for c_question in question_type.objects.all()
+        },
+        change_set.get_by_key(questions, question_key),
+        fields=fields,
+    )
 
 
 class _YesNoJustifyQuestionImporter(BaseEpicImporter):
@@ -24,7 +52,7 @@ class _YesNoJustifyQuestionImporter(BaseEpicImporter):
         description: str
 
         @classmethod
-        def from_xlsx_row(cls, xlsx_row: List[Cell]):
+        def from_xlsx_row(cls, xlsx_row: Tuple[Any, ...]):
             new_obj = cls()
             new_obj.group = cls.get_valid_cell(xlsx_row, 0)
             new_obj.program = cls.get_valid_cell(xlsx_row, 1)
@@ -32,22 +60,39 @@ class _YesNoJustifyQuestionImporter(BaseEpicImporter):
             new_obj.title = cls.get_valid_cell(xlsx_row, 3)
             return new_obj
 
-    def import_file(self, input_file: Union[InMemoryUploadedFile, Path]):
+    def import_file(
+        self, input_file: Union[InMemoryUploadedFile, Path]
+    ) -> EpicImportChangeSet:
         """
         Imports a 'XLSX file', because we only support one importer we can embed it here.
 
         Args:
             input_file (Union[InMemoryUploadedFile, Path]): File to be imported as a YNJustify question.
+
+        Returns:
+            EpicImportChangeSet: Applied changes.
         """
-        line_objects = self._get_xlsx_line_objects(input_file)
-        # Skip the first line as it's the columns names
-        _headers = line_objects.pop(0)
-        self._cleanup_questions()
-        errors_found = self._validate(line_objects)
+        return super().import_file(input_file)
+
+    def _get_import_entities(
+        self, line_objects: Iterable[XlsxLineObject]
+    ) -> List[Question]:
+        program_index = EpicProgramIndex()
+        validated_lines, errors_found = self._validate(line_objects, program_index)
         if any(errors_found):
             raise ValidationError(errors_found)
+        return self._get_questions(validated_lines, program_index)
 
-        self._import_questions(line_objects)
+    def _replace_entities(self, import_entities: List[Question]):
+        self._cleanup_questions()
+        bulk_create_submodels(self._get_type(), import_entities)
+
+    def _update_entities(
+        self, import_entities: List[Question], change_set: EpicImportChangeSet
+    ):
+        _update_questions(
+            self._get_type(), import_entities, ["description"], change_set
+        )
 
     def _get_type(self) -> Type[Question]:
         pass
@@ -55,34 +100,38 @@ class _YesNoJustifyQuestionImporter(BaseEpicImporter):
     def _cleanup_questions(self):
         self._get_type().objects.all().delete()
 
+    def _get_replaced_answers(self) -> models.QuerySet:
+        return Answer.objects.filter(question__in=self._get_type().objects.values("pk"))
+
     def _validate(
         self,
-        xlsx_line_objects: List[XlsxLineObject],
-    ) -> List[str]:
-        errors_found = []
+        xlsx_line_objects: Iterable[XlsxLineObject],
+        program_index: EpicProgramIndex,
+    ) -> Tuple[List[XlsxLineObject], List[str]]:
+        validated_lines, errors_found = [], []
         n_line_addition = 2  # Excluded header + start enumerate is 0.
         for n_line, xlsx_line in enumerate(xlsx_line_objects):
-            if not Program.objects.filter(
-                name__iexact=xlsx_line.program, group__name__iexact=xlsx_line.group
-            ).exists():
+            validated_lines.append(xlsx_line)
+            if not program_index.get(xlsx_line.program, xlsx_line.group):
                 error_line = n_line + n_line_addition
                 errors_found.append(
                     f"  - Line {error_line}. Program: '{xlsx_line.program}', Group: '{xlsx_line.group}' does not exist."
                 )
-        return errors_found
+        return validated_lines, errors_found
 
-    def _import_questions(self, imported_questions: List[XlsxLineObject]):
-        for q_question in imported_questions:
-            # Create new question
-            f_program_query = Program.objects.get(
-                name__iexact=q_question.program, group__name__iexact=q_question.group
-            )
-            c_question: Question = self._get_type()(
+    def _get_questions(
+        self,
+        imported_questions: List[XlsxLineObject],
+        program_index: EpicProgramIndex,
+    ) -> List[Question]:
+        return [
+            self._get_type()(
                 title=q_question.title,
                 description=q_question.description,
-                program=f_program_query,
+                program=program_index.get(q_question.program, q_question.group),
             )
-            c_question.save()
+            for q_question in imported_questions
+        ]
 
 
 class NationalFrameworkQuestionImporter(_YesNoJustifyQuestionImporter):
@@ -120,41 +169,69 @@ class EvolutionQuestionImporter(BaseEpicImporter):
 
     def _validate(
         self,
-        xlsx_line_objects: List[XlsxLineObject],
-    ) -> List[str]:
-        errors_found = []
+        xlsx_line_objects: Iterable[XlsxLineObject],
+        program_index: EpicProgramIndex,
+    ) -> Tuple[List[XlsxLineObject], List[str]]:
+        validated_lines, errors_found = [], []
         n_line_addition = 2  # Excluded header + start enumerate is 0.
         for n_line, xlsx_line in enumerate(xlsx_line_objects):
-            if not Program.objects.filter(name__iexact=xlsx_line.program).exists():
+            validated_lines.append(xlsx_line)
+            if not program_index.get(xlsx_line.program):
                 error_line = n_line + n_line_addition
                 errors_found.append(
                     f"  - Line {error_line}. Program: '{xlsx_line.program}' does not exist."
                 )
-        return errors_found
+        return validated_lines, errors_found
 
-    def import_file(self, input_file: Union[InMemoryUploadedFile, Path]):
-        line_objects = self._get_xlsx_line_objects(input_file)
-        self._cleanup_questions()
-        _headers = line_objects.pop(0)
-        errors_found = self._validate(line_objects)
+    def _get_import_entities(
+        self, line_objects: Iterable[XlsxLineObject]
+    ) -> List[EvolutionQuestion]:
+        program_index = EpicProgramIndex()
+        validated_lines, errors_found = self._validate(line_objects, program_index)
         if any(errors_found):
             raise ValidationError(errors_found)
+        return self._get_questions(validated_lines, program_index)
 
-        self._import_questions(line_objects)
+    def _replace_entities(self, import_entities: List[EvolutionQuestion]):
+        self._cleanup_questions()
+        bulk_create_submodels(EvolutionQuestion, import_entities)
+
+    def _update_entities(
+        self, import_entities: List[EvolutionQuestion], change_set: EpicImportChangeSet
+    ):
+        _update_questions(
+            EvolutionQuestion,
+            import_entities,
+            [
+                "nascent_description",
+                "engaged_description",
+                "capable_description",
+                "effective_description",
+            ],
+            change_set,
+        )
 
     def _cleanup_questions(self):
         EvolutionQuestion.objects.all().delete()
 
-    def _import_questions(self, imported_questions: List[XlsxLineObject]):
-        for q_question in imported_questions:
-            # Create new question
-            p_found = Program.objects.get(name__iexact=q_question.program)
-            c_question = EvolutionQuestion(
+    def _get_replaced_answers(self) -> models.QuerySet:
+        return Answer.objects.filter(
+            question__in=EvolutionQuestion.objects.values("pk")
+        )
+
+    def _get_questions(
+        self,
+        imported_questions: List[XlsxLineObject],
+        program_index: EpicProgramIndex,
+    ) -> List[EvolutionQuestion]:
+        return [
+            EvolutionQuestion(
                 title=q_question.dimension,
                 nascent_description=q_question.nascent_description,
                 engaged_description=q_question.engaged_description,
                 capable_description=q_question.capable_description,
                 effective_description=q_question.effective_description,
-                program=p_found,
+                program=program_index.get(q_question.program),
             )
-            c_question.save()
+            for q_question in imported_questions
+        ]
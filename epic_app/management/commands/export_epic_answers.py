@@ -0,0 +1,24 @@
+from pathlib import Path
+from typing import Any, Optional
+
+from django.core.management.base import BaseCommand
+
+from epic_app.exporters.answers_jsonl_exporter import AnswersJsonlExporter
+
+
+class Command(BaseCommand):
+    help = "Exports all the answers into a JSON lines file (gzipped when ending with '.gz'), referencing users, questions and programs by their natural keys so they can be imported into another EPIC instance."
+
+    def add_arguments(self, parser):
+        parser.add_argument("output_file", type=Path)
+        parser.add_argument("--chunk-size", type=int, default=2000)
+
+    def handle(self, *args: Any, **options: Any) -> Optional[str]:
+        n_answers = AnswersJsonlExporter(options["chunk_size"]).export(
+            options["output_file"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported {n_answers} answers to {options['output_file']}."
+            )
+        )
@@ -0,0 +1,30 @@
+from pathlib import Path
+from typing import Any, Optional
+
+from django.core.management.base import BaseCommand, CommandError
+from django.forms import ValidationError
+
+from epic_app.importers.answers_jsonl_importer import AnswersJsonlImporter
+
+
+class Command(BaseCommand):
+    help = "Imports the answers of a JSON lines file created with 'export_epic_answers', creating or updating the answer of each user to each question."
+
+    def add_arguments(self, parser):
+        parser.add_argument("input_file", type=Path)
+        parser.add_argument("--chunk-size", type=int, default=2000)
+
+    def handle(self, *args: Any, **options: Any) -> Optional[str]:
+        input_file: Path = options["input_file"]
+        if not input_file.is_file():
+            raise CommandError(f"File to import not found at {input_file}")
+        try:
+            n_answers = AnswersJsonlImporter(options["chunk_size"]).import_file(
+                input_file
+            )
+        except ValidationError as err_info:
+            self.stdout.write(self.style.ERROR(f"Failed to import {input_file}."))
+            raise CommandError("\n".join(err_info.messages))
+        self.stdout.write(
+            self.style.SUCCESS(f"Imported {n_answers} answers from {input_file}.")
+        )
@@ -1,9 +1,14 @@
+import itertools
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Optional, Type
+from typing import Any, List, Optional, Tuple, Type
 
+import django
 from django.core.management import call_command
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
 
+from epic_app.exporters.domain_snapshot_exporter import export_domain_snapshot
 from epic_app.importers.xlsx import (
     BaseEpicImporter,
     EpicAgencyImporter,
@@ -15,56 +20,118 @@ from epic_app.importers.xlsx import (
 from epic_app.models.epic_questions import LinkagesQuestion
 
 
+def _read_file_lines(
+    epic_importer: Type[BaseEpicImporter], import_file: Path
+) -> List[BaseEpicImporter.XlsxLineObject]:
+    return epic_importer().read_lines(import_file)
+
+
 class Command(BaseCommand):
-    help = "Imports all the available Epic files within the provided directory, replacing the previous related tables for the Epic domain."
+    help = "Imports all the available Epic files (xlsx, csv or parquet) within the provided directory, replacing the previous related tables for the Epic domain."
+
+    # Files (without extension) per import stage, each stage depends on the data of the previous ones.
+    _import_stages: List[List[Tuple[str, Type[BaseEpicImporter]]]] = [
+        [("initial_epic_data", EpicDomainImporter)],
+        [
+            ("agency_data", EpicAgencyImporter),
+            ("nationalframeworkquestions", NationalFrameworkQuestionImporter),
+            ("keyagencyactionsquestions", KeyAgencyActionsQuestionImporter),
+            ("evolutionquestions", EvolutionQuestionImporter),
+        ],
+    ]
 
     def add_arguments(self, parser):
         parser.add_argument("domain_files", type=Path, nargs="?")
+        parser.add_argument(
+            "--differential",
+            action="store_true",
+            help="Only apply the differences with the existing domain, keeping the answers of the unchanged questions.",
+        )
 
-    def _import_files(self, import_files_dir: Path):
+    def _import_files(self, import_files_dir: Path, differential: bool = False):
         """
         Imports all the available files to create a reliable test environment.
+        As reading the workbooks is CPU bound and does not require the database, all of them are read at once in a process pool, whereas their lines are written stage after stage, so each import finds the data it depends on.
 
         Args:
             import_files_dir (Path): Path to the test directory.
+            differential (bool, optional): Whether to only apply the differences with the existing domain. Defaults to False.
+
+        Raises:
+            CommandError: When any file of a stage fails to import, as the next stages (and the linkages) depend on it.
         """
 
-        def import_and_log(filepath: Path, epic_importer: Type[BaseEpicImporter]):
-            import_file = import_files_dir / filepath
-            if import_file.is_file():
+        def import_and_log(
+            import_file: Path, epic_importer: Type[BaseEpicImporter], read_lines: Future
+        ) -> bool:
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(f"Importing main data from {import_file}.")
+            )
+            try:
+                change_set = epic_importer(differential).import_lines(
+                    read_lines.result()
+                )
+                self.stdout.write(self.style.SUCCESS("Import successful."))
+                self.stdout.write(str(change_set))
+                return True
+            except Exception as err_info:
+                self.stdout.write(
+                    self.style.ERROR(f"Failed to import {import_file.name}.")
+                )
                 self.stdout.write(
-                    self.style.MIGRATE_HEADING(
-                        f"Importing main data from {import_file}."
+                    self.style.ERROR_OUTPUT(
+                        "\n".join(getattr(err_info, "messages", [str(err_info)]))
                     )
                 )
-                try:
-                    epic_importer().import_file(import_file)
-                    self.stdout.write(self.style.SUCCESS("Import successful."))
-                except Exception as err_info:
-                    self.stdout.write(self.style.ERROR(f"Failed to import {filepath}."))
+                return False
+
+        # Forked workers would otherwise share the parent's database connections.
+        connections.close_all()
+        with ProcessPoolExecutor(initializer=django.setup) as executor:
+            _read_lines = {}
+            for filename, epic_importer in itertools.chain(*self._import_stages):
+                # The first file found in any of the supported formats gets imported.
+                import_file = next(
+                    (
+                        import_files_dir / f"{filename}{file_extension}"
+                        for file_extension in epic_importer.file_readers
+                        if (import_files_dir / f"{filename}{file_extension}").is_file()
+                    ),
+                    None,
+                )
+                if not import_file:
                     self.stdout.write(
-                        self.style.ERROR_OUTPUT("\n".join(err_info.messages))
+                        self.style.ERROR(
+                            f"File to import not found for {filename} ({', '.join(epic_importer.file_readers)})"
+                        )
                     )
-            else:
-                self.stdout.write(
-                    self.style.ERROR(f"File to import not found at {filepath}")
+                    continue
+                _read_lines[filename] = (
+                    import_file,
+                    executor.submit(_read_file_lines, epic_importer, import_file),
                 )
+            for import_stage in self._import_stages:
+                _failed_files = []
+                for filename, epic_importer in import_stage:
+                    if filename in _read_lines:
+                        import_file, read_lines = _read_lines[filename]
+                        if not import_and_log(import_file, epic_importer, read_lines):
+                            _failed_files.append(import_file.name)
+                if _failed_files:
+                    raise CommandError(
+                        f"Stopped importing the EPIC domain after failing to import: {', '.join(_failed_files)}."
+                    )
 
-        import_and_log("initial_epic_data.xlsx", EpicDomainImporter)
-        import_and_log("agency_data.xlsx", EpicAgencyImporter)
-        import_and_log(
-            "nationalframeworkquestions.xlsx", NationalFrameworkQuestionImporter
-        )
-        import_and_log(
-            "keyagencyactionsquestions.xlsx", KeyAgencyActionsQuestionImporter
-        )
-        import_and_log("evolutionquestions.xlsx", EvolutionQuestionImporter)
         LinkagesQuestion.generate_linkages()
         self.stdout.write(
             self.style.SUCCESS("Generated one linkage question per loaded program.")
         )
+        _snapshot_file = export_domain_snapshot()
+        self.stdout.write(
+            self.style.SUCCESS(f"Exported the domain snapshot to {_snapshot_file}.")
+        )
 
-    def _import_epic_db(self, data_dir: Path):
+    def _import_epic_db(self, data_dir: Path, differential: bool = False):
         if not data_dir.is_dir():
             self.stdout.write(
                 self.style.ERROR(
@@ -72,7 +139,10 @@ class Command(BaseCommand):
                 )
             )
         try:
-            self._import_files(data_dir)
+            self._import_files(data_dir, differential)
+        except CommandError:
+            # The failed imports did not write anything, so the imported data is kept.
+            raise
         except Exception as e_info:
             call_command("flush", "--no-input")
             self.stdout.write(
@@ -83,7 +153,9 @@ class Command(BaseCommand):
 
     def handle(self, *args: Any, **options: Any) -> Optional[str]:
         try:
-            self._import_epic_db(options["domain_files"])
+            self._import_epic_db(options["domain_files"], options["differential"])
+        except CommandError:
+            raise
         except Exception as e_info:
             self.stdout.write(
                 self.style.ERROR(
@@ -0,0 +1,81 @@
+import logging
+from typing import Any, List, Optional
+
+from django.core.management.base import BaseCommand, CommandError
+
+from epic_app.externals.ERAMVisuals import eram_visuals_r_packages
+from epic_app.externals.ERAMVisuals.eram_visuals_wrapper import EramVisualsRunner
+from epic_app.externals.external_command import get_job_logger, run_external_command
+
+
+class Command(BaseCommand):
+    help = "Installs (when missing) and verifies the R packages required by the ERAM visuals. Meant to run at deploy time so requests never install packages. Use flag --check-only to only verify them."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check-only",
+            action="store_true",
+            help="Only verifies the packages are installed, nothing gets installed.",
+        )
+        parser.add_argument(
+            "--repo",
+            type=str,
+            default="https://cloud.r-project.org",
+            help="CRAN mirror used to install the missing packages.",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=1800,
+            help="Maximum seconds each R process is allowed to run.",
+        )
+
+    def _get_r_packages_vector(self) -> str:
+        return "c({})".format(", ".join(f'"{p}"' for p in eram_visuals_r_packages))
+
+    def _get_install_expression(self, repo: str) -> str:
+        return (
+            f"pkgs <- {self._get_r_packages_vector()}; "
+            "missing <- pkgs[!sapply(pkgs, requireNamespace, quietly = TRUE)]; "
+            f'if (length(missing) > 0) install.packages(missing, repos = "{repo}")'
+        )
+
+    def _get_check_expression(self) -> str:
+        return (
+            f"pkgs <- {self._get_r_packages_vector()}; "
+            "missing <- pkgs[!sapply(pkgs, requireNamespace, quietly = TRUE)]; "
+            'if (length(missing) > 0) { cat("Missing:", missing, "\\n"); quit(status = 1) }'
+        )
+
+    def _run_rscript(
+        self, rscript: str, expression: str, timeout: float, logger: logging.Logger
+    ) -> None:
+        _command: List[str] = [rscript, "-e", expression]
+        _result = run_external_command(_command, timeout=timeout, logger=logger)
+        if not _result.succeeded:
+            raise CommandError(
+                f"Rscript failed with code {_result.return_code}:\n{_result.stdout}{_result.stderr}"
+            )
+
+    def handle(self, *args: Any, **options: Any) -> Optional[str]:
+        try:
+            _rscript = EramVisualsRunner().get_rscript().as_posix()
+        except Exception as e_info:
+            raise CommandError(f"No Rscript executable available: {e_info}")
+        with get_job_logger(__name__) as _logger:
+            if not options["check_only"]:
+                self.stdout.write(f"Installing R packages with {_rscript}.")
+                self._run_rscript(
+                    _rscript,
+                    self._get_install_expression(options["repo"]),
+                    options["timeout"],
+                    _logger,
+                )
+            self._run_rscript(
+                _rscript, self._get_check_expression(), options["timeout"], _logger
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"R packages available: {', '.join(eram_visuals_r_packages)}."
+            )
+        )
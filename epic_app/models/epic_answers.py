@@ -97,6 +97,19 @@ class Answer(models.Model):
             "Validation only supported on inherited Answer classes."
         )
 
+    @staticmethod
+    def get_is_valid_answer_expression() -> models.Expression:
+        """
+        Database equivalent of `is_valid_answer`, so it can be used to annotate
+        querysets of the concrete classes.
+
+        Returns:
+            models.Expression: Boolean expression.
+        """
+        raise NotImplementedError(
+            "Validation only supported on inherited Answer classes."
+        )
+
     @staticmethod
     def get_detailed_summary(answers_list: List[Answer]) -> Dict[str, Any]:
         raise NotImplementedError(
@@ -117,6 +130,13 @@ class AgreementAnswer(Answer):
     def is_valid_answer(self) -> bool:
         return self.selected_choice in AgreementAnswerType
 
+    @staticmethod
+    def get_is_valid_answer_expression() -> models.Expression:
+        return models.ExpressionWrapper(
+            models.Q(selected_choice__in=AgreementAnswerType.values),
+            output_field=models.BooleanField(),
+        )
+
     @staticmethod
     def get_detailed_summary(answers_list: List[AgreementAnswer]) -> Dict[str, Any]:
         def _agreement_type_summary(filter_type: AgreementAnswerType) -> Dict[str, Any]:
@@ -163,6 +183,13 @@ class EvolutionAnswer(Answer):
     def is_valid_answer(self) -> bool:
         return self.selected_choice in EvolutionChoiceType
 
+    @staticmethod
+    def get_is_valid_answer_expression() -> models.Expression:
+        return models.ExpressionWrapper(
+            models.Q(selected_choice__in=EvolutionChoiceType.values),
+            output_field=models.BooleanField(),
+        )
+
     @staticmethod
     def get_detailed_summary(
         answers_list: Union[models.QuerySet, List[EvolutionAnswer]]
@@ -202,6 +229,14 @@ class MultipleChoiceAnswer(Answer):
     def is_valid_answer(self) -> bool:
         return any(self.selected_programs.all())
 
+    @staticmethod
+    def get_is_valid_answer_expression() -> models.Expression:
+        return models.Exists(
+            MultipleChoiceAnswer.selected_programs.through.objects.filter(
+                multiplechoiceanswer_id=models.OuterRef("pk")
+            )
+        )
+
     @staticmethod
     def get_detailed_summary(answers_list: List[AgreementAnswer]) -> Dict[str, Any]:
         all_sp = {
@@ -0,0 +1,79 @@
+from typing import Dict, List
+
+from django.db import models
+from django.utils import timezone
+
+
+class DataVersionType(models.TextChoices):
+    ANSWERS = "ANSWERS"
+    DOMAIN = "DOMAIN"
+    USERS = "USERS"
+
+
+class DataVersion(models.Model):
+    """
+    Counter increased every time the data it represents changes. As it lives in the
+    database, all processes of the service can build cache keys on top of it.
+
+    Args:
+        models (models.Model): Derives directly from base class Model.
+    """
+
+    name: str = models.CharField(
+        max_length=50, choices=DataVersionType.choices, unique=True
+    )
+    version: int = models.PositiveBigIntegerField(default=0)
+    updated_on = models.DateTimeField(default=timezone.now)
+
+    def __str__(self) -> str:
+        # The timestamp keeps versions unique even after the table gets flushed.
+        _timestamp = self.updated_on.timestamp() if self.updated_on else 0
+        return f"{self.name.lower()}{self.version}-{_timestamp}"
+
+    @classmethod
+    def bump(cls, name: DataVersionType) -> None:
+        """
+        Increases the version of the data with the given `name`.
+
+        Args:
+            name (DataVersionType): Data that has changed.
+        """
+        _versions = cls.objects.filter(name=name)
+        _updated = _versions.update(
+            version=models.F("version") + 1, updated_on=timezone.now()
+        )
+        if not _updated:
+            cls.objects.get_or_create(name=name)
+            _versions.update(version=models.F("version") + 1, updated_on=timezone.now())
+
+    @classmethod
+    def get_versions(cls, names: List[DataVersionType]) -> Dict[str, "DataVersion"]:
+        """
+        Gets the versions of the given data names in a single query. Names without
+        changes registered yet are returned as (unsaved) version 0.
+
+        Args:
+            names (List[DataVersionType]): Names of the data to check.
+
+        Returns:
+            Dict[str, DataVersion]: Version per data name.
+        """
+        names = [DataVersionType(name).value for name in names]
+        _versions = {dv.name: dv for dv in cls.objects.filter(name__in=names)}
+        return {
+            name: _versions.get(name, cls(name=name, updated_on=None)) for name in names
+        }
+
+    @classmethod
+    def get_cache_key(cls, prefix: str, names: List[DataVersionType]) -> str:
+        """
+        Gets a cache key which changes whenever any of the given data changes.
+
+        Args:
+            prefix (str): Prefix identifying the cached content.
+            names (List[DataVersionType]): Data the cached content depends on.
+
+        Returns:
+            str: Cache key.
+        """
+        return ":".join([prefix] + list(map(str, cls.get_versions(names).values())))
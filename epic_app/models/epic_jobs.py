@@ -0,0 +1,252 @@
+import logging
+import shutil
+import uuid
+from datetime import timedelta
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Type
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import UploadedFile
+from django.db import models
+from django.forms import ValidationError
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from django.utils.translation import gettext_lazy as _
+
+from epic_app.exporters.domain_snapshot_exporter import export_domain_snapshot
+from epic_app.externals import EramVisualsWrapper, get_eram_visuals_runner
+from epic_app.externals.external_wrapper_base import ExternalWrapperStatusType
+from epic_app.importers.xlsx.base_importer import EpicImportChangeSet
+
+
+class JobStatusType(models.TextChoices):
+    PENDING = "PENDING", _("Pending")
+    RUNNING = "RUNNING", _("Running")
+    SUCCEEDED = "SUCCEEDED", _("Succeeded")
+    FAILED = "FAILED", _("Failed")
+
+
+class EvolutionGraphJob(models.Model):
+    """
+    Background generation of the ERAM visuals for an evolution summary.
+    Each job renders into its own directory within the media root, which is removed
+    along with the job once expired (see `clean_up`).
+    """
+
+    _media_dir = "evolution_graph_jobs"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    requested_by = models.ForeignKey(
+        to=User,
+        on_delete=models.SET_NULL,
+        related_name="evolution_graph_jobs",
+        blank=True,
+        null=True,
+    )
+    status = models.CharField(
+        max_length=50, choices=JobStatusType.choices, default=JobStatusType.PENDING
+    )
+    reason = models.TextField(blank=True, default="")
+    summary_data = models.JSONField(default=list)
+    created_on = models.DateTimeField(auto_now_add=True)
+    updated_on = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"Evolution graph {self.id} ({self.status})"
+
+    @property
+    def media_dir(self) -> str:
+        """
+        Directory of this job's output, relative to the media root.
+        """
+        return f"{self._media_dir}/{self.id}"
+
+    @property
+    def output_dir(self) -> Path:
+        return Path(settings.MEDIA_ROOT) / self.media_dir
+
+    def _set_status(self, status: JobStatusType, reason: str = "") -> None:
+        self.status = status
+        self.reason = reason
+        self.save(update_fields=["status", "reason", "updated_on"])
+
+    @classmethod
+    def clean_up(cls) -> None:
+        """
+        Marks as failed the unfinished jobs not updated within `EVOLUTION_GRAPH_JOBS_STALE_AFTER`
+        seconds (their thread was lost, e.g. on a restart), and removes the jobs (and their
+        output) created more than `EVOLUTION_GRAPH_JOBS_RETENTION` seconds ago.
+        """
+        _now = timezone.now()
+        cls.objects.filter(
+            status__in=[JobStatusType.PENDING, JobStatusType.RUNNING],
+            updated_on__lt=_now
+            - timedelta(seconds=settings.EVOLUTION_GRAPH_JOBS_STALE_AFTER),
+        ).update(
+            status=JobStatusType.FAILED,
+            reason="The graph generation was interrupted before finishing.",
+            updated_on=_now,
+        )
+        _expired_jobs = cls.objects.filter(
+            created_on__lt=_now
+            - timedelta(seconds=settings.EVOLUTION_GRAPH_JOBS_RETENTION)
+        )
+        for expired_job in _expired_jobs:
+            shutil.rmtree(expired_job.output_dir, ignore_errors=True)
+        _expired_jobs.delete()
+
+    def run(self, input_file: Path) -> None:
+        """
+        Renders the ERAM visuals of `input_file` into this job's output directory.
+        The outcome is stored in the job status rather than raised.
+
+        Args:
+            input_file (Path): Csv file with the evolution summary.
+        """
+        self._set_status(JobStatusType.RUNNING)
+        eram_wrapper = EramVisualsWrapper(
+            input_file=input_file,
+            output_dir=self.output_dir,
+            runner=get_eram_visuals_runner(),
+        )
+        eram_wrapper.execute()
+        if eram_wrapper.status.status_type == ExternalWrapperStatusType.SUCCEEDED:
+            self._set_status(JobStatusType.SUCCEEDED)
+        else:
+            self._set_status(
+                JobStatusType.FAILED,
+                f"The graph generation failed during execution: {eram_wrapper.status}",
+            )
+
+
+class ImportJob(models.Model):
+    """
+    Background import of a file uploaded through the admin page, so large files are not
+    imported within the upload request. The job keeps track of its progress and the
+    uploaded file is kept in `settings.IMPORT_JOBS_DIR`, outside the (public) media
+    root, until the job is done.
+    """
+
+    # Amount of parsed rows between progress updates.
+    _progress_step = 500
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    requested_by = models.ForeignKey(
+        to=User,
+        on_delete=models.SET_NULL,
+        related_name="import_jobs",
+        blank=True,
+        null=True,
+    )
+    importer_type = models.CharField(max_length=250)
+    differential = models.BooleanField(default=False)
+    file_name = models.CharField(max_length=250)
+    status = models.CharField(
+        max_length=50, choices=JobStatusType.choices, default=JobStatusType.PENDING
+    )
+    rows_parsed = models.PositiveIntegerField(default=0)
+    # Created, updated and deleted entities per type (replace imports delete and create them all).
+    changes = models.JSONField(default=dict)
+    errors = models.JSONField(default=list)
+    warnings = models.JSONField(default=list)
+    created_on = models.DateTimeField(auto_now_add=True)
+    updated_on = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"Import {self.file_name} {self.id} ({self.status})"
+
+    @classmethod
+    def create_from_upload(
+        cls, importer_type: Type, uploaded_file: UploadedFile, **job_fields
+    ) -> "ImportJob":
+        """
+        Creates a pending job saving the uploaded file to disk, so it can be imported
+        once the upload request is done.
+
+        Args:
+            importer_type (Type): `BaseEpicImporter` subtype to import the file with.
+            uploaded_file (UploadedFile): File uploaded through the admin page.
+
+        Returns:
+            ImportJob: Created job.
+        """
+        import_job = cls(
+            importer_type=f"{importer_type.__module__}.{importer_type.__qualname__}",
+            file_name=Path(uploaded_file.name).name,
+            **job_fields,
+        )
+        import_job.upload_dir.mkdir(parents=True, exist_ok=True)
+        with import_job.input_file.open("wb") as input_stream:
+            for file_chunk in uploaded_file.chunks():
+                input_stream.write(file_chunk)
+        import_job.save()
+        return import_job
+
+    @property
+    def upload_dir(self) -> Path:
+        return Path(settings.IMPORT_JOBS_DIR) / str(self.id)
+
+    @property
+    def input_file(self) -> Path:
+        return self.upload_dir / self.file_name
+
+    @property
+    def is_done(self) -> bool:
+        return self.status in (JobStatusType.SUCCEEDED, JobStatusType.FAILED)
+
+    def _set_status(self, status: JobStatusType, **job_fields) -> None:
+        self.status = status
+        for field_name, value in job_fields.items():
+            setattr(self, field_name, value)
+        self.save(update_fields=["status", *job_fields, "updated_on"])
+
+    def _track_parsed_lines(self, line_objects: Iterable) -> Iterator:
+        for line_object in line_objects:
+            yield line_object
+            self.rows_parsed += 1
+            if self.rows_parsed % self._progress_step == 0:
+                self.save(update_fields=["rows_parsed", "updated_on"])
+        self.save(update_fields=["rows_parsed", "updated_on"])
+
+    def _import_file(self) -> Optional[EpicImportChangeSet]:
+        _importer = import_string(self.importer_type)(differential=self.differential)
+        return _importer.import_lines(
+            self._track_parsed_lines(_importer.iter_lines(self.input_file))
+        )
+
+    def run(self) -> None:
+        """
+        Imports the uploaded file, updating the amount of parsed rows as it goes.
+        As the rows are only written (all at once) after all of them are validated,
+        the written changes are only set when the import succeeds. Afterwards the
+        domain snapshot is exported; as the import is committed by then, a failed
+        export is reported as a warning of the succeeded job.
+        The outcome is stored in the job status rather than raised.
+        """
+        self._set_status(JobStatusType.RUNNING, rows_parsed=0, changes={}, warnings=[])
+        try:
+            change_set = self._import_file()
+        except ValidationError as err_info:
+            self._set_status(JobStatusType.FAILED, errors=err_info.messages)
+            return
+        except Exception as e_info:
+            logging.exception(e_info)
+            self._set_status(
+                JobStatusType.FAILED, errors=[f"Unexpected error: {e_info}"]
+            )
+            return
+        finally:
+            shutil.rmtree(self.upload_dir, ignore_errors=True)
+
+        _warnings = []
+        try:
+            export_domain_snapshot()
+        except Exception as e_info:
+            logging.exception(e_info)
+            _warnings.append(f"The domain snapshot could not be exported: {e_info}")
+        self._set_status(
+            JobStatusType.SUCCEEDED,
+            changes=change_set.get_counts(),
+            warnings=_warnings,
+        )
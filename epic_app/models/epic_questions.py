@@ -124,9 +124,10 @@ class LinkagesQuestion(Question):
     @staticmethod
     def generate_linkages():
         """
-        Generates linkages questions for all the available programs
+        Generates linkages questions for all the available programs without one yet.
         """
-        for p_obj in base_models.Program.objects.all():
+        _linked_programs = LinkagesQuestion.objects.values_list("program_id")
+        for p_obj in base_models.Program.objects.exclude(pk__in=_linked_programs):
             LinkagesQuestion(
                 title=LinkagesQuestion._linkages_title, program=p_obj
             ).save()
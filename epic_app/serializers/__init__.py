@@ -1,7 +1,11 @@
 # Expose all neede serializers here.
 from epic_app.serializers.agency_serializer import AgencySerializer
-from epic_app.serializers.answer_serializer import AnswerSerializer
+from epic_app.serializers.answer_serializer import (
+    AnswerBatchSerializer,
+    AnswerSerializer,
+)
 from epic_app.serializers.area_serializer import AreaSerializer
+from epic_app.serializers.completion_serializer import CompletionMatrixSerializer
 from epic_app.serializers.epic_user_serializer import (
     EpicOrganizationSerializer,
     EpicUserSerializer,
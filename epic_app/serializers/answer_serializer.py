@@ -1,5 +1,7 @@
-from typing import Type
+from collections import defaultdict
+from typing import Any, Dict, List, Set, Tuple, Type
 
+from django.db import transaction
 from rest_framework import serializers
 
 from epic_app.models.epic_answers import (
@@ -9,8 +11,15 @@ from epic_app.models.epic_answers import (
     EvolutionAnswer,
     MultipleChoiceAnswer,
 )
+from epic_app.models.epic_data_version import DataVersion, DataVersionType
 from epic_app.models.epic_questions import EvolutionChoiceType
-from epic_app.utils import get_instance_as_submodel_type
+from epic_app.models.epic_user import EpicUser
+from epic_app.models.models import Program
+from epic_app.utils import (
+    bulk_create_submodels,
+    get_instance_as_submodel_type,
+    get_submodel_type_list,
+)
 
 
 class _BaseAnswerSerializer(serializers.ModelSerializer):
@@ -67,3 +76,208 @@ class MultipleChoiceAnswerSerializer(_BaseAnswerSerializer):
 
     def update(self, instance: Answer, validated_data):
         return super().update(instance, validated_data)
+
+
+class AnswerBatchSerializer(serializers.BaseSerializer):
+    """
+    Serializer to validate and upsert (create or update) a list of `Answer` items of
+    the context `EpicUser` at once. Each item contains the `question` and the fields
+    of its concrete `Answer` subtype (`selected_choice`, `justify_answer` or
+    `selected_programs`), which are validated with the concrete serializers' fields.
+    """
+
+    _related_fields = ("id", "url", "user", "question")
+    get_concrete_serializer = staticmethod(
+        _BaseAnswerSerializer.get_concrete_serializer
+    )
+
+    def _get_context_epic_user(self) -> EpicUser:
+        try:
+            return self.context["request"].user.epicuser
+        except:
+            raise ValueError("No EpicUser found in context-request.")
+
+    @staticmethod
+    def _get_answer_types(question_ids: List[int]) -> Dict[int, Type[Answer]]:
+        """
+        Gets the `Answer` subtype for each of the given questions with a single query
+        per `Question` subtype.
+        """
+        question_ids = [q_id for q_id in question_ids if isinstance(q_id, int)]
+        answer_types = {}
+        for answer_type in get_submodel_type_list(Answer):
+            for question_type in answer_type._get_supported_questions():
+                answer_types.update(
+                    (q_id, answer_type)
+                    for q_id in question_type.objects.filter(
+                        pk__in=question_ids
+                    ).values_list("pk", flat=True)
+                )
+        return answer_types
+
+    def _validate_item(
+        self,
+        item: Any,
+        answer_types: Dict[int, Type[Answer]],
+        program_ids: Set[int],
+    ) -> Tuple[Type[Answer], dict]:
+        if not isinstance(item, dict):
+            raise serializers.ValidationError(
+                {"non_field_errors": ["Expected a dictionary of answer fields."]}
+            )
+        answer_type = answer_types.get(item.get("question"), None)
+        if not answer_type:
+            raise serializers.ValidationError({"question": ["Invalid question."]})
+        _fields = self.get_concrete_serializer(answer_type)().fields
+        validated_item = {"question_id": item["question"]}
+        errors = {}
+        for field_name, value in item.items():
+            if field_name in self._related_fields or field_name not in _fields:
+                continue
+            if field_name == "selected_programs":
+                # Checked against all programs at once, instead of a query per id.
+                if not isinstance(value, list) or not all(
+                    isinstance(p_id, int) and p_id in program_ids for p_id in value
+                ):
+                    errors[field_name] = ["Invalid program ids."]
+                    continue
+                validated_item[field_name] = list(dict.fromkeys(value))
+                continue
+            try:
+                validated_item[field_name] = _fields[field_name].run_validation(value)
+            except serializers.ValidationError as e_info:
+                errors[field_name] = e_info.detail
+        if errors:
+            raise serializers.ValidationError(errors)
+        return answer_type, validated_item
+
+    def to_internal_value(self, data: Any) -> List[Tuple[Type[Answer], dict]]:
+        if not isinstance(data, list) or not data:
+            raise serializers.ValidationError(
+                {"non_field_errors": ["Expected a non-empty list of answers."]}
+            )
+        _question_ids = [i.get("question") for i in data if isinstance(i, dict)]
+        answer_types = self._get_answer_types(_question_ids)
+        program_ids = set()
+        if any(isinstance(i, dict) and "selected_programs" in i for i in data):
+            program_ids = set(Program.objects.values_list("id", flat=True))
+
+        validated_data, errors = [], []
+        for item in data:
+            try:
+                validated_data.append(
+                    self._validate_item(item, answer_types, program_ids)
+                )
+                errors.append({})
+            except serializers.ValidationError as e_info:
+                errors.append(e_info.detail)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        if len(set(_question_ids)) != len(_question_ids):
+            raise serializers.ValidationError(
+                {"non_field_errors": ["Each question can only be answered once."]}
+            )
+        return validated_data
+
+    def _set_selected_programs(self, selected_programs: Dict[int, List[int]]) -> None:
+        if not selected_programs:
+            return
+        _through = MultipleChoiceAnswer.selected_programs.through
+        _through.objects.filter(
+            multiplechoiceanswer_id__in=selected_programs.keys()
+        ).delete()
+        _through.objects.bulk_create(
+            [
+                _through(multiplechoiceanswer_id=answer_id, program_id=program_id)
+                for answer_id, program_ids in selected_programs.items()
+                for program_id in program_ids
+            ]
+        )
+
+    def create(self, validated_data: List[Tuple[Type[Answer], dict]]) -> List[Answer]:
+        """
+        Upserts all the validated items in a single transaction with bulk queries,
+        as `bulk_create` cannot upsert multi-table inherited models.
+        """
+        epic_user = self._get_context_epic_user()
+        items_by_type: Dict[Type[Answer], List[dict]] = defaultdict(list)
+        for answer_type, item in validated_data:
+            items_by_type[answer_type].append(item)
+
+        answer_ids: Dict[int, int] = {}
+        selected_programs: Dict[int, List[int]] = {}
+        with transaction.atomic():
+            # Lock the user so concurrent batches of the same user are applied one after
+            # the other, otherwise both could try to create the same (new) answers.
+            list(
+                EpicUser.objects.select_for_update()
+                .filter(pk=epic_user.pk)
+                .values_list("pk", flat=True)
+            )
+            for answer_type, items in items_by_type.items():
+                existing_answers = {
+                    a.question_id: a
+                    for a in answer_type.objects.filter(
+                        user=epic_user,
+                        question_id__in=[i["question_id"] for i in items],
+                    )
+                }
+                to_update, to_create = [], []
+                update_fields = set()
+                for item in items:
+                    _fields = {
+                        k: v for k, v in item.items() if k != "selected_programs"
+                    }
+                    answer = existing_answers.get(item["question_id"], None)
+                    if answer:
+                        to_update.append(answer)
+                        update_fields.update(_fields.keys() - {"question_id"})
+                    else:
+                        answer = answer_type(user=epic_user)
+                        to_create.append(answer)
+                    for field_name, value in _fields.items():
+                        setattr(answer, field_name, value)
+                if to_update and update_fields:
+                    answer_type.objects.bulk_update(to_update, list(update_fields))
+                bulk_create_submodels(answer_type, to_create)
+                for answer in to_update + to_create:
+                    answer_ids[answer.question_id] = answer.pk
+                selected_programs.update(
+                    (answer_ids[i["question_id"]], i["selected_programs"])
+                    for i in items
+                    if "selected_programs" in i
+                )
+            self._set_selected_programs(selected_programs)
+            # Bulk queries do not send the signals updating the answers version.
+            DataVersion.bump(DataVersionType.ANSWERS)
+
+        upserted_answers = {}
+        for answer_type, items in items_by_type.items():
+            _answers = answer_type.objects.filter(
+                pk__in=[answer_ids[i["question_id"]] for i in items]
+            )
+            if answer_type == MultipleChoiceAnswer:
+                _answers = _answers.prefetch_related("selected_programs")
+            upserted_answers.update((a.pk, a) for a in _answers)
+        return [
+            upserted_answers[answer_ids[item["question_id"]]]
+            for _, item in validated_data
+        ]
+
+    def save(self, **kwargs) -> List[Answer]:
+        """
+        Override of the save method, as the validated data is a list instead of the
+        dictionary expected by `BaseSerializer.save`.
+        """
+        assert hasattr(self, "_errors"), "You must call `.is_valid()` first."
+        assert not self.errors, "Cannot call `.save()` with invalid data."
+        self.instance = self.create(self.validated_data)
+        return self.instance
+
+    def to_representation(self, instance: List[Answer]) -> List[dict]:
+        return [
+            self.get_concrete_serializer(type(answer))(
+                answer, context=self.context
+            ).data
+            for answer in instance
+        ]
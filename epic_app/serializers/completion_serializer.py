@@ -0,0 +1,80 @@
+from collections import defaultdict
+from typing import Dict, List, Tuple, Union
+
+from django.db import models
+from rest_framework import serializers
+
+from epic_app.models.epic_answers import Answer
+from epic_app.models.epic_questions import Question
+from epic_app.models.epic_user import EpicUser
+from epic_app.models.models import Program
+from epic_app.utils import get_submodel_type_list
+
+# (user id, program id) -> [answered, valid]
+_CompletionCounts = Dict[Tuple[int, int], List[int]]
+
+
+class CompletionMatrixSerializer(serializers.BaseSerializer):
+    """
+    Serializer to show, for each of the given `EpicUser`, how many questions of each
+    `Program` they have answered, how many of those answers are valid and how many
+    questions there are in total. Counts are computed with aggregated queries, one
+    per `Answer` subtype, using their `get_is_valid_answer_expression`.
+    Only meant for GET / FETCH endpoints.
+    """
+
+    def _get_completion_counts(self, users: models.QuerySet) -> _CompletionCounts:
+        completion_counts = defaultdict(lambda: [0, 0])
+        for answer_type in get_submodel_type_list(Answer):
+            _counts = (
+                answer_type.objects.filter(user__in=users)
+                .annotate(is_valid=answer_type.get_is_valid_answer_expression())
+                .values("user_id", "question__program_id")
+                .annotate(
+                    answered=models.Count("id"),
+                    valid=models.Count("id", filter=models.Q(is_valid=True)),
+                )
+                .order_by()
+            )
+            for _count in _counts:
+                _user_program = completion_counts[
+                    (_count["user_id"], _count["question__program_id"])
+                ]
+                _user_program[0] += _count["answered"]
+                _user_program[1] += _count["valid"]
+        return completion_counts
+
+    def _get_program_totals(self) -> Dict[int, int]:
+        return dict(
+            Question.objects.values("program_id")
+            .annotate(total=models.Count("id"))
+            .order_by()
+            .values_list("program_id", "total")
+        )
+
+    def to_representation(self, instance: Union[models.QuerySet, List[EpicUser]]):
+        users = list(instance.select_related("organization").order_by("username"))
+        programs = list(Program.objects.order_by("id").values_list("id", flat=True))
+        program_totals = self._get_program_totals()
+        completion_counts = self._get_completion_counts(instance)
+
+        def get_user_completion(user: EpicUser) -> dict:
+            _completion = []
+            for program_id in programs:
+                answered, valid = completion_counts.get((user.id, program_id), (0, 0))
+                _completion.append(
+                    dict(
+                        program=program_id,
+                        answered=answered,
+                        valid=valid,
+                        total=program_totals.get(program_id, 0),
+                    )
+                )
+            return dict(
+                id=user.id,
+                username=user.username,
+                organization=user.organization.name if user.organization else None,
+                completion=_completion,
+            )
+
+        return [get_user_completion(user) for user in users]
@@ -1,12 +1,14 @@
-from typing import List, Optional, Tuple
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple, Union
 
+from django.db import models
 from rest_framework import serializers
 
 from epic_app.models.epic_answers import Answer
 from epic_app.models.epic_questions import Question
 from epic_app.models.epic_user import EpicUser
 from epic_app.models.models import Program
-from epic_app.utils import get_instance_as_submodel_type
+from epic_app.utils import get_submodel_type_list
 
 _QuestionAnswer = Tuple[Question, Optional[Answer]]
 
@@ -19,40 +21,101 @@ class _QuestionAnswerSerializer(serializers.BaseSerializer):
         return {"question": question.id, "answer": answer.id if answer else None}
 
 
+class ProgressListSerializer(serializers.ListSerializer):
+    """
+    Serializer to show the progress of the context `EpicUser` for multiple programs
+    at once, fetching all their questions and answers in a few grouped queries.
+    Only meant for GET / FETCH endpoints.
+    """
+
+    def to_representation(self, data: Union[models.QuerySet, List[Program]]):
+        programs = list(data.all() if isinstance(data, models.Manager) else data)
+        user_answers = self.child._get_user_answers(programs)
+        program_questions = defaultdict(list)
+        for question in Question.objects.filter(program__in=programs):
+            program_questions[question.program_id].append(question)
+        return [
+            {
+                "program": program.id,
+                **self.child._get_progress(program_questions[program.id], user_answers),
+            }
+            for program in programs
+        ]
+
+
 class ProgressSerializer(serializers.BaseSerializer):
     """
     Serializer to show the progress of the context `EpicUser`.
     Only meant for GET / FETCH endpoints.
     """
 
+    class Meta:
+        list_serializer_class = ProgressListSerializer
+
     def _get_context_epic_user(self) -> EpicUser:
         try:
             return self.context["request"].user
         except:
             raise ValueError("No user found in context-request.")
 
-    def _get_question_answer(self, question: Question) -> _QuestionAnswer:
+    def _get_user_answers(self, programs: List[Program]) -> Dict[int, Tuple[int, bool]]:
+        """
+        Gets the answers of the context `EpicUser` to the questions of `programs`
+        with a single annotated query per `Answer` subtype.
+
+        Args:
+            programs (List[Program]): Programs whose questions are answered.
+
+        Returns:
+            Dict[int, Tuple[int, bool]]: Answer id and validity per question id.
+        """
         progress_user: EpicUser = self._get_context_epic_user()
-        answer = None
-        try:
-            answer = Answer.objects.get(user=progress_user, question=question)
-            answer = get_instance_as_submodel_type(answer)
-        finally:
-            return (question, answer)
+        user_answers = {}
+        for answer_type in get_submodel_type_list(Answer):
+            _answers = (
+                answer_type.objects.filter(
+                    user_id=progress_user.pk, question__program__in=programs
+                )
+                .annotate(is_valid=answer_type.get_is_valid_answer_expression())
+                .values_list("question_id", "id", "is_valid")
+            )
+            user_answers.update(
+                (question_id, (answer_id, is_valid))
+                for question_id, answer_id, is_valid in _answers
+            )
+        return user_answers
+
+    def _get_total_progress(
+        self, questions: List[Question], user_answers: Dict[int, Tuple[int, bool]]
+    ) -> float:
+        if not questions:
+            return 0.0
+        valid_answers = sum(
+            user_answers[q.id][1] for q in questions if q.id in user_answers
+        )
+        return valid_answers / len(questions)
 
-    def _get_total_progress(self, answer_list: List[_QuestionAnswer]) -> float:
-        valid_answers = sum(a.is_valid_answer() for _, a in answer_list if a)
-        return valid_answers / len(answer_list)
+    def _get_progress(
+        self, questions: List[Question], user_answers: Dict[int, Tuple[int, bool]]
+    ) -> dict:
+        def get_question_answer(question: Question) -> _QuestionAnswer:
+            if question.id not in user_answers:
+                return (question, None)
+            # Only the id gets serialized, no need to fetch the whole answer.
+            return (question, Answer(id=user_answers[question.id][0]))
+
+        return {
+            "progress": self._get_total_progress(questions, user_answers),
+            "questions_answers": [
+                _QuestionAnswerSerializer().to_representation(get_question_answer(q))
+                for q in questions
+            ],
+        }
 
     def to_representation(self, instance: Program):
         if not isinstance(instance, Program):
             raise ValueError(
                 f"Expected instance type {type(Program)}, got {type(instance)}"
             )
-        qa_list = [self._get_question_answer(q) for q in instance.questions.all()]
-        return {
-            "progress": self._get_total_progress(qa_list),
-            "questions_answers": [
-                _QuestionAnswerSerializer().to_representation(qa) for qa in qa_list
-            ],
-        }
+        user_answers = self._get_user_answers([instance])
+        return self._get_progress(list(instance.questions.all()), user_answers)
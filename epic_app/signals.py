@@ -0,0 +1,87 @@
+import threading
+from typing import Set, Type
+
+from django.db import models, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from epic_app.models.epic_answers import Answer, MultipleChoiceAnswer
+from epic_app.models.epic_data_version import DataVersion, DataVersionType
+from epic_app.models.epic_questions import Question
+from epic_app.models.epic_user import EpicOrganization, EpicProject, EpicUser
+from epic_app.models.models import Agency, Area, Group, Program, ProgramReference
+from epic_app.utils import get_submodel_type_list
+
+_dirty_versions = threading.local()
+
+
+def _get_dirty_versions() -> Set[DataVersionType]:
+    if not hasattr(_dirty_versions, "names"):
+        _dirty_versions.names = set()
+    return _dirty_versions.names
+
+
+def _bump_dirty_versions() -> None:
+    _names = _get_dirty_versions()
+    while _names:
+        DataVersion.bump(_names.pop())
+
+
+def bump_on_commit(name: DataVersionType) -> None:
+    """
+    Bumps the version of the data with the given `name` once the current transaction
+    is committed (right away outside transactions). All the changes of a transaction,
+    e.g. the rows removed by a cascade delete, result in a single bump per data name.
+
+    Args:
+        name (DataVersionType): Data that has changed.
+    """
+    _get_dirty_versions().add(name)
+    # Callbacks of rolled back transactions are discarded, so register one per change.
+    # Only the first one to run bumps the versions, the rest find nothing left to bump.
+    transaction.on_commit(_bump_dirty_versions)
+
+
+def _connect_data_version(model: Type[models.Model], name: DataVersionType) -> None:
+    def bump_data_version(sender, **kwargs) -> None:
+        bump_on_commit(name)
+
+    _uid = f"data_version_{model._meta.label_lower}"
+    post_save.connect(bump_data_version, sender=model, weak=False, dispatch_uid=_uid)
+    post_delete.connect(bump_data_version, sender=model, weak=False, dispatch_uid=_uid)
+
+
+def _connect_m2m_data_version(
+    through: Type[models.Model], name: DataVersionType
+) -> None:
+    def bump_data_version(sender, action: str, **kwargs) -> None:
+        if action in ("post_add", "post_remove", "post_clear"):
+            bump_on_commit(name)
+
+    m2m_changed.connect(
+        bump_data_version,
+        sender=through,
+        weak=False,
+        dispatch_uid=f"data_version_{through._meta.label_lower}",
+    )
+
+
+def connect_data_versions() -> None:
+    """
+    Keeps the `DataVersion` counters up to date whenever an entity they represent is
+    saved or deleted, bumping each of them at most once per transaction. Note bulk
+    operations do not send signals, so they have to bump the versions themselves.
+    """
+    for answer_type in [Answer] + get_submodel_type_list(Answer):
+        _connect_data_version(answer_type, DataVersionType.ANSWERS)
+    _connect_m2m_data_version(
+        MultipleChoiceAnswer.selected_programs.through, DataVersionType.ANSWERS
+    )
+
+    for domain_type in [Area, Agency, Group, Program, ProgramReference, Question]:
+        _connect_data_version(domain_type, DataVersionType.DOMAIN)
+    for question_type in get_submodel_type_list(Question):
+        _connect_data_version(question_type, DataVersionType.DOMAIN)
+    _connect_m2m_data_version(Program.agencies.through, DataVersionType.DOMAIN)
+
+    for user_type in [EpicProject, EpicOrganization, EpicUser]:
+        _connect_data_version(user_type, DataVersionType.USERS)
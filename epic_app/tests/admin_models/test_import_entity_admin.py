@@ -5,12 +5,14 @@ from wsgiref.simple_server import WSGIRequestHandler
 
 import pytest
 from django.contrib import admin
+from django.contrib.auth.models import User
 from django.contrib.messages.storage.fallback import FallbackStorage
 from django.contrib.sessions.middleware import SessionMiddleware
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.files.uploadedfile import InMemoryUploadedFile, SimpleUploadedFile
 from django.db import models
 from django.test import RequestFactory
 
+from epic_app.admin_models import import_entity_admin
 from epic_app.admin_models.generate_entity_admin import LnkAdmin
 from epic_app.admin_models.import_entity_admin import (
     AgencyAdmin,
@@ -20,11 +22,16 @@ from epic_app.admin_models.import_entity_admin import (
     KaaAdmin,
     NfqAdmin,
 )
+from epic_app.exporters.domain_snapshot_exporter import DomainSnapshotFile
+from epic_app.models.epic_answers import AgreementAnswer, AgreementAnswerType, Answer
+from epic_app.models.epic_jobs import ImportJob, JobStatusType
 from epic_app.models.epic_questions import (
     EvolutionQuestion,
     KeyAgencyActionsQuestion,
     NationalFrameworkQuestion,
+    Question,
 )
+from epic_app.models.epic_user import EpicUser
 from epic_app.models.models import Agency, Area, Group, Program
 from epic_app.tests import test_data_dir
 from epic_app.tests.importers import default_epic_domain_data, full_epic_domain_data
@@ -119,14 +126,28 @@ class TestImportEntityAdmin:
         ids=import_model_cases.keys(),
     )
     def test_post_import_xlsx_with_valid_data_imports_and_redirects(
-        self, model_admin_testcase: Tuple[models.Model, dict], full_epic_domain_data
+        self,
+        model_admin_testcase: Tuple[models.Model, dict],
+        full_epic_domain_data,
+        settings,
+        monkeypatch,
+        tmp_path: Path,
     ):
         # Define request.
+        settings.MEDIA_ROOT = tmp_path / "media"
+        settings.IMPORT_JOBS_DIR = tmp_path / "import_jobs"
+        # Run the background job right away, within the test database transaction.
+        monkeypatch.setattr(
+            import_entity_admin,
+            "submit_background_job",
+            lambda func, *args, **kwargs: func(*args, **kwargs),
+        )
         model_type, dict_values = model_admin_testcase
         xlsx_file = _get_xlsx_inmemoryfile(dict_values["filename"])
         admin_site = _get_model_admin_site(model_type)
         post_request = _create_post_request("import_xlsx/")
         post_request.FILES["xlsx_file"] = xlsx_file
+        post_request.user = User.objects.create(username="admin_user")
 
         # Verify initial expectations
         _validate_fixture_data_before_import()
@@ -138,10 +159,63 @@ class TestImportEntityAdmin:
         assert r_result is not None
         # Status code is redirected.
         assert r_result.status_code == 302
-        assert r_result.url == ".."
+        import_job = ImportJob.objects.get()
+        assert r_result.url == f"jobs/{import_job.id}/"
+        assert import_job.status == JobStatusType.SUCCEEDED
+        assert import_job.requested_by == post_request.user
+        assert import_job.rows_parsed > 0
+        assert not import_job.upload_dir.exists()
 
         # Note, these results could change with 'newer' test data versions.
         assert len(model_type.objects.all()) > 0
+        assert DomainSnapshotFile.get_current().path.is_file()
+
+    @pytest.mark.django_db
+    def test_get_import_job_status_renders_progress(self):
+        # Define request.
+        import_job = ImportJob.objects.create(
+            file_name="agency_data.xlsx",
+            status=JobStatusType.FAILED,
+            rows_parsed=42,
+            errors=["  - Line 2. Invalid agency."],
+        )
+        admin_site = _get_model_admin_site(Agency)
+
+        # Run test
+        r_result = admin_site.import_job_status(
+            _create_get_request(f"import-xlsx/jobs/{import_job.id}/"), import_job.id
+        )
+
+        # Verify final expectations
+        assert r_result.status_code == 200
+        _content = r_result.content.decode("utf-8")
+        assert "agency_data.xlsx" in _content
+        assert "42" in _content
+        assert "Line 2. Invalid agency." in _content
+        assert 'http-equiv="refresh"' not in _content
+
+    @pytest.mark.django_db
+    def test_get_import_job_status_renders_written_changes(self):
+        # Define request.
+        import_job = ImportJob.objects.create(
+            file_name="agency_data.xlsx",
+            differential=True,
+            status=JobStatusType.SUCCEEDED,
+            changes=dict(Agency=dict(created=2, updated=1, deleted=0)),
+            warnings=["The domain snapshot could not be exported: Disk full"],
+        )
+        admin_site = _get_model_admin_site(Agency)
+
+        # Run test
+        r_result = admin_site.import_job_status(
+            _create_get_request(f"import-xlsx/jobs/{import_job.id}/"), import_job.id
+        )
+
+        # Verify final expectations
+        assert r_result.status_code == 200
+        _content = "".join(r_result.content.decode("utf-8").split())
+        assert "<td>Agency</td><td>2</td><td>1</td><td>0</td>" in _content
+        assert "Thedomainsnapshotcouldnotbeexported:Diskfull" in _content
 
     @pytest.mark.django_db
     @pytest.mark.parametrize(
@@ -169,3 +243,107 @@ class TestImportEntityAdmin:
         # Status code is redirected.
         assert r_result.status_code == 302
         assert r_result.url == ".."
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize(
+        "model_admin_testcase",
+        import_model_cases.items(),
+        ids=import_model_cases.keys(),
+    )
+    def test_post_preview_xlsx_renders_changes_without_importing(
+        self, model_admin_testcase, full_epic_domain_data
+    ):
+        # Define request.
+        model_type, dict_values = model_admin_testcase
+        admin_site = _get_model_admin_site(model_type)
+        post_request = _create_post_request(
+            "import-xlsx/", {"preview": "", "differential": "on"}
+        )
+        post_request.FILES["xlsx_file"] = _get_xlsx_inmemoryfile(
+            dict_values["filename"]
+        )
+        # Renaming an entity makes the file create it again and delete the renamed one.
+        _renamed = model_type.objects.order_by("pk").first()
+        _key_field = "title" if issubclass(model_type, Question) else "name"
+        setattr(_renamed, _key_field, "Renamed entity")
+        _renamed.save()
+        _initial_ids = list(model_type.objects.values_list("pk", flat=True))
+
+        # Run test
+        r_result = admin_site.import_xlsx(post_request)
+
+        # Verify final expectations
+        assert r_result.status_code == 200
+        _content = "".join(r_result.content.decode("utf-8").split())
+        assert "<h2>Changestoapply</h2>" in _content
+        assert (
+            f"<td>{model_type.__name__}</td><td>1</td><td>0</td><td>1</td>" in _content
+        )
+        assert list(model_type.objects.values_list("pk", flat=True)) == _initial_ids
+        assert model_type.objects.filter(**{_key_field: "Renamed entity"}).exists()
+
+    @pytest.mark.django_db
+    def test_post_preview_replacing_xlsx_renders_all_entities_replaced(
+        self, full_epic_domain_data
+    ):
+        # Define request.
+        admin_site = _get_model_admin_site(Area)
+        post_request = _create_post_request("import-xlsx/", {"preview": ""})
+        post_request.FILES["xlsx_file"] = _get_xlsx_inmemoryfile(
+            "initial_epic_data.xlsx"
+        )
+        AgreementAnswer.objects.create(
+            user=EpicUser.objects.create(username="Palpatine"),
+            question=NationalFrameworkQuestion.objects.first(),
+            selected_choice=AgreementAnswerType.AGR,
+        )
+        _n_programs = Program.objects.count()
+        _initial_ids = list(Program.objects.values_list("pk", flat=True))
+
+        # Run test
+        r_result = admin_site.import_xlsx(post_request)
+
+        # Verify final expectations
+        assert r_result.status_code == 200
+        _content = "".join(r_result.content.decode("utf-8").split())
+        assert "<h2>Changestoapply</h2>" in _content
+        assert (
+            f"<td>Program</td><td>{_n_programs}</td><td>0</td><td>{_n_programs}</td>"
+            in _content
+        )
+        assert (
+            "Replacingalltheentitieswillalsoremove1answers,importitasdifferentialtokeepthem."
+            in _content
+        )
+        assert list(Program.objects.values_list("pk", flat=True)) == _initial_ids
+        assert Answer.objects.count() == 1
+
+    @pytest.mark.django_db
+    def test_post_preview_invalid_file_renders_line_errors(self, full_epic_domain_data):
+        # Define request.
+        admin_site = _get_model_admin_site(Agency)
+        post_request = _create_post_request("import-xlsx/", {"preview": ""})
+        post_request.FILES["xlsx_file"] = SimpleUploadedFile(
+            "agency_data.csv",
+            b"Agency,Program,Checked\n"
+            b"WRM Agency,Unknown program,Y\n"
+            b"WRM Agency,Another unknown program,Y\n",
+        )
+        _initial_ids = list(Agency.objects.values_list("pk", flat=True))
+
+        # Run test
+        r_result = admin_site.import_xlsx(post_request)
+
+        # Verify final expectations
+        assert r_result.status_code == 200
+        _content = r_result.content.decode("utf-8")
+        assert "Errors found" in _content
+        assert (
+            "Line 2. Program: &#x27;Unknown program&#x27; does not exist." in _content
+        )
+        assert (
+            "Line 3. Program: &#x27;Another unknown program&#x27; does not exist."
+            in _content
+        )
+        assert "Changes to apply" not in _content
+        assert list(Agency.objects.values_list("pk", flat=True)) == _initial_ids
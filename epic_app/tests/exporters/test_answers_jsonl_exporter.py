@@ -0,0 +1,69 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from epic_app.exporters.answers_jsonl_exporter import (
+    AnswersJsonlExporter,
+    open_jsonl_file,
+)
+from epic_app.models.epic_answers import (
+    AgreementAnswer,
+    AgreementAnswerType,
+    MultipleChoiceAnswer,
+)
+from epic_app.models.epic_questions import LinkagesQuestion, NationalFrameworkQuestion
+from epic_app.models.epic_user import EpicUser
+from epic_app.models.models import Program
+from epic_app.tests import django_postgresql_db
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+@django_postgresql_db
+class TestAnswersJsonlExporter:
+    @pytest.mark.parametrize("filename", ["answers.jsonl", "answers.jsonl.gz"])
+    def test_export_writes_answers_by_natural_keys(
+        self, epic_test_db, tmp_path: Path, filename: str
+    ):
+        # 1. Given: define test data.
+        _user = EpicUser.objects.get(username="Palpatine")
+        _nfq = NationalFrameworkQuestion.objects.first()
+        AgreementAnswer(
+            user=_user,
+            question=_nfq,
+            selected_choice=AgreementAnswerType.AGR,
+            justify_answer="Unlimited power!",
+        ).save()
+        _linkages_answer = MultipleChoiceAnswer(
+            user=_user, question=LinkagesQuestion.objects.first()
+        )
+        _linkages_answer.save()
+        _linkages_answer.selected_programs.add(
+            *Program.objects.filter(name__in=["b", "c"])
+        )
+        _output_file = tmp_path / filename
+
+        # 2. When: run test.
+        n_answers = AnswersJsonlExporter(chunk_size=1).export(_output_file)
+
+        # 3. Then: validate expectations.
+        assert n_answers == 2
+        with open_jsonl_file(_output_file, "r") as jsonl_stream:
+            _answer_rows = [json.loads(jsonl_line) for jsonl_line in jsonl_stream]
+        assert _answer_rows == [
+            dict(
+                type="AgreementAnswer",
+                user="Palpatine",
+                program="a",
+                question=_nfq.title,
+                selected_choice="AGREE",
+                justify_answer="Unlimited power!",
+            ),
+            dict(
+                type="MultipleChoiceAnswer",
+                user="Palpatine",
+                program="a",
+                question="Finally a linkage question?",
+                selected_programs=["b", "c"],
+            ),
+        ]
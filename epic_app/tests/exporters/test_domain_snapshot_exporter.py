@@ -0,0 +1,69 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from epic_app.exporters.domain_snapshot_exporter import (
+    DomainSnapshotFile,
+    export_domain_snapshot,
+)
+from epic_app.models.epic_questions import Question
+from epic_app.models.models import Agency, Area, Group, Program
+from epic_app.tests import django_postgresql_db
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+@pytest.fixture
+def snapshot_settings(settings, tmp_path: Path, epic_test_db):
+    settings.MEDIA_ROOT = tmp_path
+    return settings
+
+
+@django_postgresql_db
+class TestDomainSnapshotFile:
+    def _read_snapshot(self, snapshot_file: Path) -> dict:
+        return json.loads(gzip.decompress(snapshot_file.read_bytes()))
+
+    def test_export_contains_whole_domain(self, snapshot_settings):
+        # 1. When: run test.
+        _snapshot_file = export_domain_snapshot()
+
+        # 2. Then: validate expectations.
+        assert _snapshot_file == DomainSnapshotFile.get_current().path
+        _content = self._read_snapshot(_snapshot_file)
+        assert _content["version"] == DomainSnapshotFile.get_current().version
+        assert len(_content["areas"]) == len(Area.objects.all())
+        assert len(_content["groups"]) == len(Group.objects.all())
+        assert len(_content["agencies"]) == len(Agency.objects.all())
+        assert len(_content["programs"]) == len(Program.objects.all())
+        assert len(_content["questions"]) == len(Question.objects.all())
+        _program = Program.objects.get(name="a")
+        _program_content = next(
+            p_content
+            for p_content in _content["programs"]
+            if p_content["id"] == _program.id
+        )
+        assert _program_content["agencies"] == [1, 2]
+        assert {q_content["type"] for q_content in _content["questions"]} == {
+            "NationalFrameworkQuestion",
+            "KeyAgencyActionsQuestion",
+            "EvolutionQuestion",
+            "LinkagesQuestion",
+        }
+
+    def test_domain_change_replaces_snapshot(self, snapshot_settings):
+        # 1. Given: define test data.
+        _old_snapshot = export_domain_snapshot()
+        Area.objects.create(name="Coruscant")
+
+        # 2. When: run test.
+        _new_snapshot = export_domain_snapshot()
+
+        # 3. Then: validate expectations.
+        assert _new_snapshot != _old_snapshot
+        assert not _old_snapshot.is_file()
+        assert "Coruscant" in [
+            a_content["name"]
+            for a_content in self._read_snapshot(_new_snapshot)["areas"]
+        ]
@@ -0,0 +1,211 @@
+import shutil
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from epic_app.externals.ERAMVisuals.eram_visuals_pool import (
+    EramVisualsPoolRunner,
+    EramVisualsWorker,
+    EramVisualsWorkerDied,
+    EramVisualsWorkerPool,
+)
+from epic_app.externals.ERAMVisuals.eram_visuals_wrapper import EramVisualsWrapper
+from epic_app.externals.external_command import ExternalCommandTimeout
+from epic_app.externals.external_wrapper_base import ExternalWrapperStatusType
+from epic_app.tests import test_data_dir
+
+# Python stand-in for `eram_visuals.R --worker` so we can test the protocol without R.
+_fake_worker_script = """
+import sys
+import time
+from pathlib import Path
+
+print("Loading fake packages")
+print("ERAM_READY", flush=True)
+for line in sys.stdin:
+    input_file, output_dir = line.rstrip("\\n").split("\\t")
+    if "crash" in input_file:
+        sys.exit(1)
+    if "hang" in input_file:
+        time.sleep(60)
+    if not Path(input_file).is_file():
+        print("ERAM_FAILED input file not found", flush=True)
+        continue
+    (Path(output_dir) / "eram_visuals.png").write_text("png")
+    (Path(output_dir) / "eram_visuals.pdf").write_text("pdf")
+    print("Saving 8 x 8 in image")
+    print("ERAM_DONE", flush=True)
+"""
+
+
+@pytest.fixture
+def fake_worker_command(tmp_path: Path) -> List[str]:
+    _script = tmp_path / "fake_eram_worker.py"
+    _script.write_text(_fake_worker_script)
+    return [sys.executable, str(_script)]
+
+
+@pytest.fixture
+def evo_summary_csv() -> Path:
+    _csv_file = test_data_dir / "csv" / "evo_summary.csv"
+    assert _csv_file.is_file()
+    return _csv_file
+
+
+class TestEramVisualsWorker:
+    def test_render_writes_output(
+        self, fake_worker_command: List[str], evo_summary_csv: Path, tmp_path: Path
+    ):
+        _worker = EramVisualsWorker(fake_worker_command)
+        _worker.start()
+        try:
+            _worker.render(evo_summary_csv, tmp_path)
+        finally:
+            _worker.stop()
+
+        assert (tmp_path / "eram_visuals.png").is_file()
+        assert (tmp_path / "eram_visuals.pdf").is_file()
+        assert not _worker.is_alive()
+
+    def test_render_failed_job_raises_and_keeps_worker_alive(
+        self, fake_worker_command: List[str], tmp_path: Path
+    ):
+        _worker = EramVisualsWorker(fake_worker_command)
+        _worker.start()
+        try:
+            with pytest.raises(ValueError) as err_info:
+                _worker.render(tmp_path / "missing.csv", tmp_path)
+            assert str(err_info.value) == "input file not found"
+            assert _worker.is_alive()
+        finally:
+            _worker.stop()
+
+    def test_render_hanging_job_times_out_and_stops_worker(
+        self, fake_worker_command: List[str], tmp_path: Path
+    ):
+        _hang_file = tmp_path / "hang.csv"
+        _hang_file.write_text("")
+        _worker = EramVisualsWorker(fake_worker_command, timeout=0.5)
+        _worker.start()
+        try:
+            with pytest.raises(ExternalCommandTimeout):
+                _worker.render(_hang_file, tmp_path)
+            assert not _worker.is_alive()
+        finally:
+            _worker.stop()
+
+    def test_render_without_process_raises(self, tmp_path: Path):
+        with pytest.raises(EramVisualsWorkerDied):
+            EramVisualsWorker(["unused"]).render(tmp_path / "a.csv", tmp_path)
+
+
+class TestEramVisualsWorkerPool:
+    def test_render_reuses_warm_worker(
+        self, fake_worker_command: List[str], evo_summary_csv: Path, tmp_path: Path
+    ):
+        _pool = EramVisualsWorkerPool(fake_worker_command, size=1)
+        try:
+            _pool.render(evo_summary_csv, tmp_path)
+            _worker = _pool._idle_workers.queue[0]
+            _first_pid = _worker.pid
+            _pool.render(evo_summary_csv, tmp_path)
+            assert _worker.pid == _first_pid
+        finally:
+            _pool.shutdown()
+
+    def test_render_restarts_dead_worker(
+        self, fake_worker_command: List[str], evo_summary_csv: Path, tmp_path: Path
+    ):
+        _pool = EramVisualsWorkerPool(fake_worker_command, size=1)
+        try:
+            _pool.render(evo_summary_csv, tmp_path)
+            _worker: EramVisualsWorker = _pool._idle_workers.queue[0]
+            _first_pid = _worker.pid
+            _worker._process.kill()
+            _worker._process.wait()
+
+            _pool.render(evo_summary_csv, tmp_path)
+            assert _worker.is_alive()
+            assert _worker.pid != _first_pid
+        finally:
+            _pool.shutdown()
+
+    def test_render_worker_dying_during_job_retries_once(
+        self, fake_worker_command: List[str], tmp_path: Path
+    ):
+        _crash_file = tmp_path / "crash.csv"
+        _crash_file.write_text("")
+        _pool = EramVisualsWorkerPool(fake_worker_command, size=1)
+        try:
+            with pytest.raises(EramVisualsWorkerDied):
+                _pool.render(_crash_file, tmp_path)
+            # The worker is given back to the pool so it can be restarted.
+            assert _pool._idle_workers.qsize() == 1
+        finally:
+            _pool.shutdown()
+
+    def test_render_after_failed_start_gets_worker_back(
+        self, evo_summary_csv: Path, tmp_path: Path
+    ):
+        # The worker script is not there yet, so the first start fails.
+        _script = tmp_path / "fake_eram_worker.py"
+        _pool = EramVisualsWorkerPool([sys.executable, str(_script)], size=1)
+        try:
+            with pytest.raises(EramVisualsWorkerDied):
+                _pool.render(evo_summary_csv, tmp_path)
+            assert _pool._idle_workers.qsize() == 1
+            assert not _pool._idle_workers.queue[0].is_alive()
+
+            _script.write_text(_fake_worker_script)
+            _pool.render(evo_summary_csv, tmp_path)
+            assert (tmp_path / "eram_visuals.png").is_file()
+        finally:
+            _pool.shutdown()
+
+    def test_render_with_missing_executable_gets_worker_back(
+        self, evo_summary_csv: Path, tmp_path: Path
+    ):
+        _pool = EramVisualsWorkerPool([str(tmp_path / "no_rscript")], size=1)
+        try:
+            for _ in range(2):
+                with pytest.raises(FileNotFoundError):
+                    _pool.render(evo_summary_csv, tmp_path)
+            assert _pool._idle_workers.qsize() == 1
+        finally:
+            _pool.shutdown()
+
+
+class TestEramVisualsPoolRunner:
+    def test_wrapper_with_pool_runner_succeeds(
+        self,
+        fake_worker_command: List[str],
+        evo_summary_csv: Path,
+        request: pytest.FixtureRequest,
+    ):
+        _pool = EramVisualsWorkerPool(fake_worker_command, size=1)
+
+        class MockPoolRunner(EramVisualsPoolRunner):
+            def _get_pool(self) -> EramVisualsWorkerPool:
+                return _pool
+
+        # 1. Define test data.
+        _output_dir = test_data_dir / request.node.name
+        shutil.rmtree(_output_dir, ignore_errors=True)
+
+        # 2. Run test.
+        _test_wrapper = EramVisualsWrapper(
+            input_file=evo_summary_csv, output_dir=_output_dir, runner=MockPoolRunner
+        )
+        try:
+            _test_wrapper.execute()
+        finally:
+            _pool.shutdown()
+
+        # 3. Verify final expectations.
+        assert _test_wrapper.status.status_type == ExternalWrapperStatusType.SUCCEEDED
+        assert _test_wrapper.output.png_output.exists()
+        assert _test_wrapper.output.pdf_output.exists()
+        assert "Saving 8 x 8 in image" in (_output_dir / "eram.log").read_text()
+        shutil.rmtree(_output_dir, ignore_errors=True)
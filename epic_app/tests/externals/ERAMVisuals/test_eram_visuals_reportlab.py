@@ -0,0 +1,98 @@
+import shutil
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from epic_app.externals.ERAMVisuals.eram_visuals_reportlab import (
+    EramVisualsReportlabRunner,
+)
+from epic_app.externals.ERAMVisuals.eram_visuals_wrapper import (
+    EramVisualsRunner,
+    EramVisualsWrapper,
+    get_eram_visuals_runner,
+)
+from epic_app.externals.external_wrapper_base import ExternalWrapperStatusType
+from epic_app.tests import test_data_dir
+from epic_app.tests.externals.ERAMVisuals.test_eram_visuals_wrapper import csv_cases
+
+
+class TestEramVisualsReportlabRunner:
+    @pytest.mark.parametrize("csv_file", csv_cases)
+    def test_execute_with_sample_data_succeeds(
+        self, csv_file: Path, request: pytest.FixtureRequest
+    ):
+        # 1. Define test data.
+        assert csv_file.exists()
+        _test_case_name = (
+            request.node.name.replace(" ", "_").replace("[", "__").replace("]", "__")
+        )
+        _output_dir = test_data_dir / _test_case_name
+        shutil.rmtree(_output_dir, ignore_errors=True)
+
+        # 2. Run test.
+        eram_visuals = EramVisualsWrapper(
+            input_file=csv_file,
+            output_dir=_output_dir,
+            runner=EramVisualsReportlabRunner,
+        )
+        eram_visuals.execute()
+
+        # 3. Verify final expectations.
+        assert eram_visuals.status.status_type == ExternalWrapperStatusType.SUCCEEDED
+        assert eram_visuals.output.png_output.read_bytes().startswith(b"\x89PNG")
+        assert eram_visuals.output.pdf_output.read_bytes().startswith(b"%PDF")
+        shutil.rmtree(_output_dir, ignore_errors=True)
+
+    def test_get_radial_bars_adds_empty_bars_per_group(self):
+        _csv_file = test_data_dir / "csv" / "evolution_empty_summary.csv"
+        _runner = EramVisualsReportlabRunner()
+        _rows = _runner._read_csv_rows(_csv_file)
+
+        _bars = _runner._get_radial_bars(_rows)
+
+        # Every group level gets its data bars plus two empty bars.
+        _n_levels = len(set(_runner.group_levels) | {r["group"] for r in _rows})
+        assert len(_bars) == len(_rows) + _n_levels * _runner.empty_bar
+        assert all(_b.value == 0 for _b in _bars if _b.individual)
+        assert all(len(_r) == 4 for _r in _rows)
+
+    @pytest.mark.parametrize(
+        "n_colors, expected_colors",
+        [
+            pytest.param(1, ["#66C2A5"], id="Single color"),
+            pytest.param(2, ["#66C2A5", "#B3B3B3"], id="Ramp ends"),
+            pytest.param(
+                5,
+                ["#66C2A5", "#A99BB1", "#C7B18C", "#F9D448", "#B3B3B3"],
+                id="Group levels",
+            ),
+        ],
+    )
+    def test_get_ramp_colors_interpolates_palette(
+        self, n_colors: int, expected_colors: List[str]
+    ):
+        assert EramVisualsReportlabRunner.get_ramp_colors(n_colors) == expected_colors
+
+    def test_execute_without_rows_fails(self, tmp_path: Path):
+        _csv_file = tmp_path / "empty.csv"
+        _csv_file.write_text("group, sub, individual, value\n")
+
+        eram_visuals = EramVisualsWrapper(
+            input_file=_csv_file,
+            output_dir=tmp_path,
+            runner=EramVisualsReportlabRunner,
+        )
+        eram_visuals.execute()
+
+        assert eram_visuals.status.status_type == ExternalWrapperStatusType.FAILED
+
+
+class TestGetEramVisualsRunner:
+    def test_given_no_setting_returns_rscript_runner(self, settings):
+        settings.ERAM_VISUALS_RUNNER = None
+        assert get_eram_visuals_runner() is EramVisualsRunner
+
+    def test_given_setting_returns_configured_runner(self, settings):
+        settings.ERAM_VISUALS_RUNNER = "epic_app.externals.ERAMVisuals.eram_visuals_reportlab.EramVisualsReportlabRunner"
+        assert get_eram_visuals_runner() is EramVisualsReportlabRunner
@@ -1,5 +1,7 @@
 import shutil
+import sys
 from pathlib import Path
+from typing import List
 
 import pytest
 
@@ -144,3 +146,41 @@ class TestEramVisualsWrapper:
         assert _test_wrapper.output
         assert _test_wrapper.output.png_output.exists()
         assert _test_wrapper.output.pdf_output.exists()
+
+    def test_given_hanging_r_script_status_is_failed(
+        self, request: pytest.FixtureRequest
+    ):
+        class MockEramRunner(EramVisualsRunner):
+            def _get_timeout(self) -> float:
+                return 0.5
+
+            def _get_command(self, command_kwargs: dict) -> List[str]:
+                return [sys.executable, "-c", "import time; time.sleep(30)"]
+
+        # 1. Define test data.
+        _output_dir = test_data_dir / request.node.name
+        shutil.rmtree(_output_dir, ignore_errors=True)
+        _csv_file = test_data_dir / "csv" / "evo_summary.csv"
+
+        # 2. Run mocked up test
+        _test_wrapper = EramVisualsWrapper(
+            input_file=_csv_file, output_dir=_output_dir, runner=MockEramRunner
+        )
+        _test_wrapper.execute()
+
+        # 3. Verify final expectations
+        assert _test_wrapper.status.status_type == ExternalWrapperStatusType.FAILED
+        assert "0.5 seconds" in _test_wrapper.status.status_info
+        assert "Running command" in (_output_dir / "eram.log").read_text()
+        shutil.rmtree(_output_dir, ignore_errors=True)
+
+    def test_given_missing_input_file_status_is_failed(self, tmp_path: Path):
+        _test_wrapper = EramVisualsWrapper(
+            input_file=tmp_path / "missing.csv",
+            output_dir=tmp_path,
+            runner=EramVisualsRunner,
+        )
+        _test_wrapper.execute()
+
+        assert _test_wrapper.status.status_type == ExternalWrapperStatusType.FAILED
+        assert "missing.csv" in _test_wrapper.status.status_info
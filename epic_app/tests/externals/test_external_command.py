@@ -0,0 +1,67 @@
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+from epic_app.externals.external_command import (
+    ExternalCommandTimeout,
+    get_job_logger,
+    run_external_command,
+)
+
+
+class TestRunExternalCommand:
+    def test_run_captures_output_and_return_code(self):
+        _command = [
+            sys.executable,
+            "-c",
+            "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)",
+        ]
+        _result = run_external_command(
+            _command, timeout=30, logger=logging.getLogger(__name__)
+        )
+
+        assert _result.return_code == 3
+        assert not _result.succeeded
+        assert _result.stdout.strip() == "out"
+        assert _result.stderr.strip() == "err"
+
+    def test_run_arguments_are_not_interpreted_by_a_shell(self):
+        _argument = "a; echo b && $HOME"
+        _command = [sys.executable, "-c", "import sys; print(sys.argv[1])", _argument]
+        _result = run_external_command(
+            _command, timeout=30, logger=logging.getLogger(__name__)
+        )
+
+        assert _result.succeeded
+        assert _result.stdout.strip() == _argument
+
+    def test_run_exceeding_timeout_raises(self):
+        _command = [sys.executable, "-c", "import time; time.sleep(30)"]
+        with pytest.raises(ExternalCommandTimeout):
+            run_external_command(
+                _command, timeout=0.5, logger=logging.getLogger(__name__)
+            )
+
+
+class TestGetJobLogger:
+    def test_records_are_written_to_the_job_file(self, tmp_path: Path):
+        _log_file = tmp_path / "job.log"
+        with get_job_logger("epic_app.tests", _log_file) as _logger:
+            _logger.info("Lorem ipsum")
+            _handlers = list(_logger.handlers)
+
+        assert "Lorem ipsum" in _log_file.read_text()
+        assert len(_handlers) == 1
+        assert not _logger.handlers
+        assert not logging.getLogger("epic_app.tests").handlers
+
+    def test_jobs_do_not_share_handlers(self, tmp_path: Path):
+        with get_job_logger("epic_app.tests", tmp_path / "a.log") as _logger_a:
+            with get_job_logger("epic_app.tests", tmp_path / "b.log") as _logger_b:
+                _logger_a.info("Job a")
+                _logger_b.info("Job b")
+
+        assert (tmp_path / "a.log").read_text().strip() == "Job a"
+        assert (tmp_path / "b.log").read_text().strip() == "Job b"
@@ -0,0 +1,162 @@
+import json
+from pathlib import Path
+
+import pytest
+from django.db import connection
+from django.forms import ValidationError
+from django.test.utils import CaptureQueriesContext
+
+from epic_app.exporters.answers_jsonl_exporter import AnswersJsonlExporter
+from epic_app.importers.answers_jsonl_importer import AnswersJsonlImporter
+from epic_app.models.epic_answers import (
+    AgreementAnswer,
+    AgreementAnswerType,
+    Answer,
+    EvolutionAnswer,
+    MultipleChoiceAnswer,
+)
+from epic_app.models.epic_questions import (
+    EvolutionChoiceType,
+    EvolutionQuestion,
+    LinkagesQuestion,
+    NationalFrameworkQuestion,
+)
+from epic_app.models.epic_user import EpicUser
+from epic_app.models.models import Program
+from epic_app.tests import django_postgresql_db
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+@django_postgresql_db
+class TestAnswersJsonlImporter:
+    def _write_jsonl(self, jsonl_file: Path, answer_rows: list) -> Path:
+        jsonl_file.write_text(
+            "\n".join(json.dumps(a_row) for a_row in answer_rows), encoding="utf-8"
+        )
+        return jsonl_file
+
+    def test_import_file_restores_exported_answers(self, epic_test_db, tmp_path: Path):
+        # 1. Given: define test data.
+        for user in EpicUser.objects.all():
+            AgreementAnswer(
+                user=user,
+                question=NationalFrameworkQuestion.objects.first(),
+                selected_choice=AgreementAnswerType.SAGR,
+                justify_answer=f"Justified by {user.username}",
+            ).save()
+            EvolutionAnswer(
+                user=user,
+                question=EvolutionQuestion.objects.first(),
+                selected_choice=EvolutionChoiceType.CAPABLE,
+            ).save()
+            _linkages_answer = MultipleChoiceAnswer(
+                user=user, question=LinkagesQuestion.objects.first()
+            )
+            _linkages_answer.save()
+            _linkages_answer.selected_programs.add(
+                *Program.objects.filter(name__in=["b", "e"])
+            )
+        _jsonl_file = tmp_path / "answers.jsonl.gz"
+        n_exported = AnswersJsonlExporter().export(_jsonl_file)
+        _exported_answers = list(
+            AgreementAnswer.objects.values_list(
+                "user__username", "question_id", "selected_choice", "justify_answer"
+            ).order_by("pk")
+        )
+        Answer.objects.all().delete()
+
+        # 2. When: run test.
+        n_imported = AnswersJsonlImporter(chunk_size=2).import_file(_jsonl_file)
+
+        # 3. Then: validate expectations.
+        assert n_imported == n_exported == 9
+        assert (
+            list(
+                AgreementAnswer.objects.values_list(
+                    "user__username", "question_id", "selected_choice", "justify_answer"
+                ).order_by("pk")
+            )
+            == _exported_answers
+        )
+        assert all(
+            a.selected_choice == EvolutionChoiceType.CAPABLE
+            for a in EvolutionAnswer.objects.all()
+        )
+        assert all(
+            sorted(a.selected_programs.values_list("name", flat=True)) == ["b", "e"]
+            for a in MultipleChoiceAnswer.objects.all()
+        )
+
+    def test_import_file_updates_existing_answers_in_bulk(
+        self, epic_test_db, tmp_path: Path
+    ):
+        # 1. Given: define test data.
+        _question = NationalFrameworkQuestion.objects.first()
+        _answer = AgreementAnswer(
+            user=EpicUser.objects.get(username="Anakin"),
+            question=_question,
+            selected_choice=AgreementAnswerType.DIS,
+        )
+        _answer.save()
+        _jsonl_file = self._write_jsonl(
+            tmp_path / "answers.jsonl",
+            [
+                dict(
+                    user=username,
+                    program="A",
+                    question=_question.title,
+                    selected_choice="AGREE",
+                )
+                for username in ["Anakin", "Palpatine", "Dooku"]
+            ],
+        )
+
+        # 2. When: run test.
+        with CaptureQueriesContext(connection) as queries_context:
+            AnswersJsonlImporter().import_file(_jsonl_file)
+
+        # 3. Then: validate expectations.
+        _answers = AgreementAnswer.objects.all()
+        assert len(_answers) == 3
+        assert all(a.selected_choice == AgreementAnswerType.AGR for a in _answers)
+        assert AgreementAnswer.objects.get(user__username="Anakin").pk == _answer.pk
+        _inserts = [
+            q_captured["sql"]
+            for q_captured in queries_context.captured_queries
+            if q_captured["sql"].startswith('INSERT INTO "epic_app_answer"')
+        ]
+        assert len(_inserts) == 1
+
+    def test_import_file_with_invalid_lines_imports_nothing(
+        self, epic_test_db, tmp_path: Path
+    ):
+        # 1. Given: define test data.
+        _question = NationalFrameworkQuestion.objects.first()
+        _jsonl_file = self._write_jsonl(
+            tmp_path / "answers.jsonl",
+            [
+                dict(user="Anakin", program="a", question=_question.title),
+                dict(user="Vader", program="a", question=_question.title),
+                dict(user="Dooku", program="a", question="Is this a question?"),
+                dict(
+                    user="Dooku",
+                    program="a",
+                    question=_question.title,
+                    type="EvolutionAnswer",
+                ),
+            ],
+        )
+
+        # 2. When: run test.
+        with pytest.raises(ValidationError) as exc_info:
+            AnswersJsonlImporter(chunk_size=1).import_file(_jsonl_file)
+
+        # 3. Then: validate expectations.
+        _messages = exc_info.value.messages
+        assert len(_messages) == 3
+        assert _messages[0] == "  - Line 2. User: 'Vader' does not exist."
+        assert _messages[1].startswith("  - Line 3. Question: 'Is this a question?'")
+        assert _messages[2].startswith(
+            "  - Line 4. Answer type: 'EvolutionAnswer' does not match the question"
+        )
+        assert not Answer.objects.exists()
@@ -1,7 +1,16 @@
+import csv
+import pickle
+import sys
+from pathlib import Path
+from typing import Iterator
+
 import pytest
+from django.forms import ValidationError
 
-from epic_app.importers.xlsx import BaseEpicImporter
-from epic_app.importers.xlsx.base_importer import ProtocolEpicImporter
+from epic_app.importers.xlsx import BaseEpicImporter, EpicAgencyImporter
+from epic_app.importers.xlsx.base_importer import EpicProgramIndex, ProtocolEpicImporter
+from epic_app.models.models import Area, Group, Program
+from epic_app.tests import test_data_dir
 
 
 class TestBaseEpicImporter:
@@ -9,3 +18,101 @@ class TestBaseEpicImporter:
     def test_epic_agency_importer(self):
         base_importer = BaseEpicImporter()
         assert isinstance(base_importer, ProtocolEpicImporter)
+
+    def test_iter_lines_streams_rows_without_headers(self):
+        # 1. Given: define test data.
+        _test_file = test_data_dir / "xlsx" / "agency_data.xlsx"
+        assert _test_file.is_file()
+
+        # 2. When: run test.
+        _line_objects = EpicAgencyImporter().iter_lines(_test_file)
+
+        # 3. Then: validate expectations.
+        assert isinstance(_line_objects, Iterator)
+        _first_line = next(_line_objects)
+        assert _first_line.agency == "WRM Agency"
+        assert (
+            _first_line.program == "National Water Resource Management Sector Framework"
+        )
+        assert all(l_object.agency for l_object in _line_objects)
+
+    def test_iter_lines_reads_parquet_file(self, tmp_path: Path):
+        # 1. Given: define test data.
+        pyarrow = pytest.importorskip("pyarrow")
+        import pyarrow.parquet
+
+        _csv_file = test_data_dir / "csv" / "agency_data.csv"
+        _csv_lines = EpicAgencyImporter().read_lines(_csv_file)
+        with _csv_file.open(newline="", encoding="utf-8-sig") as csv_stream:
+            _headers, *_rows = list(csv.reader(csv_stream))
+        _parquet_file = tmp_path / "agency_data.parquet"
+        pyarrow.parquet.write_table(
+            pyarrow.table(dict(zip(_headers, zip(*_rows)))),
+            _parquet_file,
+            row_group_size=10,
+        )
+
+        # 2. When: run test.
+        _parquet_lines = list(EpicAgencyImporter().iter_lines(_parquet_file))
+
+        # 3. Then: validate expectations.
+        assert len(_parquet_lines) > 10
+        assert [l_object.__dict__ for l_object in _parquet_lines] == [
+            l_object.__dict__ for l_object in _csv_lines
+        ]
+
+    def test_iter_lines_parquet_without_pyarrow_raises(
+        self, tmp_path: Path, monkeypatch
+    ):
+        # 1. Given: define test data.
+        # A `None` entry makes importing the module fail, as if it was not installed.
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+        _parquet_file = tmp_path / "agency_data.parquet"
+        _parquet_file.write_bytes(b"")
+
+        # 2. When: run test.
+        with pytest.raises(ValidationError) as err_info:
+            list(EpicAgencyImporter().iter_lines(_parquet_file))
+
+        # 3. Then: validate expectations.
+        assert err_info.value.messages == [
+            "Importing parquet files requires the 'pyarrow' package."
+        ]
+
+    def test_read_lines_can_be_sent_across_processes(self):
+        # 1. Given: define test data.
+        _test_file = test_data_dir / "xlsx" / "agency_data.xlsx"
+        assert _test_file.is_file()
+
+        # 2. When: run test.
+        _line_objects = EpicAgencyImporter().read_lines(_test_file)
+
+        # 3. Then: validate expectations.
+        # Lines are read in a process pool, so they need to be picklable.
+        _unpickled_lines = pickle.loads(pickle.dumps(_line_objects))
+        assert [l_object.__dict__ for l_object in _unpickled_lines] == [
+            l_object.__dict__ for l_object in _line_objects
+        ]
+        assert all(
+            isinstance(l_object, EpicAgencyImporter.XlsxLineObject)
+            for l_object in _unpickled_lines
+        )
+
+
+@pytest.mark.django_db
+class TestEpicProgramIndex:
+    def test_get_program_is_case_insensitive(self):
+        # 1. Given: define test data.
+        _area = Area.objects.create(name="Outer Rim")
+        _group = Group.objects.create(name="Tatooine", area=_area)
+        _program = Program.objects.create(name="Mos Eisley", group=_group)
+
+        # 2. When: run test.
+        program_index = EpicProgramIndex()
+
+        # 3. Then: validate expectations.
+        assert program_index.get("MOS EISLEY") == _program
+        assert program_index.get("mos eisley", "TATOOINE") == _program
+        assert program_index.get("mos eisley", "Naboo") is None
+        assert program_index.get("Mos Espa") is None
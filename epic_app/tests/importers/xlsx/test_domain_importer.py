@@ -1,11 +1,17 @@
+import csv
 from io import BytesIO
+from pathlib import Path
 
+import openpyxl
 import pytest
 from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.db import connection
+from django.forms import ValidationError
+from django.test.utils import CaptureQueriesContext
 
 from epic_app.importers.xlsx import BaseEpicImporter, EpicDomainImporter
 from epic_app.importers.xlsx.base_importer import ProtocolEpicImporter
-from epic_app.models.models import Area, Group, Program
+from epic_app.models.models import Area, Group, Program, ProgramReference
 from epic_app.tests import test_data_dir
 
 
@@ -88,3 +94,186 @@ class TestEpicDomainImporter:
         assert dummy_set["area"] not in Area.objects.all()
         assert dummy_set["group"] not in Group.objects.all()
         assert dummy_set["program"] not in Program.objects.all()
+
+    def test_import_file_inserts_each_table_once(self):
+        # Run test
+        with CaptureQueriesContext(connection) as queries_context:
+            EpicDomainImporter().import_file(self.domain_xlsx_file)
+
+        # Verify final expectations
+        _inserts = [
+            q_captured["sql"]
+            for q_captured in queries_context.captured_queries
+            if q_captured["sql"].startswith("INSERT")
+            and "epic_app_dataversion" not in q_captured["sql"]
+        ]
+        # One insert per table: Area, Group, Program and ProgramReference.
+        assert len(_inserts) == 4
+        assert len(ProgramReference.objects.all()) > 0
+        assert all(p.group_id is not None for p in Program.objects.all())
+
+    def test_import_file_with_duplicated_program_raises(self, tmp_path: Path):
+        # Define test data
+        EpicDomainImporter().import_file(self.domain_xlsx_file)
+        _initial_programs = list(Program.objects.values_list("name", flat=True))
+        _workbook = openpyxl.Workbook()
+        _workbook.active.append(["Area", "Group", "Program", "Description"])
+        _workbook.active.append(["Outer Rim", "Tatooine", "Mos Eisley", "Spaceport"])
+        _workbook.active.append(["Outer Rim", "Tatooine", "MOS EISLEY", "Spaceport"])
+        _xlsx_file = tmp_path / "duplicated_programs.xlsx"
+        _workbook.save(_xlsx_file)
+
+        # Run test
+        with pytest.raises(ValidationError) as exc_info:
+            EpicDomainImporter().import_file(_xlsx_file)
+
+        # Verify final expectations
+        assert "Mos Eisley" in str(exc_info.value)
+        # The previous domain is kept as the file never got imported.
+        assert list(Program.objects.values_list("name", flat=True)) == _initial_programs
+
+    def test_differential_import_file_only_applies_changes(self, tmp_path: Path):
+        # Define test data
+        EpicDomainImporter().import_file(self.domain_xlsx_file)
+        _initial_programs = dict(Program.objects.values_list("name", "pk"))
+        _workbook = openpyxl.load_workbook(self.domain_xlsx_file)
+        _sheet = _workbook.active
+        _updated_program = _sheet.cell(row=2, column=3).value
+        _sheet.cell(row=2, column=4).value = "Updated description"
+        _deleted_group = _sheet.cell(row=_sheet.max_row, column=2).value
+        _deleted_program = _sheet.cell(row=_sheet.max_row, column=3).value
+        _sheet.delete_rows(_sheet.max_row)
+        _sheet.append(["Outer Rim", "Tatooine", "Mos Eisley", "Spaceport"])
+        _xlsx_file = tmp_path / "edited_epic_data.xlsx"
+        _workbook.save(_xlsx_file)
+
+        # Run test
+        change_set = EpicDomainImporter(differential=True).import_file(_xlsx_file)
+
+        # Verify final expectations
+        assert change_set.changes["Program"] == {
+            "created": ["Mos Eisley"],
+            "updated": [_updated_program],
+            "deleted": [_deleted_program],
+        }
+        assert change_set.changes["Area"] == {"created": ["Outer Rim"]}
+        # The last group only contained the deleted program.
+        assert change_set.changes["Group"] == {
+            "created": ["Tatooine"],
+            "deleted": [_deleted_group],
+        }
+        assert Program.objects.get(name=_updated_program).description == (
+            "Updated description"
+        )
+        # The unchanged programs (and thus their questions) are kept.
+        _final_programs = dict(Program.objects.values_list("name", "pk"))
+        assert _deleted_program not in _final_programs
+        assert all(
+            _final_programs[p_name] == p_pk
+            for p_name, p_pk in _initial_programs.items()
+            if p_name != _deleted_program
+        )
+
+    def test_preview_file_reports_changes_and_errors_without_writing(
+        self, tmp_path: Path
+    ):
+        # Define test data
+        EpicDomainImporter().import_file(self.domain_xlsx_file)
+        _workbook = openpyxl.load_workbook(self.domain_xlsx_file)
+        _sheet = _workbook.active
+        _sheet.append(
+            [
+                "Outer Rim",
+                "Tatooine",
+                "Mos Eisley",
+                "Spaceport",
+                "Docking bay 94",
+                "https://mos.eisley",
+            ]
+        )
+        _new_program_file = tmp_path / "new_program.xlsx"
+        _workbook.save(_new_program_file)
+        _sheet.append(["Outer Rim", "Tatooine", "MOS EISLEY", "Spaceport"])
+        _duplicated_program_file = tmp_path / "duplicated_program.xlsx"
+        _workbook.save(_duplicated_program_file)
+
+        # Run test
+        with CaptureQueriesContext(connection) as queries_context:
+            change_set = EpicDomainImporter(differential=True).preview_file(
+                _new_program_file
+            )
+            error_change_set = EpicDomainImporter(differential=True).preview_file(
+                _duplicated_program_file
+            )
+
+        # Verify final expectations
+        assert change_set.errors == []
+        assert change_set.get_counts() == {
+            "Area": {"created": 1, "updated": 0, "deleted": 0},
+            "Group": {"created": 1, "updated": 0, "deleted": 0},
+            "Program": {"created": 1, "updated": 0, "deleted": 0},
+            "ProgramReference": {"created": 1, "updated": 0, "deleted": 0},
+        }
+        assert error_change_set.errors == [
+            f"  - Line {_sheet.max_row}. There's already a Program with the name: Mos Eisley."
+        ]
+        assert all(
+            q_captured["sql"].startswith("SELECT")
+            for q_captured in queries_context.captured_queries
+        )
+        assert not Program.objects.filter(name="Mos Eisley").exists()
+
+    def _get_domain_csv_file(self, tmp_path: Path) -> Path:
+        _workbook = openpyxl.load_workbook(self.domain_xlsx_file, read_only=True)
+        _csv_file = tmp_path / "initial_epic_data.csv"
+        with _csv_file.open("w", newline="", encoding="utf-8") as csv_stream:
+            csv.writer(csv_stream).writerows(
+                _workbook.active.iter_rows(values_only=True)
+            )
+        _workbook.close()
+        return _csv_file
+
+    def test_import_file_from_csv_filepath(self, tmp_path: Path):
+        # Define test data
+        _csv_file = self._get_domain_csv_file(tmp_path)
+        dummy_area = Area.objects.create(name="dummyArea")
+        dummy_group = Group.objects.create(name="dummyGroup", area=dummy_area)
+        dummy_program = Program.objects.create(name="dummyProgram", group=dummy_group)
+
+        # Run test
+        EpicDomainImporter().import_file(_csv_file)
+
+        # Verify final expectations
+        self._verify_default_import_final_expectations(
+            dict(area=dummy_area, group=dummy_group, program=dummy_program)
+        )
+
+    def test_import_file_from_csv_inmemoryuploadedfile(self, tmp_path: Path):
+        # Define test data
+        _csv_content = self._get_domain_csv_file(tmp_path).read_bytes()
+        file_io = BytesIO(_csv_content)
+        csv_inmemoryfile = InMemoryUploadedFile(
+            file_io, None, "initial_epic_data.csv", "text/csv", len(_csv_content), None
+        )
+
+        # Run test
+        EpicDomainImporter().import_file(csv_inmemoryfile)
+
+        # Verify final expectations
+        assert len(Area.objects.all()) == 5
+        assert len(Group.objects.all()) == 11
+        assert len(Program.objects.all()) == 38
+        # Multi-line descriptions are kept within their (quoted) cell.
+        assert any("\n" in p.description for p in Program.objects.all())
+
+    def test_import_file_with_unsupported_format_raises(self, tmp_path: Path):
+        # Define test data
+        _txt_file = tmp_path / "initial_epic_data.txt"
+        _txt_file.write_text("Area,Group,Program")
+
+        # Run test
+        with pytest.raises(ValidationError) as exc_info:
+            EpicDomainImporter().import_file(_txt_file)
+
+        # Verify final expectations
+        assert "Unsupported file format '.txt'" in str(exc_info.value)
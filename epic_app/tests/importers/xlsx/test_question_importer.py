@@ -1,7 +1,11 @@
 from pathlib import Path
 from typing import Tuple, Type
 
+import openpyxl
 import pytest
+from django.db import connection
+from django.forms import ValidationError
+from django.test.utils import CaptureQueriesContext
 
 from epic_app.importers.xlsx.base_importer import BaseEpicImporter, ProtocolEpicImporter
 from epic_app.importers.xlsx.question_importer import (
@@ -71,6 +75,27 @@ class TestYesNoJustifyQuestionImporter:
         assert len(question_type.objects.all()) == dict_values["expected_entries"]
         assert question_type.objects.first().title == dict_values["first_entry_title"]
 
+    @pytest.mark.parametrize("importer_type", question_type_dict.keys())
+    def test_import_file_loads_programs_once(
+        self,
+        importer_type: Type[_YesNoJustifyQuestionImporter],
+        default_epic_domain_data,
+    ):
+        test_file: Path = self.question_type_dict[importer_type]["test_file"]
+
+        # Run test.
+        with CaptureQueriesContext(connection) as queries_context:
+            importer_type().import_file(test_file)
+
+        # Verify final expectations
+        _program_queries = [
+            q_captured["sql"]
+            for q_captured in queries_context.captured_queries
+            if q_captured["sql"].startswith("SELECT")
+            and 'FROM "epic_app_program"' in q_captured["sql"]
+        ]
+        assert len(_program_queries) == 1
+
 
 @pytest.mark.django_db
 class TestEvolutionQuestionImporter:
@@ -88,3 +113,49 @@ class TestEvolutionQuestionImporter:
         EvolutionQuestionImporter().import_file(test_file)
 
         assert len(EvolutionQuestion.objects.all()) == 55
+
+    def test_import_file_with_unknown_program_keeps_questions(
+        self, default_epic_domain_data, tmp_path: Path
+    ):
+        # Define test data
+        EvolutionQuestionImporter().import_file(
+            test_data_dir / "xlsx" / "evolutionquestions.xlsx"
+        )
+        _workbook = openpyxl.Workbook()
+        _workbook.active.append(["Group", "Program", "Dimension", "Nascent"])
+        _workbook.active.append(["Tatooine", "Mos Eisley", "Spaceport", "Wretched"])
+        _xlsx_file = tmp_path / "unknown_program.xlsx"
+        _workbook.save(_xlsx_file)
+
+        # Run test
+        with pytest.raises(ValidationError) as exc_info:
+            EvolutionQuestionImporter().import_file(_xlsx_file)
+
+        # Verify final expectations
+        assert "Mos Eisley" in str(exc_info.value)
+        assert len(EvolutionQuestion.objects.all()) == 55
+
+    def test_differential_import_file_keeps_unchanged_questions(
+        self, default_epic_domain_data
+    ):
+        # Define test data
+        test_file = test_data_dir / "xlsx" / "evolutionquestions.xlsx"
+        EvolutionQuestionImporter().import_file(test_file)
+        _initial_ids = list(EvolutionQuestion.objects.values_list("pk", flat=True))
+
+        # Run test
+        with CaptureQueriesContext(connection) as queries_context:
+            change_set = EvolutionQuestionImporter(differential=True).import_file(
+                test_file
+            )
+
+        # Verify final expectations
+        assert str(change_set) == "No changes."
+        assert list(EvolutionQuestion.objects.values_list("pk", flat=True)) == (
+            _initial_ids
+        )
+        assert not any(
+            q_captured["sql"].startswith(("INSERT", "DELETE"))
+            and "epic_app_dataversion" not in q_captured["sql"]
+            for q_captured in queries_context.captured_queries
+        )
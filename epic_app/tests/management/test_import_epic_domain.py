@@ -0,0 +1,109 @@
+import shutil
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from epic_app.exporters.domain_snapshot_exporter import DomainSnapshotFile
+from epic_app.models.epic_questions import (
+    EvolutionQuestion,
+    KeyAgencyActionsQuestion,
+    LinkagesQuestion,
+    NationalFrameworkQuestion,
+    Question,
+)
+from epic_app.models.models import Agency, Area, Program
+from epic_app.tests import django_postgresql_db, test_data_dir
+
+
+@pytest.fixture
+def import_settings(settings, tmp_path: Path):
+    settings.MEDIA_ROOT = tmp_path
+    return settings
+
+
+def _call_import_epic_domain(*args, stdout: StringIO = None) -> str:
+    _stdout = stdout or StringIO()
+    call_command("import_epic_domain", *args, stdout=_stdout)
+    return _stdout.getvalue()
+
+
+@django_postgresql_db
+class TestImportEpicDomainCommand:
+    def test_import_epic_domain_imports_all_files_in_stage_order(self, import_settings):
+        # 1. Run test.
+        _output = _call_import_epic_domain(test_data_dir / "xlsx")
+
+        # 2. Verify expectations.
+        assert Area.objects.exists()
+        assert Agency.objects.exists()
+        assert Program.objects.filter(agencies__isnull=False).exists()
+        for question_type in [
+            NationalFrameworkQuestion,
+            KeyAgencyActionsQuestion,
+            EvolutionQuestion,
+        ]:
+            assert question_type.objects.exists()
+        assert LinkagesQuestion.objects.count() == Program.objects.count()
+        assert DomainSnapshotFile.get_current().path.is_file()
+        assert "Failed to import" not in _output
+        _imported_files = [
+            Path(_line.split(" from ")[-1].rstrip(".")).name
+            for _line in _output.splitlines()
+            if _line.startswith("Importing main data from")
+        ]
+        assert _imported_files == [
+            "initial_epic_data.xlsx",
+            "agency_data.xlsx",
+            "nationalframeworkquestions.xlsx",
+            "keyagencyactionsquestions.xlsx",
+            "evolutionquestions.xlsx",
+        ]
+        assert _output.count("Import successful.") == 5
+
+    def test_import_epic_domain_differential_keeps_unchanged_domain(
+        self, import_settings
+    ):
+        # 1. Define test data.
+        _call_import_epic_domain(test_data_dir / "xlsx")
+        _question_ids = sorted(Question.objects.values_list("pk", flat=True))
+
+        # 2. Run test.
+        _output = _call_import_epic_domain(test_data_dir / "xlsx", "--differential")
+
+        # 3. Verify expectations.
+        assert _output.count("Import successful.") == 5
+        assert _output.count("No changes.") == 5
+        assert sorted(Question.objects.values_list("pk", flat=True)) == _question_ids
+
+    def test_import_epic_domain_stops_after_failing_stage(
+        self, import_settings, tmp_path: Path
+    ):
+        # 1. Define test data.
+        _domain_dir = tmp_path / "domain"
+        shutil.copytree(test_data_dir / "xlsx", _domain_dir)
+        (_domain_dir / "initial_epic_data.xlsx").unlink()
+        (_domain_dir / "initial_epic_data.csv").write_text(
+            "Area,Group,Program,Description,Reference,Link\n"
+            "Outer Rim,Tatooine,Mos Eisley,Spaceport,,\n"
+            "Outer Rim,Tatooine,MOS EISLEY,Spaceport,,\n"
+        )
+        _stdout = StringIO()
+
+        # 2. Run test.
+        with pytest.raises(CommandError) as err_info:
+            _call_import_epic_domain(_domain_dir, stdout=_stdout)
+
+        # 3. Verify expectations.
+        assert str(err_info.value) == (
+            "Stopped importing the EPIC domain after failing to import: initial_epic_data.csv."
+        )
+        _output = _stdout.getvalue()
+        assert "Failed to import initial_epic_data.csv." in _output
+        assert _output.count("Importing main data from") == 1
+        assert not Program.objects.exists()
+        assert not Agency.objects.exists()
+        assert not LinkagesQuestion.objects.exists()
+        assert not DomainSnapshotFile.get_snapshots_dir().exists()
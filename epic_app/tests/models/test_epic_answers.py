@@ -45,6 +45,15 @@ def get_subtypes(model):
     return list(itertools.chain(*subtypes))
 
 
+def get_choice_answer_cases(choice_values: List[str]) -> List[Dict[str, str]]:
+    # Every choice (and invalid ones) combined with empty, "N/A" and filled justifications.
+    return [
+        dict(selected_choice=c_choice, justify_answer=c_justify)
+        for c_choice in choice_values + ["", "N/A"]
+        for c_justify in ["", "N/A", "Lorem ipsum"]
+    ]
+
+
 @pytest.mark.django_db
 class TestEpicAnswers:
 
@@ -152,6 +161,57 @@ class TestEpicAnswers:
             # Create it twice, it should trigger an update instead of create.
             self.test_SAVE_answer(question_subtype, answer_subtype)
 
+    answer_validity_cases: Dict[Answer, List[Dict[str, Any]]] = {
+        MultipleChoiceAnswer: [
+            # No selected programs, the relationship (outer) joins to NULL.
+            dict(selected_programs=[]),
+            dict(selected_programs=["a"]),
+            dict(selected_programs=["a", "b"]),
+        ],
+        EvolutionAnswer: get_choice_answer_cases(EvolutionChoiceType.values),
+        AgreementAnswer: get_choice_answer_cases(AgreementAnswerType.values),
+    }
+
+    @pytest.mark.parametrize("answer_subtype", get_subtypes(Answer))
+    def test_is_valid_answer_expression_matches_is_valid_answer(
+        self, answer_subtype: Answer
+    ):
+        # Define test data
+        if not answer_subtype in self.answer_validity_cases.keys():
+            pytest.fail(f"No validity cases defined for answer type: {answer_subtype}")
+        answer_subtype.objects.all().delete()
+        a_question = answer_subtype._get_supported_questions()[0].objects.first()
+        for n_case, answer_case in enumerate(
+            self.answer_validity_cases[answer_subtype]
+        ):
+            answer_args = dict(answer_case)
+            selected_programs = answer_args.pop("selected_programs", [])
+            an_answer = answer_subtype.objects.create(
+                user=EpicUser.objects.create(username=f"ValidityUser{n_case}"),
+                question=a_question,
+                **answer_args,
+            )
+            if selected_programs:
+                an_answer.selected_programs.set(
+                    Program.objects.filter(name__in=selected_programs)
+                )
+
+        # Run test
+        annotated_validity = dict(
+            answer_subtype.objects.annotate(
+                is_valid=answer_subtype.get_is_valid_answer_expression()
+            ).values_list("pk", "is_valid")
+        )
+
+        # Verify final expectations
+        expected_validity = {
+            c_answer.pk: c_answer.is_valid_answer()
+            for c_answer in answer_subtype.objects.all()
+        }
+        assert len(expected_validity) == len(self.answer_validity_cases[answer_subtype])
+        assert set(expected_validity.values()) == {True, False}
+        assert annotated_validity == expected_validity
+
 
 @pytest.mark.django_db
 class TestEvolutionAnswer:
@@ -0,0 +1,84 @@
+import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from epic_app.models.epic_answers import AgreementAnswer, MultipleChoiceAnswer
+from epic_app.models.epic_data_version import DataVersion, DataVersionType
+from epic_app.models.epic_questions import LinkagesQuestion, NationalFrameworkQuestion
+from epic_app.models.epic_user import EpicUser
+from epic_app.models.models import Area, Program
+from epic_app.tests import django_postgresql_db
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+def _get_version(name: DataVersionType) -> int:
+    return DataVersion.get_versions([name])[name].version
+
+
+@django_postgresql_db
+class TestDataVersion:
+    def test_get_versions_without_changes_returns_zero(self):
+        _versions = DataVersion.get_versions([DataVersionType.ANSWERS])
+        assert _versions[DataVersionType.ANSWERS].version == 0
+        assert _versions[DataVersionType.ANSWERS].updated_on is None
+
+    def test_bump_increases_version_and_cache_key(self):
+        _names = [DataVersionType.ANSWERS, DataVersionType.DOMAIN]
+        _initial_key = DataVersion.get_cache_key("lorem", _names)
+
+        DataVersion.bump(DataVersionType.ANSWERS)
+        DataVersion.bump(DataVersionType.ANSWERS)
+
+        assert _get_version(DataVersionType.ANSWERS) == 2
+        assert _get_version(DataVersionType.DOMAIN) == 0
+        assert DataVersion.get_cache_key("lorem", _names) != _initial_key
+        assert DataVersion.get_cache_key("lorem", _names).startswith("lorem:answers2-")
+        assert DataVersion.get_cache_key("lorem", _names).endswith(":domain0-0")
+
+    def test_saving_answers_bumps_answers_version(self, epic_test_db):
+        _user = EpicUser.objects.get(username="Anakin")
+        _version = _get_version(DataVersionType.ANSWERS)
+
+        _answer = AgreementAnswer.objects.create(
+            user=_user, question=NationalFrameworkQuestion.objects.first()
+        )
+        assert _get_version(DataVersionType.ANSWERS) > _version
+
+        _version = _get_version(DataVersionType.ANSWERS)
+        _mca = MultipleChoiceAnswer.objects.create(
+            user=_user, question=LinkagesQuestion.objects.first()
+        )
+        _mca.selected_programs.add(Program.objects.first())
+        _answer.delete()
+        assert _get_version(DataVersionType.ANSWERS) >= _version + 3
+
+    def test_saving_domain_bumps_domain_version(self, epic_test_db):
+        _version = _get_version(DataVersionType.DOMAIN)
+        _answers_version = _get_version(DataVersionType.ANSWERS)
+
+        Area.objects.create(name="gamma")
+
+        assert _get_version(DataVersionType.DOMAIN) == _version + 1
+        assert _get_version(DataVersionType.ANSWERS) == _answers_version
+
+    def test_cascade_delete_bumps_versions_once_per_transaction(self, epic_test_db):
+        _user = EpicUser.objects.get(username="Anakin")
+        for question in NationalFrameworkQuestion.objects.all():
+            AgreementAnswer.objects.create(user=_user, question=question)
+        _version = _get_version(DataVersionType.DOMAIN)
+        _answers_version = _get_version(DataVersionType.ANSWERS)
+
+        with CaptureQueriesContext(connection) as queries_context:
+            with transaction.atomic():
+                Area.objects.all().delete()
+                # Nothing gets bumped until the transaction is committed.
+                assert _get_version(DataVersionType.DOMAIN) == _version
+
+        _version_updates = [
+            q_captured["sql"]
+            for q_captured in queries_context.captured_queries
+            if q_captured["sql"].startswith('UPDATE "epic_app_dataversion"')
+        ]
+        assert len(_version_updates) == 2
+        assert _get_version(DataVersionType.DOMAIN) == _version + 1
+        assert _get_version(DataVersionType.ANSWERS) == _answers_version + 1
@@ -0,0 +1,189 @@
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
+
+from epic_app.exporters.domain_snapshot_exporter import DomainSnapshotFile
+from epic_app.importers.xlsx import EpicAgencyImporter
+from epic_app.models import epic_jobs
+from epic_app.models.epic_jobs import EvolutionGraphJob, ImportJob, JobStatusType
+from epic_app.models.models import Agency, Program
+from epic_app.tests import django_postgresql_db, test_data_dir
+from epic_app.tests.importers import full_epic_domain_data
+
+
+@pytest.fixture
+def graph_job_settings(settings, tmp_path: Path):
+    settings.MEDIA_ROOT = tmp_path
+    settings.ERAM_VISUALS_RUNNER = "epic_app.externals.ERAMVisuals.eram_visuals_reportlab.EramVisualsReportlabRunner"
+    return settings
+
+
+@django_postgresql_db
+class TestEvolutionGraphJob:
+    def test_output_dir_is_unique_per_job(self, graph_job_settings):
+        _job_a = EvolutionGraphJob.objects.create()
+        _job_b = EvolutionGraphJob.objects.create()
+
+        assert _job_a.status == JobStatusType.PENDING
+        assert _job_a.output_dir != _job_b.output_dir
+        assert (
+            _job_a.output_dir.parent
+            == Path(graph_job_settings.MEDIA_ROOT) / Path(_job_a.media_dir).parent
+        )
+
+    def test_run_with_valid_data_succeeds(self, graph_job_settings):
+        _csv_file = test_data_dir / "csv" / "evo_summary.csv"
+        _job = EvolutionGraphJob.objects.create()
+
+        _job.run(_csv_file)
+
+        _job.refresh_from_db()
+        assert _job.status == JobStatusType.SUCCEEDED
+        assert (_job.output_dir / "eram_visuals.png").is_file()
+        assert (_job.output_dir / "eram_visuals.pdf").is_file()
+
+    def test_run_with_missing_data_fails(self, graph_job_settings):
+        _job = EvolutionGraphJob.objects.create()
+
+        _job.run(_job.output_dir / "missing.csv")
+
+        _job.refresh_from_db()
+        assert _job.status == JobStatusType.FAILED
+        assert "The graph generation failed during execution" in _job.reason
+
+    def test_clean_up_fails_stale_jobs(self, graph_job_settings):
+        _stale_on = timezone.now() - timedelta(
+            seconds=graph_job_settings.EVOLUTION_GRAPH_JOBS_STALE_AFTER + 1
+        )
+        _stale_job = EvolutionGraphJob.objects.create(status=JobStatusType.RUNNING)
+        _running_job = EvolutionGraphJob.objects.create(status=JobStatusType.RUNNING)
+        _succeeded_job = EvolutionGraphJob.objects.create(
+            status=JobStatusType.SUCCEEDED
+        )
+        EvolutionGraphJob.objects.filter(
+            pk__in=[_stale_job.pk, _succeeded_job.pk]
+        ).update(updated_on=_stale_on)
+
+        EvolutionGraphJob.clean_up()
+
+        _stale_job.refresh_from_db()
+        assert _stale_job.status == JobStatusType.FAILED
+        assert "interrupted" in _stale_job.reason
+        _running_job.refresh_from_db()
+        assert _running_job.status == JobStatusType.RUNNING
+        _succeeded_job.refresh_from_db()
+        assert _succeeded_job.status == JobStatusType.SUCCEEDED
+
+    def test_clean_up_removes_expired_jobs_and_output(self, graph_job_settings):
+        _expired_job = EvolutionGraphJob.objects.create(status=JobStatusType.SUCCEEDED)
+        _recent_job = EvolutionGraphJob.objects.create(status=JobStatusType.SUCCEEDED)
+        for c_job in (_expired_job, _recent_job):
+            c_job.output_dir.mkdir(parents=True)
+            (c_job.output_dir / "eram_visuals.png").touch()
+        EvolutionGraphJob.objects.filter(pk=_expired_job.pk).update(
+            created_on=timezone.now()
+            - timedelta(seconds=graph_job_settings.EVOLUTION_GRAPH_JOBS_RETENTION + 1)
+        )
+
+        EvolutionGraphJob.clean_up()
+
+        assert not EvolutionGraphJob.objects.filter(pk=_expired_job.pk).exists()
+        assert not _expired_job.output_dir.exists()
+        assert EvolutionGraphJob.objects.filter(pk=_recent_job.pk).exists()
+        assert (_recent_job.output_dir / "eram_visuals.png").is_file()
+
+
+@django_postgresql_db
+class TestImportJob:
+    @pytest.fixture
+    def import_job_settings(self, settings, tmp_path: Path):
+        settings.MEDIA_ROOT = tmp_path / "media"
+        settings.IMPORT_JOBS_DIR = tmp_path / "import_jobs"
+        return settings
+
+    def _create_import_job(self, filename: str, **job_fields) -> ImportJob:
+        _upload = SimpleUploadedFile(
+            filename, (test_data_dir / "xlsx" / filename).read_bytes()
+        )
+        return ImportJob.create_from_upload(EpicAgencyImporter, _upload, **job_fields)
+
+    def test_create_from_upload_saves_file_outside_media_root(
+        self, import_job_settings
+    ):
+        _job = self._create_import_job("agency_data.xlsx")
+
+        assert _job.status == JobStatusType.PENDING
+        assert _job.importer_type.endswith(".EpicAgencyImporter")
+        assert _job.input_file.is_file()
+        assert _job.input_file.parent.parent == import_job_settings.IMPORT_JOBS_DIR
+        assert not Path(import_job_settings.MEDIA_ROOT).exists()
+
+    def test_run_with_valid_data_succeeds(
+        self, full_epic_domain_data, import_job_settings
+    ):
+        _n_agencies = Agency.objects.count()
+        _job = self._create_import_job("agency_data.xlsx")
+
+        _job.run()
+
+        _job.refresh_from_db()
+        assert _job.status == JobStatusType.SUCCEEDED
+        assert _job.rows_parsed > 0
+        # Replacing the agencies deletes all the previous ones.
+        assert _job.changes["Agency"] == dict(
+            created=_n_agencies, updated=0, deleted=_n_agencies
+        )
+        assert not _job.errors
+        assert not _job.warnings
+        assert Agency.objects.exists()
+        assert DomainSnapshotFile.get_current().path.is_file()
+        assert not _job.upload_dir.exists()
+
+    def test_run_differential_reports_written_changes(
+        self, full_epic_domain_data, import_job_settings
+    ):
+        Agency.objects.order_by("pk").first().delete()
+        _job = self._create_import_job("agency_data.xlsx", differential=True)
+
+        _job.run()
+
+        _job.refresh_from_db()
+        assert _job.status == JobStatusType.SUCCEEDED
+        assert _job.changes["Agency"] == dict(created=1, updated=0, deleted=0)
+
+    def test_run_with_invalid_data_fails(self, import_job_settings):
+        # The agencies file references programs which do not exist yet.
+        assert not Program.objects.exists()
+        _job = self._create_import_job("agency_data.xlsx")
+
+        _job.run()
+
+        _job.refresh_from_db()
+        assert _job.status == JobStatusType.FAILED
+        assert _job.rows_parsed > 0
+        assert _job.changes == {}
+        assert _job.errors
+        assert not _job.upload_dir.exists()
+
+    def test_run_with_failing_snapshot_export_succeeds_with_warning(
+        self, full_epic_domain_data, import_job_settings, monkeypatch
+    ):
+        def export_domain_snapshot():
+            raise OSError("No space left on device")
+
+        monkeypatch.setattr(epic_jobs, "export_domain_snapshot", export_domain_snapshot)
+        Agency.objects.all().delete()
+        _job = self._create_import_job("agency_data.xlsx")
+
+        _job.run()
+
+        _job.refresh_from_db()
+        assert _job.status == JobStatusType.SUCCEEDED
+        assert not _job.errors
+        assert _job.warnings == [
+            "The domain snapshot could not be exported: No space left on device"
+        ]
+        assert Agency.objects.exists()
@@ -3,8 +3,19 @@ from multiprocessing.sharedctypes import Value
 import pytest
 from rest_framework import serializers
 
-from epic_app.models.epic_answers import AgreementAnswer
-from epic_app.models.epic_questions import NationalFrameworkQuestion, Question
+from epic_app.models.epic_answers import (
+    AgreementAnswer,
+    AgreementAnswerType,
+    EvolutionAnswer,
+    MultipleChoiceAnswer,
+)
+from epic_app.models.epic_questions import (
+    EvolutionChoiceType,
+    EvolutionQuestion,
+    LinkagesQuestion,
+    NationalFrameworkQuestion,
+    Question,
+)
 from epic_app.models.epic_user import EpicUser
 from epic_app.models.models import Program
 from epic_app.serializers.progress_serializer import (
@@ -12,6 +23,7 @@ from epic_app.serializers.progress_serializer import (
     _QuestionAnswerSerializer,
 )
 from epic_app.tests.epic_db_fixture import epic_test_db
+from epic_app.utils import get_instance_as_submodel_type
 
 
 @pytest.mark.django_db
@@ -104,3 +116,83 @@ class TestProgressSerializer:
         assert isinstance(qa_list, list)
         assert list(qa_list[0].keys()) == ["question", "answer"]
         assert len(qa_list) == len(program.questions.all())
+
+    def test_to_representation_matches_is_valid_answer(
+        self, epic_test_db, django_assert_num_queries
+    ):
+        # Define test data.
+        program = Program.objects.get(name="a")
+        fr = self._FakeRequest()
+        fr.user = EpicUser.objects.get(username="Anakin")
+        nfq_valid, nfq_invalid = NationalFrameworkQuestion.objects.filter(
+            program=program
+        )[:2]
+        AgreementAnswer.objects.create(
+            user=fr.user, question=nfq_valid, selected_choice=AgreementAnswerType.AGR
+        )
+        AgreementAnswer.objects.create(user=fr.user, question=nfq_invalid)
+        EvolutionAnswer.objects.create(
+            user=fr.user,
+            question=EvolutionQuestion.objects.filter(program=program).first(),
+            selected_choice=EvolutionChoiceType.CAPABLE,
+        )
+        linkages_answer = MultipleChoiceAnswer.objects.create(
+            user=fr.user, question=LinkagesQuestion.objects.get(program=program)
+        )
+        linkages_answer.selected_programs.add(Program.objects.get(name="b"))
+        # Another user's answers should not count.
+        AgreementAnswer.objects.create(
+            user=EpicUser.objects.get(username="Palpatine"),
+            question=nfq_invalid,
+            selected_choice=AgreementAnswerType.AGR,
+        )
+        questions = list(program.questions.all())
+        expected_answers = {
+            a.question_id: get_instance_as_submodel_type(a)
+            for a in fr.user.user_answers.all()
+        }
+        expected_progress = sum(
+            a.is_valid_answer() for a in expected_answers.values()
+        ) / len(questions)
+
+        # Run test: one query for the questions and one per answer subtype.
+        progress_serializer = ProgressSerializer(context={"request": fr})
+        with django_assert_num_queries(4):
+            serialized_dict = progress_serializer.to_representation(program)
+
+        # Verify final expectations
+        assert serialized_dict["progress"] == expected_progress
+        assert serialized_dict["questions_answers"] == [
+            dict(
+                question=q.id,
+                answer=expected_answers[q.id].id if q.id in expected_answers else None,
+            )
+            for q in questions
+        ]
+
+    def test_to_representation_many_programs(
+        self, epic_test_db, django_assert_num_queries
+    ):
+        # Define test data.
+        fr = self._FakeRequest()
+        fr.user = EpicUser.objects.get(username="Anakin")
+        AgreementAnswer.objects.create(
+            user=fr.user,
+            question=NationalFrameworkQuestion.objects.first(),
+            selected_choice=AgreementAnswerType.AGR,
+        )
+        programs = list(Program.objects.all())
+
+        # Run test: the amount of queries does not depend on the programs.
+        with django_assert_num_queries(4):
+            serialized_list = ProgressSerializer(
+                programs, many=True, context={"request": fr}
+            ).data
+
+        # Verify final expectations
+        assert [p["program"] for p in serialized_list] == [p.id for p in programs]
+        for program, program_progress in zip(programs, serialized_list):
+            _expected = ProgressSerializer(context={"request": fr}).to_representation(
+                program
+            )
+            assert program_progress == dict(program=program.id, **_expected)
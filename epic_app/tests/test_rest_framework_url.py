@@ -1,5 +1,7 @@
+import gzip
 import json
 import random
+import time
 from asyncio import subprocess
 from pathlib import Path
 from statistics import mean
@@ -7,7 +9,11 @@ from typing import Callable, List, Optional, Type
 
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
 from django.http import FileResponse
+from django.test.utils import CaptureQueriesContext
+from django.utils.http import http_date
 from rest_framework.test import APIClient
 
 from epic_app.models.epic_answers import (
@@ -27,9 +33,10 @@ from epic_app.models.epic_questions import (
 )
 from epic_app.models.epic_user import EpicOrganization, EpicUser
 from epic_app.models.models import Program
+from epic_app.serializers import answer_serializer
 from epic_app.tests import django_postgresql_db, test_data_dir
 from epic_app.tests.epic_db_fixture import epic_test_db
-from epic_app.utils import get_submodel_type_list
+from epic_app.utils import get_instance_as_submodel_type, get_submodel_type_list
 
 
 @pytest.fixture(autouse=True)
@@ -415,6 +422,69 @@ class TestEpicOrganizationViewSet:
             f.write(fs)
         assert output_file.exists()
 
+    def test_RETRIEVE_completion_as_advisor_epic_user(
+        self, _report_fixture: dict, api_client: APIClient
+    ):
+        full_url = self.url_root + "completion/"
+        a_program = Program.objects.get(name="a")
+        anakin = EpicUser.objects.get(username="Anakin")
+
+        # Run request
+        set_user_auth_token(api_client, "Dooku")
+        response = api_client.get(full_url)
+
+        # Verify final expectations
+        assert response.status_code == 200
+        assert len(response.data) == len(
+            EpicUser.objects.filter(organization__project=anakin.organization.project)
+        )
+        anakin_data = next(u for u in response.data if u["id"] == anakin.id)
+        assert len(anakin_data["completion"]) == len(Program.objects.all())
+        a_completion = next(
+            c for c in anakin_data["completion"] if c["program"] == a_program.id
+        )
+        anakin_answers = [
+            get_instance_as_submodel_type(a)
+            for a in anakin.user_answers.filter(question__program=a_program)
+        ]
+        assert a_completion == dict(
+            program=a_program.id,
+            answered=len(anakin_answers),
+            valid=sum(a.is_valid_answer() for a in anakin_answers),
+            total=len(a_program.questions.all()),
+        )
+
+    def test_RETRIEVE_completion_is_refreshed_after_answering(
+        self, _report_fixture: dict, api_client: APIClient
+    ):
+        full_url = self.url_root + "completion/"
+        anakin = EpicUser.objects.get(username="Anakin")
+
+        def get_valid_answers() -> int:
+            response = api_client.get(full_url)
+            assert response.status_code == 200
+            anakin_data = next(u for u in response.data if u["id"] == anakin.id)
+            return sum(c["valid"] for c in anakin_data["completion"])
+
+        set_user_auth_token(api_client, "Dooku")
+        valid_answers = get_valid_answers()
+
+        # Run test
+        evo_answer = EvolutionAnswer.objects.filter(user=anakin).first()
+        evo_answer.selected_choice = EvolutionChoiceType.CAPABLE
+        evo_answer.save()
+
+        # Verify final expectations
+        assert get_valid_answers() == valid_answers + 1
+
+    def test_RETRIEVE_completion_as_epic_user_denied(self, api_client: APIClient):
+        # Run request
+        set_user_auth_token(api_client, "Anakin")
+        response = api_client.get(self.url_root + "completion/")
+
+        # Verify final expectations
+        assert response.status_code == 403
+
 
 @django_postgresql_db
 class TestAreaViewSet:
@@ -456,6 +526,35 @@ class TestAreaViewSet:
         assert response.status_code == 200
         assert len(response.data) == expected_entries
 
+    def test_GET_area_tree_is_prefetched_and_cached(self, api_client: APIClient):
+        def get_domain_queries(queries_context: CaptureQueriesContext) -> List[str]:
+            _domain_tables = (
+                '"epic_app_area"',
+                '"epic_app_group"',
+                '"epic_app_program',
+            )
+            return [
+                q_captured["sql"]
+                for q_captured in queries_context.captured_queries
+                if any(d_table in q_captured["sql"] for d_table in _domain_tables)
+            ]
+
+        set_user_auth_token(api_client, "Palpatine")
+        cache.clear()
+
+        # Run test
+        with CaptureQueriesContext(connection) as first_context:
+            first_response = api_client.get(self.url_root)
+        with CaptureQueriesContext(connection) as cached_context:
+            cached_response = api_client.get(self.url_root)
+
+        # Verify final expectations.
+        assert first_response.status_code == cached_response.status_code == 200
+        # Area, Group, Program and ProgramReference.
+        assert len(get_domain_queries(first_context)) == 4
+        assert not get_domain_queries(cached_context)
+        assert cached_response.data == first_response.data
+
 
 @django_postgresql_db
 class TestAgencyViewSet:
@@ -623,6 +722,67 @@ class TestProgramViewSet:
         assert response.status_code == 200
         assert len(response.data) == expected_entries
 
+    def test_GET_questionnaire(self, api_client: APIClient):
+        # Program 'a' has 6 questions (2xNFQ, 2xEVO, 1xKA, 1xLNK)
+        a_program: Program = Program.objects.get(name="a")
+        full_url = self.url_root + f"{a_program.pk}/questionnaire/"
+
+        # Run request.
+        set_user_auth_token(api_client, "Palpatine")
+        response = api_client.get(full_url)
+
+        # Verify final exepctations.
+        assert response.status_code == 200
+        assert response.data["program"] == a_program.pk
+        assert {
+            q_key: len(q_data) for q_key, q_data in response.data["questions"].items()
+        } == {
+            "nationalframework": 2,
+            "keyagencyactions": 1,
+            "evolution": 2,
+            "linkages": 1,
+        }
+        for q_key, q_suffix in [
+            ("nationalframework", "question-nationalframework/"),
+            ("linkages", "question-linkages/"),
+        ]:
+            _single_response = api_client.get(
+                self.url_root + f"{a_program.pk}/" + q_suffix
+            )
+            assert response.data["questions"][q_key] == _single_response.data
+        assert "answers" not in response.data
+        assert "progress" not in response.data
+
+    def test_GET_questionnaire_with_answers(
+        self, api_client: APIClient, _progress_fixture: dict
+    ):
+        # Define test data.
+        a_program: Program = Program.objects.get(name="a")
+        full_url = self.url_root + f"{a_program.pk}/questionnaire/?answers=true"
+        set_user_auth_token(api_client, "Anakin")
+
+        # Run request.
+        with CaptureQueriesContext(connection) as queries_context:
+            response = api_client.get(full_url)
+
+        # Verify final exepctations.
+        assert response.status_code == 200
+        assert response.data["progress"]["progress"] == _progress_fixture["progress"]
+        assert sorted(
+            response.data["progress"]["questions_answers"],
+            key=lambda q_a: q_a["question"],
+        ) == sorted(
+            _progress_fixture["questions_answers"], key=lambda q_a: q_a["question"]
+        )
+        assert sorted(a_data["id"] for a_data in response.data["answers"]) == sorted(
+            q_a["answer"]
+            for q_a in _progress_fixture["questions_answers"]
+            if q_a["answer"]
+        )
+        assert all("selected_choice" in a_data for a_data in response.data["answers"])
+        # Authentication, versions, program, questions, answers and progress.
+        assert len(queries_context.captured_queries) <= 20
+
     @pytest.fixture(autouse=False)
     def _progress_fixture(self) -> dict:
         def get_qa(question_id: int, answer_id: Optional[int]) -> dict:
@@ -676,6 +836,84 @@ class TestProgramViewSet:
         for qa in response.data["questions_answers"]:
             assert qa in _progress_fixture["questions_answers"]
 
+    def test_LIST_progress_epic_user(
+        self, api_client: APIClient, _progress_fixture: dict
+    ):
+        # Define test data.
+        full_url = self.url_root + "progress/"
+        a_program: Program = Program.objects.get(name="a")
+
+        # Run request.
+        set_user_auth_token(api_client, "Anakin")
+        response = api_client.get(full_url)
+
+        # Verify final expectations
+        assert response.status_code == 200
+        assert len(response.data) == len(Program.objects.all())
+        for program_progress in response.data:
+            detail_response = api_client.get(
+                self.url_root + f"{program_progress['program']}/progress/"
+            )
+            assert program_progress["progress"] == detail_response.data["progress"]
+            assert (
+                program_progress["questions_answers"]
+                == detail_response.data["questions_answers"]
+            )
+        a_progress = next(p for p in response.data if p["program"] == a_program.pk)
+        assert a_progress["progress"] == _progress_fixture["progress"]
+
+
+@django_postgresql_db
+class TestDomainSnapshotViewSet:
+    url_root = "/api/domain-snapshot/"
+
+    @pytest.fixture(autouse=True)
+    def _snapshot_settings(self, settings, tmp_path: Path):
+        settings.MEDIA_ROOT = tmp_path
+
+    def test_GET_domain_snapshot(self, api_client: APIClient):
+        # Run test
+        set_user_auth_token(api_client, "Palpatine")
+        response = api_client.get(self.url_root)
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert response["Cache-Control"] == "private, no-cache"
+        _content = json.loads(response.content)
+        assert response["ETag"] == f'"{_content["version"]}"'
+        assert len(_content["programs"]) == len(Program.objects.all())
+
+        # Requesting it again with the ETag returns nothing new.
+        response = api_client.get(self.url_root, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert response.status_code == 304
+
+    def test_GET_domain_snapshot_gzipped(self, api_client: APIClient):
+        set_user_auth_token(api_client, "Palpatine")
+        response = api_client.get(self.url_root, HTTP_ACCEPT_ENCODING="gzip")
+
+        assert response.status_code == 200
+        assert response["Content-Encoding"] == "gzip"
+        _content = json.loads(gzip.decompress(b"".join(response.streaming_content)))
+        assert _content["areas"]
+
+    def test_RETRIEVE_domain_snapshot_version(self, api_client: APIClient):
+        # Define test data.
+        set_user_auth_token(api_client, "Palpatine")
+        _version = json.loads(api_client.get(self.url_root).content)["version"]
+
+        # Run test
+        response = api_client.get(self.url_root + _version + "/")
+        outdated_response = api_client.get(self.url_root + "outdated/")
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert "immutable" in response["Cache-Control"]
+        assert outdated_response.status_code == 404
+
+    def test_GET_domain_snapshot_requires_authentication(self, api_client: APIClient):
+        response = api_client.get(self.url_root)
+        assert response.status_code == 403
+
 
 @django_postgresql_db
 class TestQuestionViewSet:
@@ -713,7 +951,7 @@ class TestQuestionViewSet:
         q_pk = q_type.objects.all().first().pk
         full_url = self.url_root + str(q_pk) + "/answers/"
 
-        # Remove all previous answers, the call should create a new one
+        # Remove all previous answers, the call should return an empty one
         Answer.objects.all().delete()
 
         # Run test
@@ -722,8 +960,30 @@ class TestQuestionViewSet:
 
         # Verify final expectations.
         assert response.status_code == 200
-        # One user = One (new) answer
+        # One user = One (new) answer, which is not saved.
         assert len(response.data) == 1
+        assert response.data[0]["id"] is None
+        assert len(Answer.objects.all()) == 0
+
+    @pytest.mark.parametrize("q_type", q_subtypes)
+    def test_RETRIEVE_answers_with_persist_creates_missing(
+        self, q_type: Type[Question], api_client: APIClient
+    ):
+        # Define test data.
+        q_pk = q_type.objects.all().first().pk
+        full_url = self.url_root + str(q_pk) + "/answers/?persist=true"
+        Answer.objects.all().delete()
+
+        # Run test
+        set_user_auth_token(api_client, "admin")
+        response = api_client.get(full_url)
+        second_response = api_client.get(full_url)
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert len(Answer.objects.all()) == len(EpicUser.objects.all())
+        assert all(a_data["id"] is not None for a_data in response.data)
+        assert second_response.data == response.data
 
     @pytest.mark.parametrize("q_type", q_subtypes)
     def test_RETRIEVE_answers_for_superuser(
@@ -876,6 +1136,27 @@ class TestAnswerViewSet:
         assert len(response.data) == 3
         assert json.dumps(response.data) == json.dumps(expected_values)
 
+    @pytest.mark.parametrize("username", answer_fixture_users)
+    def test_GET_detailed_answers_returns_subtypes(
+        self, username: str, api_client: APIClient, _answers_fixture: dict
+    ):
+        # Define test data, the detailed view does not include the url.
+        expected_values = [
+            {k: v for k, v in a_f.items() if k != "url"}
+            for a_f in _answers_fixture.values()
+        ]
+
+        # Run test
+        set_user_auth_token(api_client, username)
+        response = api_client.get(self.url_root + "detailed/")
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        if not username == self.anakin.username:
+            assert len(response.data) == 0
+            return
+        assert response.data == expected_values
+
     @pytest.mark.parametrize("username", answer_fixture_users)
     @pytest.mark.parametrize("answer_type", get_submodel_type_list(Answer))
     def test_RETRIEVE_answer_only_for_instance_owner(
@@ -1026,6 +1307,137 @@ class TestAnswerViewSet:
         assert changed_answer is not None
         self._compare_answer_fields(changed_answer, json_data, lambda x, y: x == y)
 
+    @pytest.mark.parametrize("answer_type", get_submodel_type_list(Answer))
+    def test_PATCH_answer_reads_instance_once(
+        self,
+        answer_type: Type[Answer],
+        api_client: APIClient,
+        _answers_fixture: dict,
+    ):
+        # Define test data
+        answer_pk = str(_answers_fixture[answer_type]["id"])
+        full_url = self.url_root + answer_pk + "/"
+        json_data = self.update_patch_params[1].values[0][answer_type]
+        set_user_auth_token(api_client, "Anakin")
+
+        # Run test
+        with CaptureQueriesContext(connection) as queries_context:
+            response = api_client.patch(full_url, json_data, format="json")
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        # Only one query loads the answer, other queries just check constraints.
+        _answer_reads = [
+            q_captured["sql"]
+            for q_captured in queries_context.captured_queries
+            if q_captured["sql"].startswith('SELECT "epic_app_answer"')
+        ]
+        assert len(_answer_reads) == 1
+
+    def test_POST_batch_answers_creates_and_updates(
+        self, api_client: APIClient, _answers_fixture: dict
+    ):
+        # Define test data.
+        json_data = [
+            dict(question=1, selected_choice=str(AgreementAnswerType.NAND)),
+            dict(question=5, selected_programs=[3]),
+            dict(
+                question=6,
+                selected_choice=str(AgreementAnswerType.SDIS),
+                justify_answer="Deserunt et velit ad occaecat qui.",
+            ),
+            dict(question=4, selected_choice=str(EvolutionChoiceType.CAPABLE)),
+        ]
+        assert len(Answer.objects.all()) == 3
+
+        # Run test
+        set_user_auth_token(api_client, "Anakin")
+        response = api_client.post(self.url_root + "batch/", json_data, format="json")
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert [r_answer["question"] for r_answer in response.data] == [1, 5, 6, 4]
+        assert len(Answer.objects.all()) == 5
+        _updated_agreement = AgreementAnswer.objects.get(pk=self.yna.pk)
+        assert _updated_agreement.selected_choice == AgreementAnswerType.NAND
+        assert _updated_agreement.justify_answer == self.yna.justify_answer
+        assert response.data[1]["selected_programs"] == [3]
+        assert list(self.mca.selected_programs.values_list("id", flat=True)) == [3]
+        _new_evolution = EvolutionAnswer.objects.get(question_id=4)
+        assert _new_evolution.user == self.anakin
+        assert _new_evolution.selected_choice == EvolutionChoiceType.CAPABLE
+        assert AgreementAnswer.objects.get(question_id=6).user == self.anakin
+
+    @pytest.mark.parametrize(
+        "json_data",
+        [
+            pytest.param(
+                [dict(question=1, selected_choice="NOPE")], id="Invalid choice"
+            ),
+            pytest.param(
+                [dict(question=5, selected_programs=[42])], id="Invalid program"
+            ),
+            pytest.param(
+                [dict(question=42, selected_choice="")], id="Invalid question"
+            ),
+            pytest.param(
+                [dict(question=3, selected_choice=""), dict(question=3)],
+                id="Duplicated question",
+            ),
+            pytest.param(dict(question=1), id="Not a list"),
+        ],
+    )
+    def test_POST_batch_answers_invalid_saves_nothing(
+        self, json_data: list, api_client: APIClient
+    ):
+        # Run test
+        set_user_auth_token(api_client, "Anakin")
+        response = api_client.post(self.url_root + "batch/", json_data, format="json")
+
+        # Verify final expectations.
+        assert response.status_code == 400
+        assert len(Answer.objects.all()) == 0
+
+    def test_POST_batch_answers_concurrently_created_returns_conflict(
+        self, api_client: APIClient, _answers_fixture: dict, monkeypatch
+    ):
+        # Define test data.
+        _bulk_create_submodels = answer_serializer.bulk_create_submodels
+
+        def create_concurrent_answer(answer_type, answers):
+            # Another request answers the same question right before the batch does.
+            AgreementAnswer.objects.create(user=self.anakin, question_id=6)
+            return _bulk_create_submodels(answer_type, answers)
+
+        monkeypatch.setattr(
+            answer_serializer, "bulk_create_submodels", create_concurrent_answer
+        )
+        json_data = [
+            dict(question=1, selected_choice=str(AgreementAnswerType.NAND)),
+            dict(question=6, selected_choice=str(AgreementAnswerType.SDIS)),
+        ]
+
+        # Run test
+        set_user_auth_token(api_client, "Anakin")
+        response = api_client.post(self.url_root + "batch/", json_data, format="json")
+
+        # Verify final expectations.
+        assert response.status_code == 409
+        assert len(Answer.objects.all()) == 3
+        assert (
+            AgreementAnswer.objects.get(pk=self.yna.pk).selected_choice
+            == self.yna.selected_choice
+        )
+
+    def test_POST_batch_answers_without_epic_user_is_forbidden(
+        self, api_client: APIClient
+    ):
+        set_user_auth_token(api_client, "admin")
+        response = api_client.post(
+            self.url_root + "batch/", [dict(question=3)], format="json"
+        )
+        assert response.status_code == 403
+
 
 @django_postgresql_db
 class TestSummaryViewSet:
@@ -1160,6 +1572,161 @@ class TestSummaryViewSet:
         assert ".pdf" in response.data["summary_pdf"]
         assert response.data["summary_data"]
 
+    @pytest.fixture
+    def graph_job_settings(self, settings, tmp_path: Path):
+        settings.MEDIA_ROOT = tmp_path
+        settings.ERAM_VISUALS_RUNNER = "epic_app.externals.ERAMVisuals.eram_visuals_reportlab.EramVisualsReportlabRunner"
+        return settings
+
+    def _wait_for_graph_job(self, api_client: APIClient, job_url: str) -> dict:
+        for _ in range(100):
+            response = api_client.get(job_url)
+            assert response.status_code == 200
+            if response.data["status"] not in ("PENDING", "RUNNING"):
+                return response.data
+            time.sleep(0.1)
+        pytest.fail("Evolution graph job did not finish in time.")
+
+    def test_POST_summary_evolution_graph_job_returns_accepted(
+        self, api_client: APIClient, graph_job_settings
+    ):
+        # Define test data.
+        full_url = self.url_root + "evolution-graph-job/"
+        self._get_evolution_test_data(api_client)
+
+        # Run test
+        set_user_auth_token(api_client, "Palpatine")
+        response = api_client.post(full_url)
+
+        # Verify final expectations.
+        assert response.status_code == 202
+        assert response.data["summary_data"]
+        assert response.data["job_id"] in response.data["job_url"]
+        _job_data = self._wait_for_graph_job(api_client, response.data["job_url"])
+        assert _job_data["status"] == "SUCCEEDED"
+        assert ".png" in _job_data["summary_graph"]
+        assert ".pdf" in _job_data["summary_pdf"]
+        assert _job_data["summary_data"] == response.data["summary_data"]
+
+    def test_GET_summary_evolution_graph_job_of_other_user_returns_not_found(
+        self, api_client: APIClient, graph_job_settings
+    ):
+        # Define test data.
+        set_user_auth_token(api_client, "Palpatine")
+        response = api_client.post(self.url_root + "evolution-graph-job/")
+        assert response.status_code == 202
+        self._wait_for_graph_job(api_client, response.data["job_url"])
+
+        # Run test
+        set_user_auth_token(api_client, "Anakin")
+        other_response = api_client.get(response.data["job_url"])
+        set_user_auth_token(api_client, "admin")
+        admin_response = api_client.get(response.data["job_url"])
+
+        # Verify final expectations.
+        assert other_response.status_code == 404
+        assert admin_response.status_code == 200
+
+    @pytest.mark.parametrize(
+        "job_id",
+        [
+            pytest.param("abc", id="Not an uuid"),
+            pytest.param("0123abcd-0123-abcd-0123", id="Truncated uuid"),
+            pytest.param("00000000-0000-0000-0000-000000000000", id="Unknown uuid"),
+        ],
+    )
+    def test_GET_summary_evolution_graph_job_with_invalid_id_returns_not_found(
+        self, job_id: str, api_client: APIClient
+    ):
+        # Define test data.
+        set_user_auth_token(api_client, "admin")
+
+        # Run test
+        response = api_client.get(self.url_root + f"evolution-graph-job/{job_id}/")
+
+        # Verify final expectations.
+        assert response.status_code == 404
+
+
+@django_postgresql_db
+class TestConditionalGet:
+    @pytest.mark.parametrize(
+        "url",
+        [
+            pytest.param("/api/area/", id="Areas"),
+            pytest.param("/api/agency/", id="Agencies"),
+            pytest.param("/api/program/", id="Programs"),
+            pytest.param("/api/question/", id="Questions"),
+            pytest.param("/api/answer/", id="Answers"),
+        ],
+    )
+    def test_GET_with_matching_etag_returns_not_modified(
+        self, url: str, api_client: APIClient
+    ):
+        # Define test data.
+        set_user_auth_token(api_client, "Palpatine")
+        first_response = api_client.get(url)
+        assert first_response.status_code == 200
+        assert first_response.has_header("ETag")
+
+        # Run test
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=first_response["ETag"])
+
+        # Verify final expectations.
+        assert response.status_code == 304
+        assert response["ETag"] == first_response["ETag"]
+        assert not response.content
+
+    def test_GET_after_data_changes_returns_content(self, api_client: APIClient):
+        # Define test data.
+        set_user_auth_token(api_client, "Palpatine")
+        first_response = api_client.get("/api/program/")
+        _program = Program.objects.first()
+        _program.name = "Renamed program"
+        _program.save()
+
+        # Run test
+        response = api_client.get(
+            "/api/program/", HTTP_IF_NONE_MATCH=first_response["ETag"]
+        )
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert response["ETag"] != first_response["ETag"]
+
+    def test_GET_after_data_changes_within_same_second_returns_content(
+        self, api_client: APIClient
+    ):
+        # Define test data.
+        set_user_auth_token(api_client, "Palpatine")
+        first_response = api_client.get("/api/program/")
+        assert not first_response.has_header("Last-Modified")
+        _program = Program.objects.first()
+        _program.name = "Renamed program"
+        _program.save()
+
+        # Run test
+        response = api_client.get(
+            "/api/program/",
+            HTTP_IF_NONE_MATCH=first_response["ETag"],
+            HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 1),
+        )
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert response.data[0]["name"] == "Renamed program"
+
+    def test_GET_answers_etag_differs_per_user(self, api_client: APIClient):
+        set_user_auth_token(api_client, "Palpatine")
+        palpatine_response = api_client.get("/api/answer/")
+        set_user_auth_token(api_client, "Anakin")
+        response = api_client.get(
+            "/api/answer/", HTTP_IF_NONE_MATCH=palpatine_response["ETag"]
+        )
+
+        assert response.status_code == 200
+        assert response["ETag"] != palpatine_response["ETag"]
+
 
 @django_postgresql_db
 class TestApiDocumentation:
@@ -18,6 +18,9 @@ router.register(r"area", views.AreaViewSet)
 router.register(r"agency", views.AgencyViewSet)
 router.register(r"group", views.GroupViewSet)
 router.register(r"program", views.ProgramViewSet)
+router.register(
+    r"domain-snapshot", views.DomainSnapshotViewSet, basename="domain-snapshot"
+)
 
 # Question / answer endpoints
 router.register(r"question", views.QuestionViewSet)
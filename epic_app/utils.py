@@ -1,7 +1,7 @@
 import itertools
 from typing import List, Type
 
-from django.db import models
+from django.db import connections, models, router
 
 
 def get_submodel_type_list(model: Type[models.Model]) -> List[Type[models.Model]]:
@@ -36,5 +36,103 @@ def get_instance_as_submodel_type(model_instance: models.Model) -> models.Model:
     """
     Gets the instance equivalent as a submodel. This model is done to avoid using the polymorphic library for django.
     """
+    if not type(model_instance).__subclasses__():
+        # Already a submodel instance, no need to query it again.
+        return model_instance
     submodel_type = get_submodel_type(type(model_instance), model_instance.pk)
     return submodel_type.objects.get(pk=model_instance.pk)
+
+
+def get_submodel_instance(queryset: models.QuerySet, pk: str) -> models.Model:
+    """
+    Gets the instance with the given `pk` as its submodel type with a single query,
+    joining the tables of all the submodels of the `queryset` model.
+
+    Args:
+        queryset (models.QuerySet): Queryset of the base model to look into.
+        pk (str): Primary key of the instance.
+
+    Raises:
+        ObjectDoesNotExist: When no submodel instance with the given `pk` exists.
+
+    Returns:
+        models.Model: Instance of the matching submodel type.
+    """
+    _links = [
+        st._meta.get_ancestor_link(queryset.model).remote_field.get_accessor_name()
+        for st in get_submodel_type_list(queryset.model)
+    ]
+    base_instance = queryset.select_related(*_links).get(pk=pk)
+    sm_instance = next(
+        (
+            getattr(base_instance, _link)
+            for _link in _links
+            if hasattr(base_instance, _link)
+        ),
+        None,
+    )
+    if sm_instance is None:
+        raise queryset.model.DoesNotExist(f"No submodel instance found for {pk}.")
+    return sm_instance
+
+
+def bulk_create_submodels(
+    submodel_type: Type[models.Model], instances: List[models.Model]
+) -> List[models.Model]:
+    """
+    Bulk creates instances of a (single level) multi-table inherited model, which
+    Django's `bulk_create` does not support. The parent rows are bulk created first
+    and then the child rows are inserted pointing to them.
+    Note that, as with `bulk_create`, neither `save` nor any signal is triggered.
+
+    Args:
+        submodel_type (Type[models.Model]): Submodel whose instances will be created.
+        instances (List[models.Model]): Unsaved instances of the submodel type.
+
+    Raises:
+        ValueError: When the submodel type does not have exactly one concrete parent.
+
+    Returns:
+        List[models.Model]: The given instances, now saved.
+    """
+    if not instances:
+        return instances
+    _parent_links = submodel_type._meta.parents
+    if len(_parent_links) != 1:
+        raise ValueError(f"{submodel_type} should have exactly one concrete parent.")
+    (parent_type, parent_link), *_ = _parent_links.items()
+    _db = router.db_for_write(submodel_type)
+
+    # Create the parent rows.
+    _parent_fields = [f for f in parent_type._meta.concrete_fields if not f.primary_key]
+    parents = [
+        parent_type(**{f.attname: getattr(i, f.attname) for f in _parent_fields})
+        for i in instances
+    ]
+    if connections[_db].features.can_return_rows_from_bulk_insert:
+        parent_type._base_manager.using(_db).bulk_create(parents)
+    else:
+        for parent in parents:
+            ((parent.pk,),) = parent_type._base_manager._insert(
+                [parent],
+                fields=_parent_fields,
+                returning_fields=[parent_type._meta.pk],
+                using=_db,
+            )
+
+    # Create the child rows pointing to their parents.
+    for instance, parent in zip(instances, parents):
+        setattr(instance, parent_link.attname, parent.pk)
+        setattr(instance, parent_type._meta.pk.attname, parent.pk)
+    _child_fields = submodel_type._meta.local_concrete_fields
+    _batch_size = max(connections[_db].ops.bulk_batch_size(_child_fields, instances), 1)
+    for n_batch in range(0, len(instances), _batch_size):
+        submodel_type._base_manager._insert(
+            instances[n_batch : n_batch + _batch_size],
+            fields=_child_fields,
+            using=_db,
+        )
+    for instance in instances:
+        instance._state.adding = False
+        instance._state.db = _db
+    return instances
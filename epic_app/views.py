@@ -1,12 +1,25 @@
 # Create your views here.
+import gzip
 import io
 from pathlib import Path
 from typing import List, Type, Union
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
 from django.core.files.storage import FileSystemStorage
-from django.db import models
-from django.http import FileResponse, HttpResponseForbidden
+from django.db import IntegrityError, models, transaction
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponse,
+    HttpResponseBase,
+    HttpResponseForbidden,
+)
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import quote_etag
 from rest_framework import permissions, serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.request import Request
@@ -14,11 +27,16 @@ from rest_framework.response import Response
 
 from epic_app import epic_permissions
 from epic_app import serializers as epic_serializer
+from epic_app.background_jobs import submit_background_job
+from epic_app.conditional_get import ConditionalGetMixin
+from epic_app.exporters.domain_snapshot_exporter import DomainSnapshotFile
 from epic_app.exporters.summary_evolution_csv_exporter import SummaryEvolutionCsvFile
-from epic_app.externals import EramVisualsWrapper
-from epic_app.externals.ERAMVisuals.eram_visuals_wrapper import EramVisualsRunner
+from epic_app.externals import EramVisualsWrapper, get_eram_visuals_runner
+from epic_app.externals.ERAMVisuals.eram_visuals_wrapper import EramVisualsOutput
 from epic_app.externals.external_wrapper_base import ExternalWrapperStatusType
-from epic_app.models.epic_answers import Answer
+from epic_app.models.epic_answers import Answer, MultipleChoiceAnswer
+from epic_app.models.epic_data_version import DataVersion, DataVersionType
+from epic_app.models.epic_jobs import EvolutionGraphJob, JobStatusType
 from epic_app.models.epic_questions import (
     EvolutionQuestion,
     KeyAgencyActionsQuestion,
@@ -29,7 +47,12 @@ from epic_app.models.epic_questions import (
 from epic_app.models.epic_user import EpicOrganization, EpicUser
 from epic_app.models.models import Agency, Area, Group, Program
 from epic_app.serializers.report_pdf import EpicPdfReport
-from epic_app.utils import get_submodel_type, get_submodel_type_list
+from epic_app.utils import (
+    bulk_create_submodels,
+    get_submodel_instance,
+    get_submodel_type,
+    get_submodel_type_list,
+)
 
 
 def _filter_project_organizations_users_queryset(
@@ -148,6 +171,32 @@ class EpicOrganizationViewSet(viewsets.ReadOnlyModelViewSet):
         )
         return Response(r_serializer.data)
 
+    @action(
+        detail=False,
+        url_path="completion",
+        url_name="completion",
+        permission_classes=[epic_permissions.IsAdminOrEpicAdvisor],
+    )
+    def get_completion_matrix(self, request: Request) -> Response:
+        """
+        RETRIEVES, for each `EpicUser` of the requester's `EpicProject`, the answered, valid and total questions of each `Program`.
+        The result is cached until answers, domain or users change.
+        """
+        _scope = "all"
+        if not (request.user.is_staff or request.user.is_superuser):
+            _scope = f"project{request.user.epicuser.organization.project_id}"
+        _cache_key = DataVersion.get_cache_key(
+            f"completion-matrix:{_scope}",
+            [DataVersionType.ANSWERS, DataVersionType.DOMAIN, DataVersionType.USERS],
+        )
+        _completion_matrix = cache.get(_cache_key)
+        if _completion_matrix is None:
+            _completion_matrix = epic_serializer.CompletionMatrixSerializer(
+                _filter_project_organizations_users_queryset(request)
+            ).data
+            cache.set(_cache_key, _completion_matrix, timeout=None)
+        return Response(_completion_matrix)
+
     @action(
         detail=False,
         url_path="report-pdf",
@@ -176,17 +225,35 @@ class EpicOrganizationViewSet(viewsets.ReadOnlyModelViewSet):
         return FileResponse(buffer, as_attachment=True, filename="answers_report.pdf")
 
 
-class AreaViewSet(viewsets.ReadOnlyModelViewSet):
+class AreaViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     Acess point for CRUD operations on `Area` table.
     """
 
-    queryset = Area.objects.all().order_by("name")
+    queryset = (
+        Area.objects.all()
+        .prefetch_related("groups__programs__references")
+        .order_by("name")
+    )
     serializer_class = epic_serializer.AreaSerializer
     permission_classes = [permissions.DjangoModelPermissions]
 
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """
+        GET the whole domain tree (`Area` -> `Group` -> `Program` -> `ProgramReference`) with one query per level.
+        The result is cached per host (urls are absolute) until the domain changes.
+        """
+        _cache_key = DataVersion.get_cache_key(
+            f"area-tree:{request.build_absolute_uri('/')}", [DataVersionType.DOMAIN]
+        )
+        _area_tree = cache.get(_cache_key)
+        if _area_tree is None:
+            _area_tree = super().list(request, *args, **kwargs).data
+            cache.set(_cache_key, _area_tree, timeout=None)
+        return Response(_area_tree)
+
 
-class AgencyViewSet(viewsets.ReadOnlyModelViewSet):
+class AgencyViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     Acess point for CRUD operations on `Agency` table.
     """
@@ -201,12 +268,14 @@ class GroupViewSet(viewsets.ReadOnlyModelViewSet):
     Acess point for CRUD operations on `Group` table.
     """
 
-    queryset = Group.objects.all().order_by("name")
+    queryset = (
+        Group.objects.all().prefetch_related("programs__references").order_by("name")
+    )
     serializer_class = epic_serializer.GroupSerializer
     permission_classes = [permissions.DjangoModelPermissions]
 
 
-class ProgramViewSet(viewsets.ReadOnlyModelViewSet):
+class ProgramViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     Acess point for CRUD operations on `Program` table.
     """
@@ -214,6 +283,17 @@ class ProgramViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Program.objects.all()
     serializer_class = epic_serializer.ProgramSerializer
     permission_classes = [permissions.DjangoModelPermissions]
+    conditional_action_data_versions = {
+        "get_progress": [DataVersionType.DOMAIN, DataVersionType.ANSWERS],
+        "get_programs_progress": [DataVersionType.DOMAIN, DataVersionType.ANSWERS],
+        "get_questionnaire": [DataVersionType.DOMAIN, DataVersionType.ANSWERS],
+    }
+    questionnaire_question_types = {
+        "nationalframework": NationalFrameworkQuestion,
+        "keyagencyactions": KeyAgencyActionsQuestion,
+        "evolution": EvolutionQuestion,
+        "linkages": LinkagesQuestion,
+    }
 
     @action(detail=True, url_path="progress", url_name="progress")
     def get_progress(self, request: Request, pk: str = None) -> Response:
@@ -234,6 +314,22 @@ class ProgramViewSet(viewsets.ReadOnlyModelViewSet):
         )
         return Response(serializer.data)
 
+    @action(detail=False, url_path="progress", url_name="progress-list")
+    def get_programs_progress(self, request: Request) -> Response:
+        """
+        Gets the percentage of answered questions for every `Program` and the `EpicUser` currently logged in, so the overview requires a single request.
+
+        Args:
+            request (Request): API Request.
+
+        Returns:
+            Response: Result of the serialised request to `ProgressSerializer` as a list, with the `program` id on each entry.
+        """
+        serializer = epic_serializer.ProgressSerializer(
+            self.get_queryset(), many=True, context={"request": request}
+        )
+        return Response(serializer.data)
+
     def _get_question(
         self, request: Request, question_type: Question, pk: str = None
     ) -> Response:
@@ -249,6 +345,50 @@ class ProgramViewSet(viewsets.ReadOnlyModelViewSet):
         )
         return Response(serializer.data)
 
+    @action(detail=True, url_path="questionnaire", url_name="questionnaire")
+    def get_questionnaire(self, request: Request, pk: str = None) -> Response:
+        """
+        GET all the questions related to the program (`pk`) grouped by their type, so a program page needs a single request.
+        When the query parameter `answers=true` is given, the answers of the requesting user to those questions and their progress are also included.
+        Every `Question` and `Answer` subtype is loaded with a single query.
+
+        Args:
+            request (Request): API Request.
+            pk (str, optional): Id of the selected program. Defaults to None.
+
+        Returns:
+            Response: Serialized questions (and answers) of the program.
+        """
+        program: Program = get_object_or_404(Program, pk=pk)
+        questionnaire = dict(program=program.pk)
+        questionnaire["questions"] = {
+            q_key: epic_serializer.QuestionSerializer.get_concrete_serializer(q_type)(
+                q_type.objects.filter(program=program),
+                many=True,
+                context={"request": request},
+            ).data
+            for q_key, q_type in self.questionnaire_question_types.items()
+        }
+        if request.query_params.get("answers", "") != "true":
+            return Response(questionnaire)
+
+        questionnaire["answers"] = []
+        for a_type in get_submodel_type_list(Answer):
+            _answers = a_type.objects.filter(
+                user_id=request.user.pk, question__program=program
+            )
+            if a_type == MultipleChoiceAnswer:
+                _answers = _answers.prefetch_related("selected_programs")
+            questionnaire["answers"].extend(
+                epic_serializer.AnswerSerializer.get_concrete_serializer(a_type)(
+                    _answers, many=True, context={"request": request}
+                ).data
+            )
+        questionnaire["progress"] = epic_serializer.ProgressSerializer(
+            program, context={"request": request}
+        ).data
+        return Response(questionnaire)
+
     @action(
         detail=True,
         url_path="question-nationalframework",
@@ -322,10 +462,66 @@ class ProgramViewSet(viewsets.ReadOnlyModelViewSet):
         return self._get_question(request, LinkagesQuestion, pk)
 
 
-class QuestionViewSet(viewsets.ReadOnlyModelViewSet):
+class DomainSnapshotViewSet(viewsets.ViewSet):
+    """
+    Access point to the gzipped JSON snapshot of the whole EPIC domain, generated after each import.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def _get_snapshot_response(
+        self, request: Request, snapshot: DomainSnapshotFile, cache_control: str
+    ) -> HttpResponseBase:
+        etag = quote_etag(snapshot.version)
+        response = get_conditional_response(request._request, etag=etag)
+        if response is None:
+            snapshot_file = snapshot.get_or_export()
+            if "gzip" in request.META.get("HTTP_ACCEPT_ENCODING", ""):
+                response = FileResponse(
+                    snapshot_file.open("rb"), content_type="application/json"
+                )
+                response["Content-Encoding"] = "gzip"
+            else:
+                response = HttpResponse(
+                    gzip.decompress(snapshot_file.read_bytes()),
+                    content_type="application/json",
+                )
+        response["ETag"] = etag
+        response["Cache-Control"] = cache_control
+        patch_vary_headers(response, ("Accept-Encoding", "Authorization"))
+        return response
+
+    def list(self, request: Request) -> HttpResponseBase:
+        """
+        GET the snapshot of the current domain. Clients should revalidate it with its `ETag`.
+        """
+        return self._get_snapshot_response(
+            request, DomainSnapshotFile.get_current(), "private, no-cache"
+        )
+
+    def retrieve(self, request: Request, pk: str = None) -> HttpResponseBase:
+        """
+        GET the snapshot of the given domain version. As a version never changes, it can be cached for good.
+        """
+        snapshot = DomainSnapshotFile.get_current()
+        if pk != snapshot.version:
+            raise Http404
+        return self._get_snapshot_response(
+            request, snapshot, "private, max-age=31536000, immutable"
+        )
+
+
+class QuestionViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Question.objects.all()
     serializer_class = epic_serializer.QuestionSerializer
     permission_classes = [permissions.DjangoModelPermissions]
+    conditional_action_data_versions = {
+        "retrieve_answers": [
+            DataVersionType.DOMAIN,
+            DataVersionType.ANSWERS,
+            DataVersionType.USERS,
+        ],
+    }
 
     @staticmethod
     def _get_related_answer_type(question_pk: str) -> Type[Answer]:
@@ -375,34 +571,47 @@ class QuestionViewSet(viewsets.ReadOnlyModelViewSet):
     def retrieve_answers(self, request: Request, pk: str = None) -> models.QuerySet:
         """
         Retrieves the `answers` for the given `question`.
+        Users without an answer yet get an empty (unsaved) one, unless the query
+        parameter `persist=true` is given, in which case those are also created.
         ASSUMPTION: The request is done with an `EpicUser`.
 
         Args:
             request (Request): Request from the client.
             pk (str, optional): `Answer` id. Defaults to None.
         """
-
-        def get_user_answer(epic_user: EpicUser) -> Answer:
-            a_instance, _ = a_type.objects.get_or_create(
-                question=Question.objects.get(pk=pk), user=epic_user
-            )
-            return a_instance
-
-        e_users = self._get_epic_users_queryset(request)
-        a_type = self._get_related_answer_type(question_pk=pk)
+        question = get_object_or_404(Question, pk=pk)
+        e_users = list(self._get_epic_users_queryset(request))
+        a_type = self._get_related_answer_type(question_pk=question.pk)
         a_serializer_type = epic_serializer.AnswerSerializer.get_concrete_serializer(
             a_type
         )
-        a_instances = [get_user_answer(e_user) for e_user in e_users]
+        _answers = a_type.objects.filter(question=question, user__in=e_users)
+        if a_type == MultipleChoiceAnswer:
+            _answers = _answers.prefetch_related("selected_programs")
+        user_answers = {a_instance.user_id: a_instance for a_instance in _answers}
+        missing_answers = [
+            a_type(question=question, user=e_user)
+            for e_user in e_users
+            if e_user.pk not in user_answers
+        ]
+        if missing_answers and request.query_params.get("persist", "") == "true":
+            with transaction.atomic():
+                bulk_create_submodels(a_type, missing_answers)
+                DataVersion.bump(DataVersionType.ANSWERS)
+        user_answers.update(
+            (a_instance.user_id, a_instance) for a_instance in missing_answers
+        )
+        a_instances = [user_answers[e_user.pk] for e_user in e_users]
         a_serializer = a_serializer_type(
             a_instances, many=True, context={"request": request}
         )
         return Response(a_serializer.data)
 
 
-class AnswerViewSet(viewsets.ModelViewSet):
+class AnswerViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Answer.objects.all()
     serializer_class = epic_serializer.AnswerSerializer
+    conditional_data_versions = [DataVersionType.ANSWERS]
 
     def get_permissions(self):
         """
@@ -411,8 +620,10 @@ class AnswerViewSet(viewsets.ModelViewSet):
         Returns:
             List[permissions.BasePermission]: List of permissions for the request being done.
         """
-        if not self.request.data.get("user", None) and getattr(
-            self.request.user, "epicuser", False
+        if (
+            isinstance(self.request.data, dict)
+            and not self.request.data.get("user", None)
+            and getattr(self.request.user, "epicuser", False)
         ):
             self.request.data["user"] = self.request.user.epicuser.id
         if self.request.method in ["DELETE", "PUT", "PATCH"]:
@@ -438,35 +649,80 @@ class AnswerViewSet(viewsets.ModelViewSet):
             return EpicUser.objects.none()
         return answer_type.objects.filter(user=self.request.user)
 
-    def _get_is_authorized_user(self, request, pk: str) -> bool:
-        return (
-            getattr(request.user, "epicuser", False)
-            and Answer.objects.filter(pk=pk, user=request.user.epicuser).exists()
-        )
+    @action(methods=["GET"], detail=False, url_path="detailed", url_name="detailed")
+    def list_detailed(self, request: Request) -> Response:
+        """
+        GET list of `Answers` of the requesting user, each serialized based on its
+        subtype. Every subtype is loaded with a single query.
+
+        Args:
+            request (Request): Request from the client.
+
+        Returns:
+            Response: Serialized `Answer` subtypes sorted by `id`.
+        """
+        a_data = []
+        for a_subtype in get_submodel_type_list(Answer):
+            _answers = self._filter_queryset(a_subtype)
+            if a_subtype == MultipleChoiceAnswer:
+                _answers = _answers.prefetch_related("selected_programs")
+            a_data.extend(
+                epic_serializer.AnswerSerializer.get_concrete_serializer(a_subtype)(
+                    _answers, many=True, context={"request": request}
+                ).data
+            )
+        return Response(sorted(a_data, key=lambda a_item: a_item["id"]))
+
+    def get_object(self) -> Answer:
+        """
+        Gets the requested `Answer` as its subtype with a single query. The instance
+        is kept for the rest of the request, so permissions and view methods share it.
+
+        Raises:
+            Http404: When no `Answer` of the requesting user matches the given `pk`.
+
+        Returns:
+            Answer: Instance of the concrete `Answer` subtype.
+        """
+        if not hasattr(self, "_answer_instance"):
+            try:
+                self._answer_instance = get_submodel_instance(
+                    self._filter_queryset(Answer), self.kwargs[self.lookup_field]
+                )
+            except ObjectDoesNotExist:
+                raise Http404
+            self.check_object_permissions(self.request, self._answer_instance)
+        return self._answer_instance
+
+    def _get_is_authorized_user(self, request) -> bool:
+        if not getattr(request.user, "epicuser", False):
+            return False
+        try:
+            return self.get_object().user_id == request.user.epicuser.pk
+        except Http404:
+            return False
 
     def retrieve(self, request, pk: str, *args, **kwargs):
         """
         RETRIEVE a single `Answer` which is serialized based on its subtype.
         """
-        if not self._get_is_authorized_user(request, pk):
+        if not self._get_is_authorized_user(request):
             return HttpResponseForbidden()
-        a_subtype = get_submodel_type(Answer, pk)
+        a_instance = self.get_object()
         a_serializer_type = epic_serializer.AnswerSerializer.get_concrete_serializer(
-            a_subtype
-        )
-        a_serializer = a_serializer_type(
-            self._filter_queryset(a_subtype).get(pk=pk), context={"request": request}
+            type(a_instance)
         )
+        a_serializer = a_serializer_type(a_instance, context={"request": request})
         return Response(data=a_serializer.data)
 
     def _get_update_request(self, request: Request, pk: str) -> Request:
-        if not self._get_is_authorized_user(request, pk):
+        if not self._get_is_authorized_user(request):
             return HttpResponseForbidden()
-        a_subtype = get_submodel_type(Answer, pk)
         self.serializer_class = (
-            epic_serializer.AnswerSerializer.get_concrete_serializer(a_subtype)
+            epic_serializer.AnswerSerializer.get_concrete_serializer(
+                type(self.get_object())
+            )
         )
-        self.queryset = self._filter_queryset(a_subtype).get(pk=pk)
         return request
 
     def update(self, request, pk: str, *args, **kwargs):
@@ -496,6 +752,39 @@ class AnswerViewSet(viewsets.ModelViewSet):
         )
         return super().create(request, *args, **kwargs)
 
+    @action(methods=["POST"], detail=False, url_path="batch", url_name="batch")
+    def batch_upsert(self, request: Request) -> Response:
+        """
+        CREATE or UPDATE a list of `Answer` of the requesting `EpicUser` in a single
+        transaction. Each item is validated against the serializer of the `Answer`
+        subtype related to its `question`; when any item is invalid nothing is saved.
+
+        Args:
+            request (Request): Request from the client.
+
+        Returns:
+            Response: The upserted `Answer` list, serialized based on their subtype.
+        """
+        if not getattr(request.user, "epicuser", False):
+            return HttpResponseForbidden()
+        b_serializer = epic_serializer.AnswerBatchSerializer(
+            data=request.data, context={"request": request}
+        )
+        b_serializer.is_valid(raise_exception=True)
+        try:
+            b_serializer.save()
+        except IntegrityError:
+            # Another request answered the same question in the meantime.
+            return Response(
+                dict(
+                    non_field_errors=[
+                        "The answers were modified by another request, please try again."
+                    ]
+                ),
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response(b_serializer.data, status=status.HTTP_200_OK)
+
 
 class SummaryViewSet(viewsets.ModelViewSet):
     queryset = Question.objects.all()
@@ -565,6 +854,16 @@ class SummaryViewSet(viewsets.ModelViewSet):
         )
         return Response(r_serializer.data)
 
+    def _get_evolution_summary(self, request: Request) -> List[dict]:
+        return epic_serializer.SummaryEvolutionSerializer(
+            Program.objects.all(),
+            many=True,
+            context={
+                "request": request,
+                "organizations": _filter_project_organizations_queryset(request),
+            },
+        ).data
+
     @action(
         methods=["GET"],
         detail=False,
@@ -572,18 +871,8 @@ class SummaryViewSet(viewsets.ModelViewSet):
         url_name="evolution-graph",
     )
     def retrieve_evolution_summary_graph(self, request: Request) -> models.QuerySet:
-        def _get_evolution_summary() -> dict:
-            return epic_serializer.SummaryEvolutionSerializer(
-                Program.objects.all(),
-                many=True,
-                context={
-                    "request": request,
-                    "organizations": _filter_project_organizations_queryset(request),
-                },
-            ).data
-
         _file_sys_storage = FileSystemStorage()
-        _evolution_summary = _get_evolution_summary()
+        _evolution_summary = self._get_evolution_summary(request)
         _base_dir = Path(_file_sys_storage.base_location)
         _csv_evolution_summary = SummaryEvolutionCsvFile.from_serialized_data(
             _evolution_summary
@@ -591,7 +880,7 @@ class SummaryViewSet(viewsets.ModelViewSet):
         eram_wrapper = EramVisualsWrapper(
             input_file=_csv_evolution_summary,
             output_dir=_base_dir,
-            runner=EramVisualsRunner,
+            runner=get_eram_visuals_runner(),
         )
         eram_wrapper.execute()
         _root_url = f"http://{request.get_host()}"
@@ -619,3 +908,87 @@ class SummaryViewSet(viewsets.ModelViewSet):
             ),
             status=status.HTTP_417_EXPECTATION_FAILED,  # Expectation failed.
         )
+
+    def _get_evolution_graph_job_data(
+        self, request: Request, graph_job: EvolutionGraphJob
+    ) -> dict:
+        _job_data = dict(
+            job_id=str(graph_job.id),
+            status=graph_job.status,
+            job_url=request.build_absolute_uri(
+                reverse("summary-evolution-graph-job-detail", args=[graph_job.id])
+            ),
+            summary_data=graph_job.summary_data,
+        )
+        if graph_job.status == JobStatusType.SUCCEEDED:
+            _file_sys_storage = FileSystemStorage()
+            _output = EramVisualsOutput(Path(graph_job.media_dir))
+            _root_url = f"http://{request.get_host()}"
+            _job_data["summary_graph"] = _root_url + _file_sys_storage.url(
+                _output.png_output.as_posix()
+            )
+            _job_data["summary_pdf"] = _root_url + _file_sys_storage.url(
+                _output.pdf_output.as_posix()
+            )
+        elif graph_job.status == JobStatusType.FAILED:
+            _job_data["reason"] = graph_job.reason
+        return _job_data
+
+    @action(
+        methods=["POST"],
+        detail=False,
+        url_path="evolution-graph-job",
+        url_name="evolution-graph-job",
+    )
+    def create_evolution_summary_graph_job(self, request: Request) -> Response:
+        """
+        Queues the generation of the evolution graph and returns right away with the
+        summary data and the job id to poll for the graph and pdf urls.
+
+        Args:
+            request (Request): Request from the client.
+
+        Returns:
+            Response: Job data with status code 202.
+        """
+        EvolutionGraphJob.clean_up()
+        graph_job = EvolutionGraphJob.objects.create(
+            requested_by=request.user,
+            summary_data=self._get_evolution_summary(request),
+        )
+        _csv_evolution_summary = SummaryEvolutionCsvFile.from_serialized_data(
+            graph_job.summary_data
+        ).export(graph_job.output_dir)
+        submit_background_job(graph_job.run, _csv_evolution_summary)
+        return Response(
+            self._get_evolution_graph_job_data(request, graph_job),
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    @action(
+        methods=["GET"],
+        detail=False,
+        url_path=r"evolution-graph-job/(?P<job_id>[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})",
+        url_name="evolution-graph-job-detail",
+    )
+    def retrieve_evolution_summary_graph_job(
+        self, request: Request, job_id: str = None
+    ) -> Response:
+        """
+        Retrieves the status of an evolution graph job, including the graph and pdf
+        urls once it has succeeded. Only the user who requested it (or an admin) can
+        retrieve it.
+
+        Args:
+            request (Request): Request from the client.
+            job_id (str, optional): `EvolutionGraphJob` id. Defaults to None.
+
+        Returns:
+            Response: Job data.
+        """
+        EvolutionGraphJob.clean_up()
+        _jobs = EvolutionGraphJob.objects.all()
+        if not (request.user.is_staff or request.user.is_superuser):
+            _jobs = _jobs.filter(requested_by=request.user)
+        graph_job = get_object_or_404(_jobs, id=job_id)
+        return Response(self._get_evolution_graph_job_data(request, graph_job))
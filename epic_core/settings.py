@@ -169,7 +169,29 @@ STATIC_URL = "static/"
 
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 MEDIA_URL = "media/"
+# Files uploaded to be imported in the background, kept out of the (served) media root.
+IMPORT_JOBS_DIR = os.path.join(BASE_DIR, "import_jobs")
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.0/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# region ERAM Visuals
+# `ExternalRunner` used to render the evolution graph. Available runners:
+#   - "epic_app.externals.ERAMVisuals.eram_visuals_wrapper.EramVisualsRunner" (Rscript per request)
+#   - "epic_app.externals.ERAMVisuals.eram_visuals_pool.EramVisualsPoolRunner" (warm R workers)
+#   - "epic_app.externals.ERAMVisuals.eram_visuals_reportlab.EramVisualsReportlabRunner" (no R required)
+ERAM_VISUALS_RUNNER = (
+    "epic_app.externals.ERAMVisuals.eram_visuals_wrapper.EramVisualsRunner"
+)
+# Number of warm R processes kept alive by the `EramVisualsPoolRunner`.
+ERAM_VISUALS_WORKERS = 2
+# Seconds an R process is given to render the visuals before being killed.
+ERAM_VISUALS_TIMEOUT = 120
+# Threads running background jobs (e.g. evolution graph jobs) within the service.
+BACKGROUND_JOBS_WORKERS = 2
+# Seconds an evolution graph job (and its output) is kept before being removed.
+EVOLUTION_GRAPH_JOBS_RETENTION = 24 * 60 * 60
+# Seconds after which an unfinished evolution graph job (e.g. interrupted by a restart) is marked as failed.
+EVOLUTION_GRAPH_JOBS_STALE_AFTER = 10 * 60
+# endregion
@@ -19,4 +19,6 @@ echo "Generating database structure and dropping previous entries / tables."
 poetry run python3 manage.py epic_setup $2
 echo "Re-generate static files."
 poetry run python3 manage.py collectstatic --noinput
+echo "Installing and verifying the R packages for the ERAM visuals."
+poetry run python3 manage.py install_eram_packages
 poetry run gunicorn epic_core.wsgi &
\ No newline at end of file
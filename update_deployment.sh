@@ -6,4 +6,5 @@ poetry install
 poetry run python3 manage.py makemigrations
 poetry run python3 manage.py migrate
 poetry run python3 manage.py collectstatic --noinput
+poetry run python3 manage.py install_eram_packages
 poetry run gunicorn epic_core.wsgi &
\ No newline at end of file